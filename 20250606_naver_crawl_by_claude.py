@@ -8,6 +8,11 @@ from datetime import datetime, timedelta
 import csv
 import time
 import re
+from retry_util import RetryPolicy, DeadLetterQueue
+
+
+# 더보기 페이지 요청 재시도 (지터 포함 지수 백오프)
+EXPANSION_RETRY = RetryPolicy(max_attempts=3, base_delay=2, max_delay=30)
 
 
 def debug_page_elements(driver, wait_time=3):
@@ -400,7 +405,19 @@ def crawl_expansion_page(driver, expansion_link, main_title, main_original_url,
 
         while start_page <= max_pages * 10:
             paginated_url = f"{expansion_link}&start={start_page}"
-            driver.get(paginated_url)
+            try:
+                EXPANSION_RETRY.call(driver.get, paginated_url,
+                                     description=f"더보기 페이지 {start_page // 10 + 1}")
+            except Exception as e:
+                # 재시도해도 실패한 페이지는 나중에 재처리할 수 있도록 데드 레터에 기록
+                DeadLetterQueue().add("expansion_page", {
+                    "expansion_link": expansion_link,
+                    "start": start_page,
+                    "related_to": main_title,
+                    "related_original_url": main_original_url,
+                }, e, EXPANSION_RETRY.max_attempts)
+                print(f"        ❌ 확장 페이지 요청 실패: {e}")
+                break
             time.sleep(2)
 
             # 확장 페이지의 뉴스 컨테이너 찾기
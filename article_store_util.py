@@ -0,0 +1,226 @@
+import csv
+import glob
+import os
+import re
+import sqlite3
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from search_index_util import ensure_search_index
+
+
+NAVER_ARTICLE_PATTERN = re.compile(r"/article/(\d+)/(\d+)")
+NSO_RANGE_PATTERN = re.compile(r"from(\d{8})to(\d{8})")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS search_pages (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    keyword TEXT,
+    office_category TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    start_num INTEGER,
+    fetched_at TEXT
+);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    article_key TEXT NOT NULL UNIQUE,  -- 'oid/aid' 또는 (네이버 링크가 없으면) 원본 URL
+    oid TEXT,
+    aid TEXT,
+    title TEXT NOT NULL,
+    naver_url TEXT,
+    original_url TEXT,
+    canonical_url TEXT,
+    source_id INTEGER REFERENCES sources (id),
+    published TEXT,
+    published_at TEXT,
+    image_url TEXT,
+    first_seen_at TEXT,
+    last_seen_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_oid_aid ON articles (oid, aid);
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles (published_at);
+CREATE TABLE IF NOT EXISTS article_hits (
+    article_id INTEGER NOT NULL REFERENCES articles (id),
+    keyword TEXT NOT NULL,
+    page_id INTEGER NOT NULL REFERENCES search_pages (id),
+    PRIMARY KEY (article_id, keyword, page_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_article_hits_keyword ON article_hits (keyword, article_id);
+"""
+
+
+def parse_naver_ids(naver_url):
+    """네이버 뉴스 URL에서 (oid, aid)를 추출하는 함수"""
+    match = NAVER_ARTICLE_PATTERN.search(naver_url or "")
+    return (match.group(1), match.group(2)) if match else (None, None)
+
+
+def article_key_of(result):
+    """기사 고유 키 (oid/aid 우선, 없으면 원본 URL)"""
+    oid, aid = parse_naver_ids(result.get("naver_url"))
+    if oid:
+        return f"{oid}/{aid}"
+    return result.get("canonical_url") or result.get("original_url") or None
+
+
+def parse_search_url(url):
+    """검색 URL에서 keyword, office_category, 날짜 구간, start 값을 추출하는 함수"""
+    params = {key: values[0] for key, values in parse_qs(urlsplit(url or "").query).items()}
+    match = NSO_RANGE_PATTERN.search(params.get("nso", ""))
+    start = params.get("start", "1")
+    return {
+        "keyword": params.get("query", ""),
+        "office_category": params.get("office_category", ""),
+        "start_date": match.group(1) if match else None,
+        "end_date": match.group(2) if match else None,
+        "start_num": int(start) if start.isdigit() else None,
+    }
+
+
+class ArticleStore:
+    """기사/언론사/검색 페이지/키워드 매핑을 정규화해 저장하는 SQLite 저장소
+
+    같은 기사가 여러 키워드·카테고리 결과에 나와도 articles에는 한 번만 저장되고,
+    어떤 키워드의 어떤 검색 페이지에서 나왔는지는 article_hits에 기록된다.
+    search_index=True면 제목/본문 전문 검색 인덱스(search_index_util)도 트리거로 함께 갱신된다.
+    """
+
+    def __init__(self, path="results/articles.sqlite", batch_size=1000, search_index=True):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        if search_index:
+            ensure_search_index(self.conn)
+        self.source_ids = {}
+        self.page_ids = {}
+
+    def _source_id(self, name):
+        if not name:
+            return None
+        if name not in self.source_ids:
+            self.conn.execute("INSERT OR IGNORE INTO sources (name) VALUES (?)", (name,))
+            (self.source_ids[name],) = self.conn.execute(
+                "SELECT id FROM sources WHERE name = ?", (name,)).fetchone()
+        return self.source_ids[name]
+
+    def _page_id(self, url, fetched_at):
+        if url not in self.page_ids:
+            info = parse_search_url(url)
+            (self.page_ids[url],) = self.conn.execute(
+                "INSERT INTO search_pages (url, keyword, office_category, start_date, end_date, start_num, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET fetched_at = MAX(COALESCE(search_pages.fetched_at, ''), excluded.fetched_at) "
+                "RETURNING id",
+                (url, info["keyword"], info["office_category"], info["start_date"], info["end_date"],
+                 info["start_num"], fetched_at),
+            ).fetchone()
+        return self.page_ids[url]
+
+    def _upsert_article(self, result, key):
+        oid, aid = parse_naver_ids(result.get("naver_url"))
+        scraped_at = result.get("scraped_at") or ""
+        (article_id,) = self.conn.execute(
+            "INSERT INTO articles (article_key, oid, aid, title, naver_url, original_url, canonical_url, "
+            "source_id, published, published_at, image_url, first_seen_at, last_seen_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(article_key) DO UPDATE SET "
+            "title = excluded.title, "
+            "original_url = COALESCE(NULLIF(excluded.original_url, ''), articles.original_url), "
+            "canonical_url = COALESCE(NULLIF(excluded.canonical_url, ''), articles.canonical_url), "
+            "source_id = COALESCE(excluded.source_id, articles.source_id), "
+            "published_at = COALESCE(NULLIF(articles.published_at, ''), excluded.published_at), "
+            "image_url = COALESCE(NULLIF(excluded.image_url, ''), articles.image_url), "
+            "last_seen_at = MAX(articles.last_seen_at, excluded.last_seen_at) "
+            "RETURNING id",
+            (key, oid, aid, result.get("title", ""), result.get("naver_url", ""),
+             result.get("original_url", ""), result.get("canonical_url", ""),
+             self._source_id(result.get("source")), result.get("published", ""),
+             result.get("published_at", ""), result.get("image_url", ""), scraped_at, scraped_at),
+        ).fetchone()
+        return article_id
+
+    def write_results(self, results):
+        """결과들을 batch_size 단위 트랜잭션으로 upsert하는 메서드 (저장 건수 반환)"""
+        written = 0
+        for i in range(0, len(results), self.batch_size):
+            with self.conn:
+                for result in results[i:i + self.batch_size]:
+                    key = article_key_of(result)
+                    if not key:
+                        continue
+                    article_id = self._upsert_article(result, key)
+
+                    scraped_url = result.get("scraped_url")
+                    if scraped_url:
+                        page_id = self._page_id(scraped_url, result.get("scraped_at"))
+                        keyword = parse_search_url(scraped_url)["keyword"]
+                        self.conn.execute(
+                            "INSERT OR IGNORE INTO article_hits (article_id, keyword, page_id) VALUES (?, ?, ?)",
+                            (article_id, keyword, page_id),
+                        )
+                    written += 1
+        return written
+
+    def write_bodies(self, bodies, fetched_at=None):
+        """{기사 키: 본문} 을 저장하는 메서드 (저장 건수 반환, 저장소에 없는 기사는 건너뜀)"""
+        fetched_at = fetched_at or time.strftime("%Y-%m-%d %H:%M:%S")
+        written = 0
+        with self.conn:
+            for key, body in bodies.items():
+                row = self.conn.execute("SELECT id FROM articles WHERE article_key = ?", (key,)).fetchone()
+                if not row or not body:
+                    continue
+                self.conn.execute(
+                    "INSERT INTO article_bodies (article_id, body, fetched_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(article_id) DO UPDATE SET body = excluded.body, fetched_at = excluded.fetched_at",
+                    (row[0], body, fetched_at),
+                )
+                written += 1
+        return written
+
+    def has_article(self, oid, aid):
+        """(oid, aid) 기사가 이미 저장되어 있는지 인덱스로 확인하는 메서드"""
+        return self.conn.execute(
+            "SELECT 1 FROM articles WHERE oid = ? AND aid = ? LIMIT 1", (oid, aid)).fetchone() is not None
+
+    def import_csv(self, filepath):
+        """기존 결과 CSV를 저장소로 가져오는 메서드
+
+        published_at 컬럼이 없는 예전 CSV는 가져오면서 변환한다 (발행일 구간 검색에 필요).
+        """
+        with open(filepath, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+        if rows and "published_at" not in rows[0]:
+            import published_util  # pandas는 필요할 때만 불러옴
+            published_util.add_published_at(rows)
+        return self.write_results(rows)
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    # 사용법: python article_store_util.py "results/*.csv"
+    store = ArticleStore()
+    start_time = time.time()
+    total = 0
+    for pattern in sys.argv[1:] or ["results/*.csv"]:
+        for filepath in sorted(glob.glob(pattern)):
+            count = store.import_csv(filepath)
+            total += count
+            print(f"📥 {os.path.basename(filepath)}: {count}건")
+
+    (article_count,) = store.conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+    print(f"✅ 입력 {total}건 → 고유 기사 {article_count}건 ({time.time() - start_time:.1f}초)")
+    store.close()
@@ -0,0 +1,124 @@
+import sys
+import time
+from datetime import datetime
+from functools import lru_cache
+
+
+class SearchPage:
+    """검색 결과 페이지 참조 (같은 페이지의 카드들이 하나를 공유)"""
+
+    __slots__ = ("url",)
+
+    def __init__(self, url):
+        self.url = url
+
+    def __repr__(self):
+        return f"SearchPage({self.url!r})"
+
+
+@lru_cache(maxsize=4096)
+def format_epoch(epoch):
+    """epoch 초를 CSV에 쓰던 'YYYY-MM-DD HH:MM:SS' 문자열로 변환하는 함수"""
+    return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class Article:
+    """크롤링한 기사 한 건을 담는 가벼운 레코드
+
+    - 언론사명은 sys.intern으로 같은 문자열 객체를 공유
+    - scraped_url 대신 SearchPage 참조를 저장
+    - scraped_at은 정수 epoch로 저장하고 읽을 때 문자열로 변환
+    - save_results 등이 추가하는 컬럼(id, published_at 등)은 extra에 보관
+
+    기존 결과 딕셔너리와 같은 키로 읽고 쓸 수 있어서 csv.DictWriter,
+    save_results 등 기존 코드에 그대로 넘길 수 있다.
+    """
+
+    __slots__ = ("title", "naver_url", "original_url", "source", "published",
+                 "image_url", "scraped_at_epoch", "page", "extra")
+
+    FIELDS = ("title", "naver_url", "original_url", "source", "published",
+              "image_url", "scraped_at", "scraped_url")
+
+    def __init__(self, title, naver_url, original_url, source, published, image_url,
+                 page, scraped_at_epoch=None):
+        self.title = title
+        self.naver_url = naver_url
+        self.original_url = original_url
+        self.source = sys.intern(source) if source else ""
+        self.published = published
+        self.image_url = image_url
+        self.page = page
+        self.scraped_at_epoch = int(time.time()) if scraped_at_epoch is None else scraped_at_epoch
+        self.extra = None
+
+    # --- 딕셔너리 호환 ---
+
+    def __getitem__(self, key):
+        if key == "scraped_at":
+            return format_epoch(self.scraped_at_epoch)
+        if key == "scraped_url":
+            return self.page.url
+        if key in self.FIELDS:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == "scraped_url":
+            self.page = SearchPage(value)
+        elif key == "scraped_at":
+            self.scraped_at_epoch = int(datetime.strptime(value, "%Y-%m-%d %H:%M:%S").timestamp())
+        elif key == "source":
+            self.source = sys.intern(value) if value else ""
+        elif key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        return key in self.FIELDS or (self.extra is not None and key in self.extra)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        # csv.DictWriter가 keys() - fieldnames 연산을 하므로 dict 키 뷰로 반환
+        if self.extra:
+            return dict.fromkeys(self.FIELDS + tuple(self.extra)).keys()
+        return dict.fromkeys(self.FIELDS).keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def to_dict(self):
+        return {key: self[key] for key in self.keys()}
+
+    @classmethod
+    def from_dict(cls, data, page=None):
+        """CSV/JSON에서 읽은 딕셔너리를 Article로 변환하는 메서드"""
+        article = cls(
+            title=data.get("title", ""),
+            naver_url=data.get("naver_url", ""),
+            original_url=data.get("original_url", ""),
+            source=data.get("source", ""),
+            published=data.get("published", ""),
+            image_url=data.get("image_url", ""),
+            page=page or SearchPage(data.get("scraped_url", "")),
+            scraped_at_epoch=0,
+        )
+        if data.get("scraped_at"):
+            article["scraped_at"] = data["scraped_at"]
+        for key, value in data.items():
+            if key not in cls.FIELDS:
+                article[key] = value
+        return article
+
+    def __repr__(self):
+        return f"Article({self.title[:30]!r}, {self.source!r}, {self.published!r})"
@@ -0,0 +1,245 @@
+"""핫 패스 마이크로 벤치마크
+
+asv 방식으로 커밋별 결과를 benchmarks/results/<머신>/<커밋>.json 에 저장하고,
+같은 머신의 직전 결과와 비교해 느려진 항목을 표시한다.
+
+    python benchmarks/run_benchmarks.py                      # 전체 실행 + 저장 + 비교
+    python benchmarks/run_benchmarks.py --sizes 10000        # save_results 행 수 지정
+    python benchmarks/run_benchmarks.py --filter extract_    # 이름에 포함된 항목만
+    python benchmarks/run_benchmarks.py --baseline abc1234   # 특정 커밋 결과와 비교
+
+대상:
+    - extract_factor_util 함수들 (benchmarks/data 의 저장된 카드 HTML 기준)
+    - ImprovedRateLimiter.wait_if_needed 기록 처리 (가상 시계, 실제 대기 없음)
+    - save_results 중복 제거 + CSV 쓰기 (1만/10만/100만 행)
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import extract_factor_util as extract_util  # noqa: E402
+from crawl_util import save_results  # noqa: E402
+from html_card_util import parse_page_html  # noqa: E402
+from rate_limiter_util import ImprovedRateLimiter  # noqa: E402
+
+DATA_DIR = os.path.join(ROOT, "benchmarks", "data")
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+REGRESSION_THRESHOLD = 1.2  # 20% 이상 느려지면 회귀로 표시
+
+# 벤치마크 중에는 로그 출력 비용만 남기고 실제 출력은 버림
+NULL_LOGGER = logging.getLogger("naver_crawler.benchmark")
+NULL_LOGGER.addHandler(logging.NullHandler())
+NULL_LOGGER.propagate = False
+
+BENCHMARKS = []
+
+
+def benchmark(name, number=None, repeat=5):
+    """벤치마크 등록 데코레이터 (setup 함수가 측정할 callable을 반환)"""
+    def decorator(setup):
+        BENCHMARKS.append((name, setup, number, repeat))
+        return setup
+    return decorator
+
+
+def load_fixture(filename):
+    with open(os.path.join(DATA_DIR, filename), encoding="utf-8") as f:
+        return f.read()
+
+
+# --- extract_factor_util ---
+
+def _register_extractor_benchmarks():
+    page = parse_page_html(load_fixture("results_page.html"))
+    card = parse_page_html(load_fixture("card.html")).find_elements("css selector", "div")[0]
+
+    benchmark("extract_find_elements_intelligently")(
+        lambda: lambda: extract_util.find_elements_intelligently(page))
+
+    for func in (extract_util.extract_title_intelligently, extract_util.extract_naver_url,
+                 extract_util.extract_original_url, extract_util.extract_press,
+                 extract_util.extract_published, extract_util.extract_img_url):
+        benchmark(func.__name__)(lambda func=func: lambda: func(card))
+
+
+# --- ImprovedRateLimiter ---
+
+class VirtualClock:
+    """sleep 하면 시간만 앞으로 가는 가상 시계"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        self.now += 0.001  # 호출 사이 1ms 경과
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _register_rate_limiter_benchmarks():
+    for max_requests, calls in ((10, 10_000), (1_000, 10_000)):
+        def setup(max_requests=max_requests, calls=calls):
+            def run():
+                clock = VirtualClock()
+                limiter = ImprovedRateLimiter(max_requests=max_requests, time_window=60, min_delay=0,
+                                              logger=NULL_LOGGER, clock=clock.time, sleep=clock.sleep)
+                for _ in range(calls):
+                    limiter.wait_if_needed()
+            return run
+        benchmark(f"rate_limiter_wait_if_needed_{max_requests}x{calls}", number=1, repeat=3)(setup)
+
+
+# --- save_results ---
+
+def make_rows(count, duplicate_ratio=0.05):
+    """save_results 입력용 가상 결과 행 생성 함수"""
+    unique = max(1, int(count * (1 - duplicate_ratio)))
+    rows = []
+    for i in range(count):
+        aid = i % unique
+        rows.append({
+            "title": f"저출생 대책 관련 기사 {aid}",
+            "naver_url": f"https://n.news.naver.com/mnews/article/001/{aid:010d}?sid=102",
+            "original_url": f"https://news.example.com/{aid}",
+            "source": "연합뉴스",
+            "published": "2024.06.05." if i % 3 else "3시간 전",
+            "image_url": "",
+            "scraped_at": "2025-06-10 23:05:03",
+            "scraped_url": "https://search.naver.com/search.naver?where=news&query=%22a%22&start=1",
+        })
+    return rows
+
+
+def _register_save_results_benchmarks(sizes):
+    for size in sizes:
+        def setup(size=size):
+            output_directory = tempfile.mkdtemp(prefix="bench_save_results_")
+            template = make_rows(size)
+
+            def run():
+                # save_results가 행 딕셔너리를 수정하므로 매번 복사본 사용
+                rows = [dict(row) for row in template]
+                save_results("bench.csv", rows, NULL_LOGGER, cluster_index_path=None,
+                             output_directory=output_directory, store_path=None)
+            run.cleanup = lambda: shutil.rmtree(output_directory, ignore_errors=True)
+            return run
+        benchmark(f"save_results_{size}", number=1, repeat=3 if size < 1_000_000 else 1)(setup)
+
+
+def run_benchmark(setup, number, repeat):
+    """최소 실행 시간(초/회)을 측정하는 함수"""
+    func = setup()
+    try:
+        timer = timeit.Timer(func)
+        if number is None:
+            number, _ = timer.autorange()
+        timings = timer.repeat(repeat=repeat, number=number)
+    finally:
+        cleanup = getattr(func, "cleanup", None)
+        if cleanup:
+            cleanup()
+    return min(timings) / number
+
+
+def current_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def load_baseline(machine_dir, commit, baseline=None):
+    """비교 대상 결과 (지정 커밋 또는 같은 머신의 직전 결과)"""
+    if baseline:
+        path = os.path.join(machine_dir, f"{baseline}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    previous = []
+    for path in glob.glob(os.path.join(machine_dir, "*.json")):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("commit") != commit:
+            previous.append(data)
+    return max(previous, key=lambda d: d["date"]) if previous else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 패스 마이크로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="save_results 벤치마크 행 수")
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--baseline", help="비교할 커밋 (기본: 같은 머신의 직전 결과)")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--no-save", action="store_true", help="결과 파일을 저장하지 않음")
+    args = parser.parse_args()
+
+    _register_extractor_benchmarks()
+    _register_rate_limiter_benchmarks()
+    _register_save_results_benchmarks(args.sizes)
+
+    commit = current_commit()
+    machine = platform.node() or "local"
+    machine_dir = os.path.join(RESULTS_DIR, machine)
+    baseline = load_baseline(machine_dir, commit, args.baseline)
+
+    results = {}
+    regressions = []
+    print(f"🏁 벤치마크 시작 (커밋 {commit}, 머신 {machine})")
+    if baseline:
+        print(f"   비교 대상: {baseline['commit']} ({baseline['date']})")
+
+    for name, setup, number, repeat in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        seconds = run_benchmark(setup, number, repeat)
+        results[name] = seconds
+
+        line = f"  {name:<50} {seconds * 1000:>12.3f} ms"
+        previous = baseline["results"].get(name) if baseline else None
+        if previous:
+            ratio = seconds / previous
+            line += f"   x{ratio:.2f}"
+            if ratio >= args.threshold:
+                line += "  ⚠️ 회귀"
+                regressions.append(name)
+        print(line)
+
+    if not args.no_save:
+        os.makedirs(machine_dir, exist_ok=True)
+        path = os.path.join(machine_dir, f"{commit}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "commit": commit,
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "results": results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {os.path.relpath(path, ROOT)}")
+
+    if regressions:
+        print(f"⚠️ 회귀 {len(regressions)}건: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import base64
+import json
+import logging
+import time
+
+from html_card_util import parse_page_html
+from page_guard_util import PageLoadError
+
+
+# 카드 필드는 문서 HTML에 이미 들어 있으므로 이미지/폰트/미디어는 받지 않음
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+]
+
+
+class CdpCaptureDriver:
+    """DOM 대신 Chrome DevTools Protocol 네트워크 이벤트로 검색 결과 HTML을 받는 드라이버
+
+    get(url)마다 성능 로그에서 최상위 프레임 문서의 Network.responseReceived /
+    Network.loadingFinished를 찾고, Network.getResponseBody로 받은 원본 HTML을 html_card_util로
+    파싱한다. 렌더링을 기다리거나 WebElement를 하나씩 조회하지 않으므로 HttpDriver처럼
+    crawl_search_page에 그대로 넘길 수 있다 (get / page_source / find_element(s) / quit).
+    문서 응답을 찾지 못하면 렌더링된 DOM(page_source)으로 대신한다.
+    """
+
+    # 응답 본문을 받으면 바로 파싱 (렌더링 대기 없음)
+    page_load_wait = 0
+
+    def __init__(self, driver=None, block_resources=True, response_timeout=15, logger=None,
+                 clock=time.time, sleep=time.sleep):
+        if driver is None:
+            from crawl_util import create_driver
+            # DOMContentLoaded까지만 기다리면 충분 (본문은 네트워크 이벤트로 받음)
+            driver = create_driver(performance_log=True, page_load_strategy="eager")
+        self.driver = driver
+        self.response_timeout = response_timeout
+        self.logger = logger or logging.getLogger('naver_crawler')
+        self.clock = clock
+        self.sleep = sleep
+        self.page_source = ""
+        self.current_url = None
+        self.stats = {"captured": 0, "dom_fallback": 0}
+        self._root = parse_page_html("")
+
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        if block_resources:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        self.main_frame_id = self.driver.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]["frame"]["id"]
+
+    def _drain_events(self):
+        """쌓인 성능 로그를 읽어 CDP 이벤트(method, params) 리스트로 반환하는 메서드"""
+        events = []
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            events.append((message.get("method"), message.get("params", {})))
+        return events
+
+    def _wait_for_document(self):
+        """최상위 문서 응답의 (requestId, 상태 코드)를 기다리는 메서드 (없으면 (None, None))"""
+        request_id = status = None
+        deadline = self.clock() + self.response_timeout
+        while True:
+            for method, params in self._drain_events():
+                if (method == "Network.responseReceived" and request_id is None
+                        and params.get("type") == "Document" and params.get("frameId") == self.main_frame_id):
+                    request_id = params["requestId"]
+                    status = params["response"].get("status")
+                elif params.get("requestId") == request_id and request_id is not None:
+                    if method == "Network.loadingFinished":
+                        return request_id, status
+                    if method == "Network.loadingFailed":
+                        raise PageLoadError(f"문서 로딩 실패: {params.get('errorText')} ({self.current_url})")
+            if self.clock() >= deadline:
+                return None, None
+            self.sleep(0.05)
+
+    def get(self, url):
+        self._drain_events()  # 이전 페이지의 이벤트 버리기
+        self.current_url = url
+        self.driver.get(url)
+
+        request_id, status = self._wait_for_document()
+        if request_id is None:
+            self.logger.warning(f"⚠️ 문서 응답을 찾지 못해 DOM 사용: {url}")
+            self.stats["dom_fallback"] += 1
+            self.page_source = self.driver.page_source
+        else:
+            if status and status >= 400:
+                raise PageLoadError(f"HTTP {status}: {url}")
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            if body.get("base64Encoded"):
+                self.page_source = base64.b64decode(body["body"]).decode("utf-8", errors="replace")
+            else:
+                self.page_source = body["body"]
+            self.stats["captured"] += 1
+        self._root = parse_page_html(self.page_source)
+
+    def find_element(self, by, value):
+        return self._root.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self._root.find_elements(by, value)
+
+    def quit(self):
+        self.driver.quit()
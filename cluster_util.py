@@ -0,0 +1,192 @@
+import os
+import pickle
+import re
+import sqlite3
+import zlib
+
+import numpy as np
+
+
+# MinHash 파라미터 (밴드 16개 x 행 4개 → 자카드 유사도 약 0.5 이상이면 같은 후보)
+NUM_PERM = 64
+NUM_BANDS = 16
+SHINGLE_SIZE = 3
+SEED = 20250610
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# [단독], (종합), <속보> 같은 말머리와 공백/기호 제거용
+_TAG_PATTERN = re.compile(r"\[[^\]]*\]|\([^)]*\)|<[^>]*>|【[^】]*】")
+_NON_WORD_PATTERN = re.compile(r"[^0-9A-Za-z가-힣\u4e00-\u9fff]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS clusters (
+    cluster_id INTEGER PRIMARY KEY AUTOINCREMENT
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    hash INTEGER NOT NULL,
+    cluster_id INTEGER NOT NULL,
+    PRIMARY KEY (band, hash)
+) WITHOUT ROWID;
+"""
+
+
+def normalize_title(title):
+    """말머리, 공백, 기호를 제거해 비교용 제목을 만드는 함수"""
+    title = _TAG_PATTERN.sub(" ", title or "")
+    return _NON_WORD_PATTERN.sub("", title).lower()
+
+
+def title_shingles(title, size=SHINGLE_SIZE):
+    """정규화된 제목의 문자 n-gram 해시 배열을 반환하는 함수"""
+    text = normalize_title(title)
+    if len(text) <= size:
+        grams = {text} if text else set()
+    else:
+        grams = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams),
+                       dtype=np.uint64, count=len(grams))
+
+
+class MinHashLSH:
+    """문자 n-gram MinHash + LSH 밴딩으로 유사 제목을 묶는 클래스
+
+    밴드 버킷은 SQLite 테이블 (band, hash) -> cluster_id 에 두고 INSERT OR IGNORE로만 추가하므로,
+    실행마다 전체 인덱스를 읽고 다시 쓰지 않고 여러 프로세스가 함께 써도 기존 버킷을 덮어쓰지 않는다.
+    """
+
+    def __init__(self, path=":memory:", num_perm=NUM_PERM, num_bands=NUM_BANDS, seed=SEED):
+        if num_perm % num_bands != 0:
+            raise ValueError("num_perm은 num_bands로 나누어 떨어져야 합니다")
+
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows_per_band = num_perm // num_bands
+
+        # 고정 시드로 순열 계수 생성 (실행 간 시그니처가 같아야 증분 처리가 가능)
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+        directory = os.path.dirname(path) if path != ":memory:" else ""
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 트랜잭션은 assign_many에서 BEGIN IMMEDIATE로 직접 관리
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('num_perm', ?), ('num_bands', ?)",
+                          (num_perm, num_bands))
+        stored = dict(self.conn.execute("SELECT key, value FROM meta").fetchall())
+        if (stored["num_perm"], stored["num_bands"]) != (num_perm, num_bands):
+            raise ValueError(f"인덱스 파라미터 불일치: {path} (num_perm={stored['num_perm']}, "
+                             f"num_bands={stored['num_bands']})")
+
+    def close(self):
+        self.conn.close()
+
+    def signature(self, title):
+        """제목의 MinHash 시그니처를 계산하는 메서드"""
+        shingles = title_shingles(title)
+        if shingles.size == 0:
+            return None
+        # (a * x + b) mod p 를 모든 순열에 대해 한 번에 계산
+        hashed = (np.outer(shingles, self.a) + self.b) % _MERSENNE_PRIME & _MAX_HASH
+        return hashed.min(axis=0)
+
+    def band_keys(self, signature):
+        """시그니처를 밴드별 버킷 키로 변환하는 메서드"""
+        bands = signature.reshape(self.num_bands, self.rows_per_band)
+        return [(band_idx, zlib.crc32(band.tobytes())) for band_idx, band in enumerate(bands)]
+
+    def _new_cluster_id(self):
+        return self.conn.execute("INSERT INTO clusters DEFAULT VALUES").lastrowid
+
+    def _assign(self, title):
+        signature = self.signature(title)
+        if signature is None:
+            return self._new_cluster_id()
+
+        keys = self.band_keys(signature)
+
+        # 하나의 밴드라도 겹치면 같은 이야기로 간주 (앞 밴드 우선)
+        cluster_id = None
+        for key in keys:
+            row = self.conn.execute("SELECT cluster_id FROM bands WHERE band = ? AND hash = ?", key).fetchone()
+            if row is not None:
+                cluster_id = row[0]
+                break
+
+        if cluster_id is None:
+            cluster_id = self._new_cluster_id()
+
+        self.conn.executemany("INSERT OR IGNORE INTO bands (band, hash, cluster_id) VALUES (?, ?, ?)",
+                              [(band_idx, band_hash, cluster_id) for band_idx, band_hash in keys])
+        return cluster_id
+
+    def assign_many(self, titles):
+        """제목들에 story_cluster_id를 부여하는 메서드 (처음 보는 이야기면 새 ID)
+
+        한 트랜잭션(BEGIN IMMEDIATE)으로 처리해 동시에 실행된 다른 프로세스와 같은 이야기에 서로 다른 새 ID를 주지 않는다.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cluster_ids = [self._assign(title) for title in titles]
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        return cluster_ids
+
+    def assign(self, title):
+        """제목 하나에 story_cluster_id를 부여하는 메서드"""
+        return self.assign_many([title])[0]
+
+    def import_pickle(self, path):
+        """예전 pickle 인덱스의 버킷과 다음 ID를 가져오는 메서드 (가져온 버킷 수 반환)"""
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if (state["num_perm"], state["num_bands"]) != (self.num_perm, self.num_bands):
+            raise ValueError(f"인덱스 파라미터 불일치: {path}")
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany("INSERT OR IGNORE INTO bands (band, hash, cluster_id) VALUES (?, ?, ?)",
+                                  [(band_idx, band_hash, cluster_id)
+                                   for (band_idx, band_hash), cluster_id in state["buckets"].items()])
+            # 이후 새 ID가 예전 ID와 겹치지 않도록 AUTOINCREMENT 시퀀스를 맞춤
+            if state["next_cluster_id"] > 1:
+                self.conn.execute("INSERT OR IGNORE INTO clusters (cluster_id) VALUES (?)",
+                                  (state["next_cluster_id"] - 1,))
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        return len(state["buckets"])
+
+
+def assign_story_clusters(results, index_path, column="story_cluster_id"):
+    """결과 딕셔너리 리스트에 story_cluster_id를 채우는 함수
+
+    인덱스를 SQLite 파일로 유지하므로 이전 실행에서 본 이야기와도 같은 ID로 묶인다.
+    같은 이름의 예전 pickle 인덱스(.pkl)가 있으면 새 인덱스를 만들 때 한 번 가져온다.
+    """
+    legacy_path = os.path.splitext(index_path)[0] + ".pkl"
+    is_new = not os.path.exists(index_path)
+    index = MinHashLSH(index_path)
+    try:
+        if is_new and legacy_path != index_path and os.path.exists(legacy_path):
+            index.import_pickle(legacy_path)
+
+        cluster_ids = index.assign_many([result.get("title", "") for result in results])
+        for result, cluster_id in zip(results, cluster_ids):
+            result[column] = cluster_id
+    finally:
+        index.close()
+    return results
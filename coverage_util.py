@@ -0,0 +1,194 @@
+import argparse
+import csv
+import glob
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+
+from article_store_util import parse_search_url
+
+
+FILENAME_RANGE_PATTERN = re.compile(r"\((\d{8})to(\d{8})\)")
+
+DATE_FORMAT = "%Y%m%d"
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def iter_days(start_str, end_str):
+    day = datetime.strptime(start_str, DATE_FORMAT)
+    end = datetime.strptime(end_str, DATE_FORMAT)
+    while day <= end:
+        yield day.strftime(DATE_FORMAT)
+        day += timedelta(days=1)
+
+
+class CoverageIndex:
+    """(키워드, 카테고리, 날짜)별로 언제 끝까지 수집했는지 기록하는 인덱스
+
+    - 기존 결과 CSV(build_from_csv)와 새 실행(mark_window)으로 갱신
+    - 수집 시점에 아직 settle_days가 지나지 않았던 날짜는 기사가 더 올라올 수 있으므로,
+      그 수집이 recrawl_after_hours 보다 오래되면 '오래됨(stale)'으로 본다.
+    """
+
+    def __init__(self, path="state/coverage.sqlite", settle_days=3, recrawl_after_hours=24):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.settle_days = settle_days
+        self.recrawl_after_hours = recrawl_after_hours
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS coverage (
+                keyword TEXT NOT NULL,
+                office_category TEXT NOT NULL,
+                day TEXT NOT NULL,
+                crawled_at TEXT NOT NULL,
+                source TEXT,
+                PRIMARY KEY (keyword, office_category, day)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    def mark_days(self, keyword, office_category, days, crawled_at=None, source=""):
+        """날짜들을 수집 완료로 기록하는 메서드 (더 최근 수집 시각만 반영)"""
+        crawled_at = crawled_at or datetime.now().strftime(TIME_FORMAT)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO coverage (keyword, office_category, day, crawled_at, source) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(keyword, office_category, day) DO UPDATE SET "
+                "crawled_at = excluded.crawled_at, source = excluded.source "
+                "WHERE excluded.crawled_at > coverage.crawled_at",
+                [(keyword, str(office_category), day, crawled_at, source) for day in days],
+            )
+
+    def mark_window(self, keyword, office_category, start_str, end_str, crawled_at=None, source="run"):
+        """날짜 구간 하나를 마지막 페이지까지 수집했을 때 호출하는 메서드"""
+        self.mark_days(keyword, office_category, list(iter_days(start_str, end_str)), crawled_at, source)
+
+    def mark_windows(self, keyword, office_category, windows, crawled_at=None, source="run"):
+        """끝까지 수집한 구간들((시작, 끝) 리스트)을 결과 저장이 끝난 뒤 한 번에 기록하는 메서드"""
+        days = sorted({day for start_str, end_str in windows for day in iter_days(start_str, end_str)})
+        self.mark_days(keyword, office_category, days, crawled_at, source)
+
+    def build_from_csv(self, filepath):
+        """결과 CSV에서 수집 범위를 읽어 기록하는 메서드 (기록한 (키워드, 카테고리) 수 반환)
+
+        키워드/카테고리와 수집 구간은 scraped_url(nso 구간)에서 읽는다. 결과가 하나도 없던 구간이나
+        중간에 실패한 구간은 CSV에 나타나지 않으므로 파일명의 (시작to종료) 범위 전체를 완료로 보지 않고,
+        범위가 있으면 실제 구간들과 겹치는 날짜만 기록한다.
+        """
+        filename = os.path.basename(filepath)
+        match = FILENAME_RANGE_PATTERN.search(filename)
+
+        targets = {}  # (keyword, office_category) -> {구간}
+        crawled_at = ""
+        with open(filepath, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                info = parse_search_url(row.get("scraped_url"))
+                if not info["keyword"] or not info["start_date"]:
+                    continue
+                targets.setdefault((info["keyword"], info["office_category"]), set()).add(
+                    (info["start_date"], info["end_date"]))
+                crawled_at = max(crawled_at, row.get("scraped_at") or "")
+
+        if not targets:
+            return 0
+        crawled_at = crawled_at or datetime.fromtimestamp(os.path.getmtime(filepath)).strftime(TIME_FORMAT)
+
+        for (keyword, office_category), windows in targets.items():
+            days = sorted({day for start_str, end_str in windows for day in iter_days(start_str, end_str)})
+            if match:
+                days = [day for day in days if match.group(1) <= day <= match.group(2)]
+            self.mark_days(keyword, office_category, days, crawled_at, filename)
+        return len(targets)
+
+    def is_stale(self, day, crawled_at, now=None):
+        now = now or datetime.now()
+        crawled = datetime.strptime(crawled_at, TIME_FORMAT)
+        settled = crawled - datetime.strptime(day, DATE_FORMAT) >= timedelta(days=self.settle_days + 1)
+        return not settled and now - crawled >= timedelta(hours=self.recrawl_after_hours)
+
+    def missing_days(self, keyword, office_category, start_str, end_str, now=None):
+        """구간에서 수집 기록이 없거나 오래된 날짜들"""
+        covered = dict(self.conn.execute(
+            "SELECT day, crawled_at FROM coverage WHERE keyword = ? AND office_category = ? AND day BETWEEN ? AND ?",
+            (keyword, str(office_category), start_str, end_str),
+        ).fetchall())
+        return [day for day in iter_days(start_str, end_str)
+                if day not in covered or self.is_stale(day, covered[day], now)]
+
+    def plan_units(self, keyword, office_category, start_str, end_str, window_days=7, now=None):
+        """빠졌거나 오래된 날짜만 연속 구간으로 묶어 작업 단위로 반환하는 메서드
+
+        반환 형식은 SQLiteWorkQueue.enqueue에 그대로 넘길 수 있는 딕셔너리 리스트
+        """
+        units = []
+        run = []
+        for day in self.missing_days(keyword, office_category, start_str, end_str, now) + [None]:
+            contiguous = (run and day is not None
+                          and datetime.strptime(day, DATE_FORMAT) - datetime.strptime(run[-1], DATE_FORMAT) == timedelta(days=1))
+            if run and (not contiguous or len(run) == window_days):
+                units.append({
+                    "keyword": keyword,
+                    "office_category": str(office_category),
+                    "start_date": run[0],
+                    "end_date": run[-1],
+                    "page": 1,
+                })
+                run = []
+            if day is not None:
+                run.append(day)
+        return units
+
+    def summary(self):
+        return self.conn.execute(
+            "SELECT keyword, office_category, COUNT(*), MIN(day), MAX(day), MAX(crawled_at) FROM coverage "
+            "GROUP BY keyword, office_category ORDER BY keyword, office_category").fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수집 범위 인덱스와 누락 구간 계획")
+    parser.add_argument("action", choices=["build", "show", "plan"])
+    parser.add_argument("--index", default="state/coverage.sqlite")
+    parser.add_argument("--results", default="results/*.csv", help="build: 결과 CSV 패턴")
+    parser.add_argument("--keyword", help='plan: 검색 키워드 (예: \'"육아휴직"\')')
+    parser.add_argument("--office-category", nargs="+", default=["3"])
+    parser.add_argument("--start")
+    parser.add_argument("--end")
+    parser.add_argument("--window-days", type=int, default=7)
+    parser.add_argument("--enqueue", metavar="QUEUE_PATH", help="plan: 계획한 작업을 이 작업 큐에 등록")
+    args = parser.parse_args()
+
+    index = CoverageIndex(args.index)
+    try:
+        if args.action == "build":
+            for filepath in sorted(glob.glob(args.results)):
+                count = index.build_from_csv(filepath)
+                print(f"{'📥' if count else '⏭️'} {os.path.basename(filepath)}: {count}개 (키워드, 카테고리)")
+
+        elif args.action == "show":
+            for keyword, office_category, days, first_day, last_day, crawled_at in index.summary():
+                print(f"{keyword} [{office_category}] {first_day}~{last_day} 중 {days}일 수집 (최근 {crawled_at})")
+
+        else:
+            if not (args.keyword and args.start and args.end):
+                parser.error("plan에는 --keyword, --start, --end가 필요합니다")
+            units = []
+            for office_category in args.office_category:
+                units.extend(index.plan_units(args.keyword, office_category, args.start, args.end, args.window_days))
+            for unit in units:
+                print(f"🧭 {unit['keyword']} [{unit['office_category']}] {unit['start_date']}~{unit['end_date']}")
+            print(f"📊 누락/오래된 구간 {len(units)}개")
+
+            if args.enqueue and units:
+                from work_queue_util import SQLiteWorkQueue
+                queue = SQLiteWorkQueue(args.enqueue)
+                print(f"📥 작업 {queue.enqueue(units)}건 등록 ({args.enqueue})")
+                queue.close()
+    finally:
+        index.close()
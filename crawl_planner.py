@@ -0,0 +1,234 @@
+import argparse
+import csv
+import glob
+import math
+import os
+import sqlite3
+import time
+
+import extract_factor_util as extract_util
+from crawl_util import (
+    setup_logging, create_driver, iter_date_windows, build_search_url, format_duration,
+    DEFAULT_OFFICE_CATEGORY,
+)
+from rate_limiter_util import ImprovedRateLimiter
+from page_guard_util import classify_page, PageBlockedError, PAGE_BLOCKED
+
+
+# crawl_with_intelligent_detection 기준 페이지당 고정 대기 (로딩 후 3초 + 페이지 간 2초)
+PAGE_SLEEP_SECONDS = 5
+DEFAULT_ROW_BYTES = 650
+MAX_PROBE_PAGES = 40
+
+
+def average_row_bytes(results_glob="results/*.csv"):
+    """기존 결과 CSV의 행당 평균 크기 (없으면 기본값)"""
+    total_bytes = 0
+    total_rows = 0
+    for filepath in glob.glob(results_glob):
+        with open(filepath, encoding="utf-8-sig") as f:
+            rows = sum(1 for _ in f) - 1
+        if rows > 0:
+            total_bytes += os.path.getsize(filepath)
+            total_rows += rows
+    return total_bytes / total_rows if total_rows else DEFAULT_ROW_BYTES
+
+
+def cached_window_count(store_conn, keyword, office_category, start_str, end_str):
+    """기사 저장소에 같은 구간 수집 기록이 있으면 기사 수를 반환하는 함수"""
+    if store_conn is None:
+        return None
+    row = store_conn.execute(
+        "SELECT COUNT(DISTINCT h.article_id), COUNT(DISTINCT p.id) FROM search_pages p "
+        "LEFT JOIN article_hits h ON h.page_id = p.id "
+        "WHERE p.keyword = ? AND p.office_category = ? AND p.start_date = ? AND p.end_date = ?",
+        (keyword, office_category, start_str, end_str),
+    ).fetchone()
+    return row[0] if row and row[1] else None
+
+
+class PageProber:
+    """페이지의 카드 수만 세는 가벼운 탐색기 (추출 없음)"""
+
+    def __init__(self, driver, rate_limiter, logger):
+        self.driver = driver
+        self.rate_limiter = rate_limiter
+        self.logger = logger
+        self.latencies = []
+
+    def count_cards(self, url):
+        self.rate_limiter.wait_if_needed("계획")
+        started = time.time()
+        self.driver.get(url)
+        time.sleep(1)
+        cards = extract_util.find_elements_intelligently(self.driver)
+        self.latencies.append(time.time() - started)
+        if not cards and classify_page(self.driver.page_source, 0) == PAGE_BLOCKED:
+            raise PageBlockedError(f"계획 탐색 중 차단 화면: {url}")
+        return len(cards)
+
+    def estimate_window(self, keyword, office_category, start_str, end_str, max_probes=4):
+        """첫 페이지 + 이진 탐색 몇 번으로 구간의 결과 수를 추정하는 메서드"""
+        cards = self.count_cards(build_search_url(keyword, start_str, end_str, 1, office_category))
+        if cards < 8:
+            return cards, True
+
+        low, high = 1, MAX_PROBE_PAGES + 1  # low: 결과 있음, high: 결과 없음(가정)
+        for _ in range(max_probes):
+            if high - low <= 1:
+                break
+            mid = (low + high) // 2
+            cards = self.count_cards(build_search_url(keyword, start_str, end_str, mid, office_category))
+            if cards >= 8:
+                low = mid
+            elif cards > 0:
+                return (mid - 1) * 10 + cards, True  # 마지막 페이지 발견
+            else:
+                high = mid
+
+        # 마지막 페이지를 찾지 못하면 구간의 중간값으로 추정
+        return ((low + high) // 2) * 10, high - low <= 1
+
+
+def plan_crawl(keywords, office_categories, start_date_str, end_date_str, logger, window_days=7,
+               max_requests=10, time_window=60, min_delay=2, max_probes=4,
+               target_hours=2.0, store_path="results/articles.sqlite", prober=None, prober_factory=None):
+    """키워드/카테고리별 예상 요청 수, 소요 시간, 출력 크기를 계산하는 함수
+
+    첫 페이지(및 몇 번의 깊은 페이지 탐색)만 요청하고, 기사 저장소에
+    같은 구간 기록이 있으면 요청 없이 그 수를 사용한다.
+    prober_factory를 주면 저장소에 없는 구간을 처음 만났을 때만 탐색기를 만든다 (모두 캐시면 브라우저 없이).
+    탐색기가 없으면 저장소에 없는 구간은 건너뛰고 계획을 추정(exact=False)으로 표시한다.
+    """
+    store_conn = None
+    if store_path and os.path.exists(store_path):
+        store_conn = sqlite3.connect(store_path)
+
+    row_bytes = average_row_bytes()
+    plans = []
+
+    for keyword in keywords:
+        for office_category in office_categories:
+            total_results = 0
+            total_pages = 0
+            max_window_pages = 0
+            cached_windows = 0
+            skipped_windows = 0
+            exact = True
+
+            for start_str, end_str in iter_date_windows(start_date_str, end_date_str, window_days):
+                count = cached_window_count(store_conn, keyword, office_category, start_str, end_str)
+                if count is not None:
+                    cached_windows += 1
+                else:
+                    if prober is None and prober_factory is not None:
+                        prober = prober_factory()
+                    if prober is None:
+                        logger.warning(f"   ⚠️ {keyword} [{office_category}] {start_str}~{end_str}: "
+                                       f"저장소 기록도 탐색기도 없어 건너뜀")
+                        skipped_windows += 1
+                        exact = False
+                        continue
+                    count, window_exact = prober.estimate_window(
+                        keyword, office_category, start_str, end_str, max_probes)
+                    exact = exact and window_exact
+
+                pages = max(1, math.ceil(count / 10))
+                total_results += count
+                total_pages += pages
+                max_window_pages = max(max_window_pages, pages)
+                logger.info(f"   🔎 {keyword} [{office_category}] {start_str}~{end_str}: 약 {count}건 ({pages}페이지)")
+
+            plans.append({
+                "keyword": keyword,
+                "office_category": office_category,
+                "results": total_results,
+                "pages": total_pages,
+                "max_window_pages": max_window_pages,
+                "cached_windows": cached_windows,
+                "skipped_windows": skipped_windows,
+                "exact": exact,
+            })
+
+    if store_conn is not None:
+        store_conn.close()
+
+    # 페이지당 실제 소요 시간: 측정 지연 + 고정 대기, 단 속도 제한기 한도보다 빠를 수 없음
+    measured_latency = (sum(prober.latencies) / len(prober.latencies)) if prober and prober.latencies else 1.5
+    per_page = max(measured_latency + PAGE_SLEEP_SECONDS, min_delay, time_window / max_requests)
+
+    for plan in plans:
+        plan["wall_seconds"] = plan["pages"] * per_page
+        plan["output_bytes"] = int(plan["results"] * row_bytes)
+
+        # 한 구간이 MAX_PROBE_PAGES의 절반을 넘으면 구간을 줄이도록 제안
+        if plan["max_window_pages"] > MAX_PROBE_PAGES // 2:
+            plan["suggested_window_days"] = max(1, window_days * (MAX_PROBE_PAGES // 2) // plan["max_window_pages"])
+        else:
+            plan["suggested_window_days"] = window_days
+        plan["suggested_workers"] = max(1, math.ceil(plan["wall_seconds"] / (target_hours * 3600)))
+
+    return plans, per_page
+
+
+def print_plan(plans, per_page, logger):
+    logger.info("=" * 60)
+    logger.info(f"📋 크롤링 계획 (페이지당 {per_page:.1f}초 기준)")
+    for plan in plans:
+        logger.info(f"🔹 {plan['keyword']} [카테고리 {plan['office_category']}]"
+                    f"{'' if plan['exact'] else ' (추정)'}")
+        logger.info(f"   예상 결과: {plan['results']}건, 요청: {plan['pages']}회 "
+                    f"(캐시 사용 구간 {plan['cached_windows']}개, 건너뛴 구간 {plan['skipped_windows']}개)")
+        logger.info(f"   예상 소요: {format_duration(plan['wall_seconds'])}, "
+                    f"출력 크기: {plan['output_bytes'] / 1024 / 1024:.1f}MB")
+        logger.info(f"   제안: 구간 {plan['suggested_window_days']}일, 워커 {plan['suggested_workers']}개")
+
+    total_seconds = sum(p["wall_seconds"] for p in plans)
+    logger.info(f"📊 전체: 요청 {sum(p['pages'] for p in plans)}회, "
+                f"단일 프로세스 기준 {format_duration(total_seconds)}")
+
+
+def write_plan_csv(plans, filepath):
+    with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=list(plans[0].keys()))
+        writer.writeheader()
+        writer.writerows(plans)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤링 계획 추정 (dry-run: 첫 페이지만 요청)")
+    parser.add_argument("keywords", nargs="+")
+    parser.add_argument("--start", required=True)
+    parser.add_argument("--end", required=True)
+    parser.add_argument("--office-category", nargs="+", default=[DEFAULT_OFFICE_CATEGORY])
+    parser.add_argument("--window-days", type=int, default=7)
+    parser.add_argument("--max-probes", type=int, default=4, help="구간당 깊은 페이지 탐색 횟수")
+    parser.add_argument("--target-hours", type=float, default=2.0, help="워커 수 제안 기준 목표 시간")
+    parser.add_argument("--output", help="계획을 저장할 CSV 경로")
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    rate_limiter = ImprovedRateLimiter(max_requests=10, time_window=60, logger=logger)
+    probers = []
+
+    def make_prober():
+        # 크롬은 저장소에 없는 구간을 탐색해야 할 때만 띄움
+        probers.append(PageProber(create_driver(), rate_limiter, logger))
+        return probers[-1]
+
+    try:
+        plans, per_page = plan_crawl(
+            args.keywords, args.office_category, args.start, args.end, logger,
+            window_days=args.window_days, max_requests=rate_limiter.max_requests,
+            time_window=rate_limiter.time_window, min_delay=rate_limiter.min_delay,
+            max_probes=args.max_probes, target_hours=args.target_hours,
+            prober_factory=make_prober,
+        )
+    finally:
+        for prober in probers:
+            prober.driver.quit()
+
+    print_plan(plans, per_page, logger)
+    if args.output and plans:
+        write_plan_csv(plans, args.output)
+        logger.info(f"💾 계획 저장: {args.output}")
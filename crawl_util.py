@@ -0,0 +1,485 @@
+from datetime import datetime, timedelta
+import csv
+import time
+import extract_factor_util as extract_util
+from extract_factor_util import By
+from url_canon_util import UrlCanonicalizer, add_canonical_urls
+from article_util import Article, SearchPage
+from article_store_util import ArticleStore
+from html_card_util import parse_page_html
+from retry_util import RetryPolicy
+from rate_limiter_util import ImprovedRateLimiter
+from logging_util import setup_queue_logging
+from page_guard_util import (
+    classify_page, CircuitBreaker, PageBlockedError, PageLoadError, PAGE_BLOCKED, PAGE_ERROR,
+)
+import os
+import logging
+
+
+# 모의 서버(mock_naver_server.py)로 벤치마크할 때는 NAVER_SEARCH_URL 환경변수로 교체
+SEARCH_URL = os.environ.get("NAVER_SEARCH_URL", "https://search.naver.com/search.naver")
+
+# 1: 일간지, 2: 방송통신, 3: 경제IT, 4: 인터넷신문
+DEFAULT_OFFICE_CATEGORY = "3"
+OFFICE_CATEGORY_NAMES = {"1": "일간지", "2": "방송통신", "3": "경제IT", "4": "인터넷신문"}
+
+
+def setup_logging(detail=False, json_lines=True, sample_every=None):
+    """로깅 설정 함수
+
+    기록은 logging_util의 큐 리스너 스레드가 처리하므로 크롤링 루프는 파일/콘솔 I/O를 기다리지 않는다.
+    detail=True면 카드별 상세 로그(DEBUG)까지 기록, sample_every로 레벨별 샘플링
+    """
+    # 현재 시간으로 로그 파일명 생성 (JSON Lines는 같은 이름의 .jsonl)
+    now = datetime.now()
+    log_filename = f"logs/naver_crawl_{now.strftime('%y%m%d_%H%M')}.log"
+
+    return setup_queue_logging('naver_crawler', log_filename, detail=detail, json_lines=json_lines,
+                               sample_every=sample_every)
+
+
+def debug_page_elements(driver, logger, wait_time=3):
+    """페이지의 모든 가능한 뉴스 요소들을 찾아서 출력하는 디버그 함수"""
+    time.sleep(wait_time)
+
+    logger.info("=== 🔍 페이지 디버깅 시작 ===")
+
+    # 1. 전체 페이지 구조 확인
+    try:
+        main_pack = driver.find_element(By.CSS_SELECTOR, "#main_pack")
+        logger.info("✅ #main_pack 존재")
+    except:
+        logger.info("❌ #main_pack 없음")
+
+    # 2. 뉴스 관련 div들 모두 찾기
+    possible_selectors = [
+        "div[class*='news']",
+        "div[class*='group']",
+        "div[class*='api']",
+        "div[class*='subject']",
+        "div[class*='area']",
+        "div[class*='wrap']",
+        "div[class*='item']",
+        "div[class*='card']",
+        "div[class*='list']",
+        "div[class*='vertical']",
+        "div[class*='horizontal']"
+    ]
+
+    for selector in possible_selectors:
+        try:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                logger.info(f"📦 {selector}: {len(elements)}개 발견")
+                # 첫 번째 요소의 클래스명 출력
+                if elements[0].get_attribute("class"):
+                    logger.info(f"    클래스: {elements[0].get_attribute('class')}")
+        except:
+            continue
+
+    # 3. 링크 요소들 찾기
+    logger.info("=== 📎 링크 요소 분석 ===")
+    link_selectors = [
+        "a[href*='news.naver.com']",
+        "a[href*='n.news.naver.com']",
+        "a[class*='news']",
+        "a[class*='tit']",
+        "a[class*='title']",
+        "a[class*='headline']"
+    ]
+
+    for selector in link_selectors:
+        try:
+            links = driver.find_elements(By.CSS_SELECTOR, selector)
+            if links:
+                logger.info(f"🔗 {selector}: {len(links)}개")
+                if links[0].text.strip():
+                    logger.info(f"    첫 번째 텍스트: {links[0].text.strip()[:50]}...")
+        except:
+            continue
+
+    # 4. 모든 a 태그의 클래스명 수집
+    logger.info("=== 🏷️ 모든 링크 클래스명 분석 ===")
+    all_links = driver.find_elements(By.TAG_NAME, "a")
+    class_names = set()
+    for link in all_links[:20]:  # 처음 20개만
+        if link.get_attribute("class"):
+            class_names.add(link.get_attribute("class"))
+            if link.text.strip() and len(link.text.strip()) > 10:
+                logger.info(f"📰 클래스: {link.get_attribute('class')}")
+                logger.info(f"    텍스트: {link.text.strip()[:80]}...")
+                logger.info(f"    href: {link.get_attribute('href')[:80] if link.get_attribute('href') else 'None'}...")
+                logger.info("---")
+
+    logger.info(f"총 {len(all_links)}개의 링크 발견")
+    return True
+
+
+def create_driver(performance_log=False, page_load_strategy=None):
+    """크롬 드라이버 생성 함수
+
+    performance_log=True면 CDP 네트워크 이벤트를 성능 로그(goog:loggingPrefs)로 받음 (cdp_capture_util)
+    """
+    # 브라우저 백엔드를 쓸 때만 selenium/webdriver_manager를 불러옴
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--window-size=1200,900")
+    options.add_argument(
+        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    options.add_experimental_option("detach", True)
+    if performance_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
+
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+
+def iter_date_windows(start_date_str, end_date_str, window_days=7):
+    """시작~종료일을 window_days 단위의 (시작, 종료) 문자열 쌍으로 나누는 함수"""
+    start_date = datetime.strptime(start_date_str, "%Y%m%d")
+    end_date = datetime.strptime(end_date_str, "%Y%m%d")
+
+    current_date = start_date
+    while current_date <= end_date:
+        window_end = min(current_date + timedelta(days=window_days - 1), end_date)
+        yield current_date.strftime("%Y%m%d"), window_end.strftime("%Y%m%d")
+        current_date = window_end + timedelta(days=1)
+
+
+def build_search_url(keyword, start_str, end_str, page, office_category=DEFAULT_OFFICE_CATEGORY, sort="r"):
+    """네이버 뉴스 검색 결과 페이지 URL 생성 함수 (sort - r: 관련도순, dd: 최신순)"""
+    start_num = (page - 1) * 10 + 1
+    return (f"{SEARCH_URL}?where=news&query={keyword}&nso=so:{sort},p:from{start_str}to{end_str},a:all"
+            f"&start={start_num}&service_area=1&office_category={office_category}")
+
+
+def crawl_search_page(driver, url, page, logger, debug=False, thumbnail_downloader=None, page_cache=None):
+    """검색 결과 한 페이지를 열어 뉴스 카드들을 추출하는 함수
+
+    page_cache(page_cache_util.PageCache)에 유효한 HTML이 있으면 브라우저 대신 캐시에서 파싱한다.
+    HTTP 백엔드(get_revalidated가 있는 드라이버)는 만료된 항목을 ETag/Last-Modified 조건부 요청으로
+    재검증하고 결과 페이지를 응답 헤더와 함께 저장한다.
+    반환값: (결과 리스트, 다음 페이지 존재 여부)
+    카드가 없을 때 차단 화면이면 PageBlockedError, 알 수 없는 페이지면 PageLoadError 발생
+    """
+    cached_source = page_cache.get(url) if page_cache else None
+    revalidates = page_cache is not None and hasattr(driver, "get_revalidated")
+    if cached_source is not None:
+        logger.info(f"💾 캐시 사용: {url}")
+        source = parse_page_html(cached_source)
+    else:
+        logger.info(f"🌐 접속 URL: {url}")
+        if revalidates:
+            if driver.get_revalidated(url, page_cache) == "revalidated":
+                logger.info(f"💾 캐시 재검증 (304): {url}")
+        else:
+            driver.get(url)
+        source = driver
+
+        # 첫 페이지에서만 디버깅 실행
+        if debug:
+            debug_page_elements(driver, logger)
+        else:
+            # 브라우저는 스크립트 렌더링을 기다림 (HTTP 백엔드는 page_load_wait = 0)
+            time.sleep(getattr(driver, "page_load_wait", 3))
+
+    # 지능적으로 뉴스 카드 찾기
+    logger.info(f"=== 🎯 뉴스 카드 탐지 시작 (페이지 {page}) ===")
+    news_cards = extract_util.find_elements_intelligently(source)
+
+    if not news_cards:
+        # 캡차/차단이나 로딩 실패를 '결과 없음'으로 착각하지 않도록 페이지 종류 확인
+        page_kind = classify_page(cached_source or driver.page_source, 0)
+        if page_kind == PAGE_BLOCKED:
+            raise PageBlockedError(f"차단 화면 (페이지 {page}): {url}")
+        if page_kind == PAGE_ERROR:
+            raise PageLoadError(f"알 수 없는 페이지 (페이지 {page}): {url}")
+
+        logger.info(f"❌ 더 이상 뉴스가 없습니다 (페이지 {page})")
+        return [], False
+
+    # 결과가 있는 페이지만 캐시 (빈 페이지는 차단 화면일 수 있음, HTTP 백엔드는 재검증 때 이미 저장)
+    if page_cache and cached_source is None and not revalidates:
+        page_cache.put(url, driver.page_source)
+
+    logger.info(f"✅ {len(news_cards)}개의 뉴스 카드 발견!")
+
+    page_results = extract_news_cards(news_cards, url, page, logger, thumbnail_downloader)
+    logger.info(f"📄 페이지 {page} 완료")
+
+    # 한 페이지 카드가 8개 미만이면 마지막 페이지
+    return page_results, len(news_cards) >= 8
+
+
+def iter_news(keyword, start_date_str, end_date_str, logger=None, office_category=DEFAULT_OFFICE_CATEGORY,
+              window_days=7, driver=None, rate_limiter=None, thumbnail_downloader=None, debug=False,
+              page_cache=None, circuit_breaker=None, retry_policy=None, dead_letters=None, start_page=1,
+              raise_on_failure=False, completed_windows=None):
+    """기사 레코드를 페이지 단위로 파싱하는 즉시 하나씩 내보내는 제너레이터
+
+    for article in iter_news('"육아휴직"', "20240601", "20240630"):
+        ...
+
+    중간에 break 하거나 itertools.islice 등으로 잘라도 되고, 드라이버를 직접
+    만들었다면(driver=None) 제너레이터가 닫힐 때 함께 종료한다.
+    차단 화면을 받으면 circuit_breaker의 대기 시간만큼 멈춘 뒤 같은 페이지를 다시 요청한다.
+    그 밖의 실패는 retry_policy로 재시도하고, 끝내 실패한 페이지는 dead_letters(retry_util.DeadLetterQueue)에
+    남긴 뒤 그 구간의 나머지를 건너뛴다 (raise_on_failure=True면 예외를 그대로 올림).
+    start_page는 첫 구간에만 적용된다 (데드 레터 재처리용).
+    rate_limiter를 주지 않으면 기본 한도(1분에 10회)를 적용한다.
+    마지막 페이지까지 수집한 구간은 completed_windows 리스트에 (시작, 끝)으로 추가한다. 수집 범위 인덱스에는
+    호출한 쪽이 결과를 저장한 뒤 기록한다 (coverage_util.CoverageIndex.mark_windows).
+    """
+    logger = logger or logging.getLogger('naver_crawler')
+    rate_limiter = rate_limiter or ImprovedRateLimiter(max_requests=10, time_window=60, logger=logger)
+    circuit_breaker = circuit_breaker or CircuitBreaker(logger=logger)
+    retry_policy = retry_policy or RetryPolicy(logger=logger, give_up_on=(PageBlockedError,))
+
+    def fetch_page(url, page, cached, debug_page):
+        # 재시도할 때도 요청 한도와 회로 차단기를 거침
+        if not cached:
+            circuit_breaker.wait_if_open()
+            rate_limiter.wait_if_needed()
+        return crawl_search_page(driver, url, page, logger, debug=debug_page,
+                                 thumbnail_downloader=thumbnail_downloader, page_cache=page_cache)
+
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_driver()
+
+    try:
+        for window_idx, (start_str, end_str) in enumerate(iter_date_windows(start_date_str, end_date_str, window_days)):
+            logger.info("================================")
+            logger.info(f"📄 {start_str}부터 {end_str}까지의 뉴스 수집 시작")
+
+            page = start_page if window_idx == 0 else 1
+            while True:
+                url = build_search_url(keyword, start_str, end_str, page, office_category)
+
+                # 캐시에서 읽는 페이지는 요청 한도와 페이지 간 대기를 쓰지 않음
+                cached = page_cache is not None and page_cache.is_fresh(url)
+
+                try:
+                    page_results, has_next = retry_policy.call(
+                        fetch_page, url, page, cached, debug and window_idx == 0 and page == 1,
+                        description=f"{start_str}~{end_str} 페이지 {page}",
+                    )
+                except PageBlockedError as e:
+                    if not circuit_breaker.record_block(str(e)):
+                        raise
+                    continue  # 대기 후 같은 페이지 재요청
+                except Exception as e:
+                    if raise_on_failure:
+                        raise
+                    if dead_letters is not None:
+                        dead_letters.add("search_page", {
+                            "keyword": keyword,
+                            "office_category": office_category,
+                            "start_date": start_str,
+                            "end_date": end_str,
+                            "page": page,
+                        }, e, retry_policy.max_attempts)
+                    logger.error(f"❌ {e} - 구간 {start_str}~{end_str}의 나머지 페이지 건너뜀")
+                    break
+
+                circuit_breaker.record_success()
+                yield from page_results
+
+                if not has_next:
+                    logger.info(f"✅ {start_str} to {end_str} 뉴스 수집 완료")
+                    if completed_windows is not None:
+                        completed_windows.append((start_str, end_str))
+                    break
+
+                if not cached:
+                    time.sleep(2)
+                page += 1
+
+            logger.info(f"📅 {start_str} to {end_str} 수집 완료")
+    finally:
+        if owns_driver:
+            driver.quit()
+
+
+def extract_news_cards(news_cards, url, page, logger, thumbnail_downloader=None):
+    """뉴스 카드들에서 결과 딕셔너리들을 추출하는 함수
+
+    카드는 Selenium WebElement 또는 html_card_util.SoupElement 모두 가능
+    """
+    page_results = []
+
+    # 같은 페이지의 카드들은 페이지 참조와 스크랩 시각을 공유
+    search_page = SearchPage(url)
+    scraped_at_epoch = int(time.time())
+
+    # 카드별 상세 로그는 DEBUG일 때만 (꺼져 있으면 문자열도 만들지 않음)
+    detail = logger.isEnabledFor(logging.DEBUG)
+
+    # 각 카드에서 정보 추출
+    for i, card in enumerate(news_cards):
+        if detail:
+            logger.debug(f"--- 📰 뉴스 {i + 1} 처리 중 (페이지 {page}) ---")
+
+        try:
+            # 제목 추출
+            title = extract_util.extract_title_intelligently(card)
+            if not title:
+                logger.warning(f"    ❌ 제목 추출 실패 (뉴스 {i + 1}, 페이지 {page})")
+                continue
+
+            # URL 추출
+            naver_url = extract_util.extract_naver_url(card)
+            original_url = extract_util.extract_original_url(card)
+            if detail:
+                logger.debug(f"        네이버 URL: {naver_url}")
+                logger.debug(f"        원본 URL: {original_url}")
+
+            # 언론사 추출 (간단히)
+            press = extract_util.extract_press(card)
+            # 발행일 추출
+            published = extract_util.extract_published(card)
+            # 이미지 URL 추출
+            image_url = extract_util.extract_img_url(card)
+            if thumbnail_downloader:
+                thumbnail_downloader.submit(image_url)
+
+            result = Article(
+                title=title,
+                naver_url=naver_url,
+                original_url=original_url,
+                source=press,
+                published=published,
+                image_url=image_url,
+                page=search_page,
+                scraped_at_epoch=scraped_at_epoch,
+            )
+
+            page_results.append(result)
+            if detail:
+                logger.debug(f"    ✅ 추출 완료: {title[:30]}... | {press} | {published}")
+
+        except Exception as e:
+            logger.error(f"    ❌ 뉴스 {i + 1} 처리 실패: {e}")
+            continue
+
+    return page_results
+
+
+def save_results(output_filename, results, logger, cluster_index_path="results/story_clusters.sqlite",
+                 canonicalize_urls=False, output_directory="results/", store_path="results/articles.sqlite"):
+    """결과를 CSV(와 기사 저장소)에 저장하는 함수 - 저장에 실패하면 False 반환 (저장할 결과가 없으면 True)"""
+    # 결과 저장
+    saved = True
+    if results:
+        # pandas(published_util)/numpy(cluster_util)는 저장할 때만 로드 - 모듈 import 비용 절약
+        import published_util
+        import cluster_util
+
+        os.makedirs(output_directory, exist_ok=True)
+
+        # 원본 URL 정규화 (리다이렉트 추적 + 추적 파라미터 제거, 캐시 재사용)
+        if canonicalize_urls:
+            canonicalizer = UrlCanonicalizer(logger=logger)
+            try:
+                add_canonical_urls(results, canonicalizer)
+            finally:
+                canonicalizer.close()
+
+        # ID 추가 및 중복 제거
+        processed_results = []
+        seen_urls = set()  # 중복 체크용 (URL 기준)
+
+        for result in results:  # enumerate 제거
+            # URL 기준으로 중복 체크 (naver_url 또는 정규화된 original_url)
+            url_key = result.get('naver_url') or result.get('canonical_url') or result.get('original_url')
+            if url_key and url_key in seen_urls:
+                logger.debug("🔄 중복 뉴스 발견: %s (건너뜀) | 제목: %s", url_key, result.get('title'))
+                continue  # 중복이면 건너뛰기
+
+            if url_key:
+                seen_urls.add(url_key)
+
+            processed_results.append(result)
+
+        # 발행일을 UTC 타임스탬프로 일괄 변환 (상대 시간은 scraped_at 기준, 파이프라인에서 이미 변환한 결과는 제외)
+        published_util.add_published_at([r for r in processed_results if 'published_at' not in r])
+
+        # published 여부 체크 (해석 가능한 발행일이 있는 경우만 Y)
+        for result in processed_results:
+            result['has_published'] = 'Y' if result.get('published_at') else 'N'
+
+        # 중복 제거 후 ID 부여
+        for idx, result in enumerate(processed_results, 1):
+            result['id'] = idx
+
+        # 언론사만 다른 같은 기사(통신사 전재 등)를 하나의 이야기로 묶기
+        if cluster_index_path:
+            cluster_util.assign_story_clusters(processed_results, cluster_index_path)
+
+        filepath = os.path.join(output_directory, output_filename)
+
+        try:
+            with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.DictWriter(f, fieldnames=[
+                    "id", "title", "naver_url", "original_url", "canonical_url", "source",
+                    "published", "published_at", "has_published", "image_url", "image_path", "image_phash",
+                    "scraped_at", "scraped_url", "story_cluster_id"
+                ])
+                writer.writeheader()
+                writer.writerows(processed_results)
+
+            # 결과 요약
+            original_count = len(results)
+            final_count = len(processed_results)
+            duplicate_count = original_count - final_count
+            no_published_count = sum(1 for r in processed_results if r['has_published'] == 'N')
+            story_count = len({r.get('story_cluster_id') for r in processed_results})
+
+            logger.info(f"   📰 전체 뉴스: {original_count}건")
+            logger.info(f"   🔄 중복 제거: {duplicate_count}건")
+            logger.info(f"   ✅ 최종 저장: {final_count}건")
+            logger.info(f"   ⚠️  발행일 없음: {no_published_count}건")
+            if cluster_index_path:
+                logger.info(f"   🧩 고유 이야기: {story_count}건")
+            logger.info(f"   💾 저장 위치: {filepath}")
+
+        except Exception as e:
+            logger.error(f"❌ 파일 저장 중 오류 발생: {e}")
+            saved = False
+
+        # 키워드/카테고리와 무관하게 기사 단위로 정규화 저장소에도 upsert
+        if store_path:
+            try:
+                store = ArticleStore(store_path)
+                try:
+                    stored_count = store.write_results(processed_results)
+                finally:
+                    store.close()
+                logger.info(f"   🗄️ 기사 저장소 반영: {stored_count}건 ({store_path})")
+            except Exception as e:
+                logger.error(f"❌ 기사 저장소 반영 중 오류 발생: {e}")
+                saved = False
+
+    else:
+        logger.warning("❌ 추출된 뉴스가 없습니다.")
+
+    return saved
+
+
+def format_duration(seconds):
+    """초를 시:분:초 형식으로 변환"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = seconds % 60
+
+    if hours > 0:
+        return f"{hours}시간 {minutes}분 {secs:.1f}초"
+    elif minutes > 0:
+        return f"{minutes}분 {secs:.1f}초"
+    else:
+        return f"{secs:.2f}초"
@@ -0,0 +1,172 @@
+import argparse
+import os
+import socket
+import time
+from datetime import datetime
+
+from crawl_util import (
+    setup_logging, create_driver, iter_date_windows, build_search_url,
+    crawl_search_page, save_results, DEFAULT_OFFICE_CATEGORY,
+)
+from rate_limiter_util import ImprovedRateLimiter
+from page_guard_util import CircuitBreaker, PageBlockedError
+from retry_util import RetryPolicy, DeadLetterQueue
+from coverage_util import CoverageIndex
+from work_queue_util import SQLiteWorkQueue
+
+
+def enqueue_crawl_units(queue, keyword, start_date_str, end_date_str,
+                        office_category=DEFAULT_OFFICE_CATEGORY, window_days=7):
+    """코디네이터: 날짜 구간별 첫 페이지 작업을 큐에 등록하는 함수
+
+    이후 페이지는 워커가 결과를 보고하면서 후속 작업으로 등록한다.
+    """
+    units = [{
+        "keyword": keyword,
+        "office_category": office_category,
+        "start_date": start_str,
+        "end_date": end_str,
+        "page": 1,
+    } for start_str, end_str in iter_date_windows(start_date_str, end_date_str, window_days)]
+    return queue.enqueue(units)
+
+
+def run_worker(queue, logger, worker_id=None, visibility_timeout=300, idle_timeout=120,
+               dead_letter_path="queue/dead_letters.jsonl", coverage_path="state/coverage.sqlite"):
+    """워커: 큐에서 작업을 임대해 한 페이지씩 크롤링하고 결과를 보고하는 함수
+
+    워커마다 자체 속도 제한기를 쓰므로 노드(출구 IP)를 늘리면 처리량이 늘어난다.
+    실패한 작업은 지수 백오프 뒤 다시 임대되고, 재시도 한도를 넘으면 데드 레터에 남는다.
+    idle_timeout 동안 가져갈 작업이 없으면 종료한다.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    rate_limiter = ImprovedRateLimiter(max_requests=10, time_window=60, logger=logger)
+    # 차단이 감지되면 큐에 일시 정지 시각을 기록해 모든 워커가 함께 쉼
+    circuit_breaker = CircuitBreaker(logger=logger, shared_queue=queue)
+    retry_policy = RetryPolicy(logger=logger)
+    dead_letters = DeadLetterQueue(dead_letter_path)
+    coverage_index = CoverageIndex(coverage_path) if coverage_path else None
+    driver = create_driver()
+
+    processed = 0
+    idle_since = time.time()
+
+    try:
+        while True:
+            circuit_breaker.wait_if_open()
+            unit = queue.lease(worker_id, visibility_timeout)
+
+            # 죽거나 멈춘 워커가 잡고 있다가 재시도 한도를 넘긴 작업도 재처리할 수 있게 데드 레터로
+            for expired in queue.pop_expired_failures():
+                logger.error(f"❌ [{worker_id}] 작업 {expired['id']} 임대 만료 - 재시도 한도 초과")
+                dead_letters.add("search_page", {key: expired[key] for key in (
+                    "keyword", "office_category", "start_date", "end_date", "page")},
+                    "lease expired", expired["attempts"])
+            if unit is None:
+                if time.time() - idle_since > idle_timeout:
+                    logger.info(f"💤 [{worker_id}] 대기 작업 없음 - 워커 종료")
+                    break
+                time.sleep(5)
+                continue
+
+            idle_since = time.time()
+            logger.info(f"📦 [{worker_id}] 작업 {unit['id']}: {unit['keyword']} "
+                        f"{unit['start_date']}~{unit['end_date']} 페이지 {unit['page']}")
+
+            try:
+                rate_limiter.wait_if_needed()
+                url = build_search_url(unit["keyword"], unit["start_date"], unit["end_date"],
+                                       unit["page"], unit["office_category"])
+                page_results, has_next = crawl_search_page(driver, url, unit["page"], logger)
+
+                follow_ups = []
+                if has_next:
+                    follow_ups.append({
+                        "keyword": unit["keyword"],
+                        "office_category": unit["office_category"],
+                        "start_date": unit["start_date"],
+                        "end_date": unit["end_date"],
+                        "page": unit["page"] + 1,
+                    })
+
+                circuit_breaker.record_success()
+                if queue.complete(unit["id"], worker_id, page_results, follow_ups):
+                    processed += 1
+                    # 앞 페이지들이 끝나야 다음 페이지가 등록되므로 마지막 페이지 완료 = 구간 완료
+                    if not has_next and coverage_index is not None:
+                        coverage_index.mark_window(unit["keyword"], unit["office_category"],
+                                                   unit["start_date"], unit["end_date"])
+                else:
+                    logger.warning(f"⚠️ [{worker_id}] 작업 {unit['id']} 임대 만료 - 결과 폐기")
+
+            except PageBlockedError as e:
+                # 작업 자체의 문제가 아니므로 시도 횟수를 쓰지 않고 되돌림
+                queue.release(unit["id"], worker_id, e)
+                if not circuit_breaker.record_block(str(e)):
+                    logger.error(f"❌ [{worker_id}] 차단이 계속됨 - 워커 종료")
+                    break
+
+            except Exception as e:
+                logger.error(f"❌ [{worker_id}] 작업 {unit['id']} 실패: {e}")
+                # unit['attempts']는 이번 임대 전까지의 시도 횟수
+                status = queue.fail(unit["id"], worker_id, e, retry_policy.delay(unit["attempts"]))
+                if status == "failed":
+                    dead_letters.add("search_page", {key: unit[key] for key in (
+                        "keyword", "office_category", "start_date", "end_date", "page")}, e, unit["attempts"] + 1)
+
+    finally:
+        driver.quit()
+        if coverage_index is not None:
+            coverage_index.close()
+
+    logger.info(f"✅ [{worker_id}] 처리한 작업: {processed}건")
+    return processed
+
+
+def collect_results(queue, keyword, start_date_str, end_date_str, logger, office_category=DEFAULT_OFFICE_CATEGORY):
+    """코디네이터: (키워드, 카테고리, 기간)에 해당하는 완료된 작업 결과를 모아 CSV로 저장하는 함수"""
+    results = list(queue.iter_results(keyword, office_category, start_date_str, end_date_str))
+
+    now = datetime.now()
+    output_filename = (f"naver_news_{keyword}_{now.strftime('%y%m%d')}_{now.strftime('%H%M')}"
+                       f"_({start_date_str}to{end_date_str})_distributed.csv")
+    save_results(output_filename, results, logger)
+
+    stats = queue.stats()
+    logger.info(f"📊 작업 현황: {stats}")
+    if stats.get("failed"):
+        logger.warning(f"⚠️ 실패한 작업 {stats['failed']}건이 남아 있습니다")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 뉴스 분산 크롤링 (코디네이터/워커)")
+    parser.add_argument("role", choices=["enqueue", "worker", "collect", "stats"])
+    parser.add_argument("--queue", default="queue/crawl_queue.sqlite", help="공유 작업 큐 경로")
+    parser.add_argument("--keyword")
+    parser.add_argument("--start")
+    parser.add_argument("--end")
+    parser.add_argument("--office-category", default=DEFAULT_OFFICE_CATEGORY)
+    parser.add_argument("--window-days", type=int, default=7)
+    parser.add_argument("--worker-id")
+    parser.add_argument("--visibility-timeout", type=int, default=300)
+    parser.add_argument("--single-host", action="store_true",
+                        help="모든 워커가 한 호스트에서 돌 때만 WAL 사용 (네트워크 파일시스템에서는 쓰지 말 것)")
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    queue = SQLiteWorkQueue(args.queue, single_host=args.single_host)
+
+    try:
+        if args.role == "enqueue":
+            added = enqueue_crawl_units(queue, args.keyword, args.start, args.end,
+                                        args.office_category, args.window_days)
+            logger.info(f"📥 작업 {added}건 등록 ({args.keyword} {args.start}~{args.end})")
+        elif args.role == "worker":
+            run_worker(queue, logger, args.worker_id, args.visibility_timeout)
+        elif args.role == "collect":
+            collect_results(queue, args.keyword, args.start, args.end, logger, args.office_category)
+        else:
+            logger.info(f"📊 작업 현황: {queue.stats()}")
+    finally:
+        queue.close()
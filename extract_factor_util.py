@@ -1,31 +1,46 @@
-from selenium.webdriver.common.by import By
+import logging
+import re
+
+
+# 'naver_crawler' 로거의 설정(큐 핸들러, 레벨)을 그대로 따름. 카드/패턴별 메시지는 모두 DEBUG라
+# 기본 설정에서는 포맷도 하지 않고 버려진다.
+logger = logging.getLogger('naver_crawler.extract')
+
+
+class By:
+    """selenium.webdriver.common.by.By 와 같은 값 (브라우저 없이 쓸 때 selenium을 import하지 않도록)"""
+    CSS_SELECTOR = "css selector"
+    XPATH = "xpath"
+    TAG_NAME = "tag name"
+
+
+# 뉴스 컨테이너를 찾기 위한 패턴들 (Playwright 백엔드는 렌더링 대기에도 사용)
+CONTAINER_PATTERNS = [
+    # 최신 컨테이너 패턴들
+    "div.sds-comps-vertical-layout.sds-comps-full-layout.fender-news-item-list-tab"
+    "div.fender-news-item-list-tab",
+    "div[class*='fender-news-item-list']",
+]
 
 
 def find_elements_intelligently(driver, base_element=None):
     """지능적으로 뉴스 요소들을 찾는 함수"""
     search_base = base_element if base_element else driver
 
-    # 1단계: 뉴스 컨테이너를 찾기 위한 패턴들
-    container_patterns = [
-        # 최신 컨테이너 패턴들
-        "div.sds-comps-vertical-layout.sds-comps-full-layout.fender-news-item-list-tab"
-        "div.fender-news-item-list-tab",
-        "div[class*='fender-news-item-list']",
-    ]
-
+    # 1단계: 뉴스 컨테이너 찾기
     container = None
-    for pattern in container_patterns:
+    for pattern in CONTAINER_PATTERNS:
         try:
             found_container = search_base.find_element(By.CSS_SELECTOR, pattern)
             if found_container:
                 container = found_container
-                print(f"🎯 뉴스 컨테이너 발견: {pattern}")
+                logger.debug("🎯 뉴스 컨테이너 발견: %s", pattern)
                 break
         except:
             continue
 
     if not container:
-        print("❌ 뉴스 컨테이너를 찾을 수 없습니다!")
+        logger.debug("❌ 뉴스 컨테이너를 찾을 수 없습니다!")
         return []
 
     # 2단계: 컨테이너 안에서 개별 뉴스 카드들 찾기
@@ -42,18 +57,18 @@ def find_elements_intelligently(driver, base_element=None):
         try:
             elements = container.find_elements(By.CSS_SELECTOR, pattern)
             if elements and len(elements) > 1:  # 여러 개의 카드가 있어야 함
-                print(f"🎯 개별 뉴스 카드 패턴 '{pattern}'로 {len(elements)}개 발견")
+                logger.debug("🎯 개별 뉴스 카드 패턴 '%s'로 %d개 발견", pattern, len(elements))
                 found_cards = elements
                 break
             elif elements and len(elements) == 1:
-                print(f"⚠️ 패턴 '{pattern}'로 1개만 발견 - 다음 패턴 시도")
+                logger.debug("⚠️ 패턴 '%s'로 1개만 발견 - 다음 패턴 시도", pattern)
         except Exception as e:
-            print(f"❌ 패턴 '{pattern}' 시도 실패: {e}")
+            logger.debug("❌ 패턴 '%s' 시도 실패: %s", pattern, e)
             continue
 
     # 3단계: 여전히 찾지 못했다면 더 포괄적으로 찾기
     if not found_cards:
-        print("🔍 포괄적 검색 시작...")
+        logger.debug("🔍 포괄적 검색 시작...")
         try:
             # 컨테이너의 모든 직접 자식들 중에서 텍스트가 있는 것들 찾기
             all_children = container.find_elements(By.XPATH, "./*")
@@ -67,10 +82,10 @@ def find_elements_intelligently(driver, base_element=None):
                         potential_cards.append(child)
 
             if potential_cards:
-                print(f"🎯 포괄적 검색으로 {len(potential_cards)}개 카드 발견")
+                logger.debug("🎯 포괄적 검색으로 %d개 카드 발견", len(potential_cards))
                 found_cards = potential_cards
         except Exception as e:
-            print(f"❌ 포괄적 검색 실패: {e}")
+            logger.debug("❌ 포괄적 검색 실패: %s", e)
 
     return found_cards
 
@@ -92,7 +107,7 @@ def extract_title_intelligently(card):
             for element in elements:
                 text = element.text.strip()
                 if text and len(text) > 5:  # 최소 5글자 이상
-                    print(f"    📰 제목 발견 (패턴: {pattern}): {text[:50]}...")
+                    logger.debug("    📰 제목 발견 (패턴: %s): %.50s...", pattern, text)
                     return text
         except:
             continue
@@ -164,14 +179,16 @@ def extract_published(card):
             for date_elem in date_elems:
                 text = date_elem.text.strip()
                 # 2024.06.15 형식 또는 다른 날짜 형식 확인
-                import re
                 if text and (
                         # YYYY.MM.DD 형식
                         re.match(r'\d{4}\.\d{1,2}\.\d{1,2}', text)
+                        # 3시간 전, 1일 전 같은 상대 시간 형식
+                        or re.match(r'\d+\s*(초|분|시간|일|주)\s*전', text)
+                        or text == "어제"
                 ):
                     if len(text) < 50:  # 너무 긴 텍스트 제외
                         published = text
-                        print(f"        📅 발행일 발견 (패턴: {pattern}): {text}")
+                        logger.debug("        📅 발행일 발견 (패턴: %s): %s", pattern, text)
                         break
             if published:
                 break
@@ -0,0 +1,74 @@
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401  (있으면 더 빠른 파서 사용)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+# selenium.webdriver.common.by.By 의 값과 동일
+CSS_SELECTOR = "css selector"
+XPATH = "xpath"
+TAG_NAME = "tag name"
+
+
+class NoSuchElementError(Exception):
+    """find_element로 요소를 찾지 못했을 때 발생"""
+
+
+class SoupElement:
+    """BeautifulSoup 태그를 Selenium WebElement처럼 다루는 어댑터
+
+    extract_factor_util의 함수들이 브라우저 없이 저장된 HTML에서도
+    그대로 동작하도록 find_element(s), text, get_attribute, tag_name만 흉내 낸다.
+    """
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    @property
+    def text(self):
+        return self.tag.get_text(" ", strip=True)
+
+    @property
+    def tag_name(self):
+        return self.tag.name
+
+    def get_attribute(self, name):
+        value = self.tag.get(name)
+        if isinstance(value, list):  # class 같은 다중 값 속성
+            return " ".join(value)
+        return value
+
+    def find_elements(self, by, value):
+        if by == CSS_SELECTOR:
+            return [SoupElement(tag) for tag in self.tag.select(value)]
+        if by == TAG_NAME:
+            return [SoupElement(tag) for tag in self.tag.find_all(value)]
+        if by == XPATH:
+            # extract_factor_util에서 쓰는 XPath만 지원
+            if value == "..":
+                return [SoupElement(self.tag.parent)] if self.tag.parent else []
+            if value == "./*":
+                return [SoupElement(tag) for tag in self.tag.find_all(recursive=False)]
+        raise ValueError(f"지원하지 않는 셀렉터: {by}={value}")
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementError(f"요소 없음: {by}={value}")
+        return elements[0]
+
+
+class SoupDriver(SoupElement):
+    """페이지 HTML 전체를 WebDriver처럼 다루는 어댑터"""
+
+    def __init__(self, page_source):
+        self.page_source = page_source
+        super().__init__(BeautifulSoup(page_source, HTML_PARSER))
+
+
+def parse_page_html(page_source):
+    """페이지 HTML을 find_elements_intelligently 등에 넘길 수 있는 객체로 변환하는 함수"""
+    return SoupDriver(page_source)
@@ -0,0 +1,64 @@
+import requests
+
+import extract_factor_util as extract_util
+from html_card_util import parse_page_html
+from page_cache_util import revalidating_http_get
+from page_guard_util import classify_page, PAGE_RESULTS
+from url_canon_util import DEFAULT_HEADERS
+
+
+def is_results_page(page_source):
+    """뉴스 카드가 있는 페이지인지 확인하는 함수 (캡차/빈 페이지는 캐시하지 않음)"""
+    cards = extract_util.find_elements_intelligently(parse_page_html(page_source))
+    return classify_page(page_source, len(cards)) == PAGE_RESULTS
+
+
+class HttpDriver:
+    """브라우저 없이 requests로 검색 결과 HTML을 받아오는 드라이버
+
+    crawl_search_page가 쓰는 get / page_source / find_element(s) / quit만 제공하므로
+    Selenium 드라이버 자리에 그대로 넘길 수 있다. 카드 탐색은 html_card_util로 처리한다.
+    crawl_search_page에 page_cache를 넘기면 캐시에 없거나 만료된 페이지는 get_revalidated로
+    ETag/Last-Modified 조건부 요청을 보낸다 (캐시는 crawl_search_page 한 곳에서만 관리).
+    """
+
+    # 스크립트 렌더링을 기다릴 필요 없음
+    page_load_wait = 0
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers["Accept-Language"] = "ko-KR,ko;q=0.9"
+        self.page_source = ""
+        self.current_url = None
+        self._root = parse_page_html("")
+
+    def get(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        self._load(url, response.text)
+
+    def get_revalidated(self, url, page_cache):
+        """page_cache의 만료된 항목으로 조건부 요청하는 메서드 (결과 페이지만 응답 헤더와 함께 저장)
+
+        반환값: 'revalidated'(304, 캐시 본문 사용) / 'network'
+        """
+        page_source, origin = revalidating_http_get(self.session, url, page_cache, self.timeout,
+                                                    cacheable=is_results_page)
+        self._load(url, page_source)
+        return origin
+
+    def _load(self, url, page_source):
+        self.page_source = page_source
+        self.current_url = url
+        self._root = parse_page_html(page_source)
+
+    def find_element(self, by, value):
+        return self._root.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self._root.find_elements(by, value)
+
+    def quit(self):
+        self.session.close()
@@ -0,0 +1,175 @@
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+from crawl_util import (
+    setup_logging, create_driver, build_search_url, crawl_search_page, save_results,
+    format_duration, DEFAULT_OFFICE_CATEGORY,
+)
+from article_store_util import article_key_of
+from rate_limiter_util import ImprovedRateLimiter
+from page_guard_util import CircuitBreaker, PageBlockedError
+from retry_util import RetryPolicy
+from wpmode import BACKENDS, load_backend
+
+
+HIGH_WATER_MARK_PATH = "state/high_water_marks.json"
+
+# 최신순 상위 기사 ID를 이만큼 기억해 두고, 다음 실행에서 만나면 페이지 넘김 중단
+KNOWN_ID_COUNT = 50
+
+
+def load_high_water_marks(path=HIGH_WATER_MARK_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_high_water_marks(marks, path=HIGH_WATER_MARK_PATH):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(marks, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def crawl_incremental(keyword, logger, office_category=DEFAULT_OFFICE_CATEGORY,
+                      state_path=HIGH_WATER_MARK_PATH, initial_days=7, max_pages=400,
+                      driver_factory=create_driver):
+    """지난 실행 이후의 새 기사만 수집하는 증분 크롤링 함수
+
+    최신순(so:dd)으로 페이지를 넘기다가 지난 실행에서 본 기사 ID를 만나면 바로 멈춘다.
+    처음 실행하는 (키워드, 카테고리)는 최근 initial_days 일만 수집한다.
+    max_pages까지 넘겨도 본 기사나 마지막 페이지에 닿지 못하면 그 뒤 기사가 빠지므로
+    하이 워터 마크(시작일, 기사 ID)를 옮기지 않고 다음 실행에서 같은 시작일부터 다시 수집한다.
+    차단 화면은 iter_news처럼 회로 차단기로 기다렸다가 다시 요청하고, 그 밖의 실패는 retry_policy로 재시도한다.
+    끝내 실패하거나 결과 저장에 실패해도 하이 워터 마크는 그대로 둔다.
+    driver_factory로 드라이버 백엔드를 바꿀 수 있다 (예: http_driver_util.HttpDriver).
+    """
+    marks = load_high_water_marks(state_path)
+    mark_key = f"{keyword}|{office_category}"
+    mark = marks.get(mark_key, {})
+    known_ids = set(mark.get("known_ids", []))
+
+    today = datetime.now()
+    if mark.get("last_run_date"):
+        start_str = mark["last_run_date"]  # 마지막 실행일 당일 기사부터 다시 확인
+    else:
+        start_str = (today - timedelta(days=initial_days - 1)).strftime("%Y%m%d")
+    end_str = today.strftime("%Y%m%d")
+
+    logger.info(f"🔁 증분 수집: {keyword} (카테고리 {office_category}) {start_str} ~ {end_str}, "
+                f"기존 기사 ID {len(known_ids)}개")
+
+    rate_limiter = ImprovedRateLimiter(max_requests=10, time_window=60, logger=logger)
+    circuit_breaker = CircuitBreaker(logger=logger)
+    retry_policy = RetryPolicy(logger=logger, give_up_on=(PageBlockedError,))
+    driver = driver_factory()
+    results = []
+    reached_known = False
+    has_next = True
+    failed = False
+
+    def fetch_page(url, page):
+        # 재시도할 때도 요청 한도와 회로 차단기를 거침
+        circuit_breaker.wait_if_open()
+        rate_limiter.wait_if_needed()
+        return crawl_search_page(driver, url, page, logger)
+
+    try:
+        page = 1
+        while page <= max_pages:
+            url = build_search_url(keyword, start_str, end_str, page, office_category, sort="dd")
+            try:
+                page_results, has_next = retry_policy.call(fetch_page, url, page, description=f"페이지 {page}")
+            except PageBlockedError as e:
+                if circuit_breaker.record_block(str(e)):
+                    continue  # 대기 후 같은 페이지 재요청
+                logger.error(f"❌ 차단이 계속됨 - 페이지 {page}에서 중단")
+                failed = True
+                break
+            except Exception as e:
+                logger.error(f"❌ {e} - 페이지 {page}에서 중단")
+                failed = True
+                break
+            circuit_breaker.record_success()
+
+            for result in page_results:
+                if article_key_of(result) in known_ids:
+                    reached_known = True
+                    break
+                results.append(result)
+
+            if reached_known:
+                logger.info(f"🛑 이미 수집한 기사 도달 - 페이지 {page}에서 중단")
+                break
+            if not has_next:
+                break
+            time.sleep(2)
+            page += 1
+
+        saved = True
+        if results:
+            now = datetime.now()
+            output_filename = (f"naver_news_{keyword}_{now.strftime('%y%m%d')}_{now.strftime('%H%M')}"
+                               f"_({start_str}to{end_str})_incremental.csv")
+            saved = save_results(output_filename, results, logger)
+        else:
+            logger.info("✅ 새 기사가 없습니다")
+
+        if not saved:
+            # 저장하지 못한 기사를 건너뛰지 않도록 하이 워터 마크는 그대로
+            logger.error("❌ 결과 저장 실패 - 하이 워터 마크를 갱신하지 않음")
+        elif not failed and (reached_known or not has_next):
+            # 최신 기사 ID로 하이 워터 마크 갱신 (새 기사가 없으면 기존 값 유지)
+            new_ids = [key for key in (article_key_of(r) for r in results) if key]
+            marks[mark_key] = {
+                "known_ids": (new_ids + [i for i in mark.get("known_ids", []) if i not in new_ids])[:KNOWN_ID_COUNT],
+                "newest_published": results[0].get("published") if results else mark.get("newest_published", ""),
+                "last_run_date": end_str,
+                "last_run_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        else:
+            # 새 기사 ID를 기록하면 다음 실행이 그 ID에서 멈춰 max_pages 뒤의 기사를 영영 건너뜀
+            if not failed:
+                logger.warning(f"⚠️ {max_pages}페이지까지 이미 수집한 기사에 닿지 못함 - "
+                               f"다음 실행에서 {start_str}부터 다시 수집 (max_pages를 늘려 주세요)")
+            marks[mark_key] = {
+                "known_ids": mark.get("known_ids", []),
+                "newest_published": mark.get("newest_published", ""),
+                "last_run_date": start_str,
+                "last_run_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        save_high_water_marks(marks, state_path)
+
+        stats = rate_limiter.get_stats()
+        logger.info(f"📊 새 기사 {len(results)}건, 요청 {stats['total_requests']}회")
+
+    finally:
+        driver.quit()
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="지난 실행 이후 새 기사만 수집 (최신순 + 조기 중단)")
+    parser.add_argument("keywords", nargs="+", help="검색 키워드 (따옴표 포함 가능)")
+    parser.add_argument("--office-category", nargs="+", default=[DEFAULT_OFFICE_CATEGORY])
+    parser.add_argument("--initial-days", type=int, default=7, help="처음 실행 시 수집할 최근 일수")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="selenium")
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    start_time = time.time()
+
+    for keyword in args.keywords:
+        for office_category in args.office_category:
+            crawl_incremental(keyword, logger, office_category, initial_days=args.initial_days,
+                              driver_factory=load_backend(args.backend))
+
+    logger.info(f"⌛ 총 실행 시간: {format_duration(time.time() - start_time)}")
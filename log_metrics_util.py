@@ -0,0 +1,242 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import statistics
+from datetime import datetime
+
+
+# "2025-06-11 00:11:35,879 - INFO - 메시지"
+LINE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}) (\d{2}):(\d{2}):(\d{2}),(\d{3}) - (\w+) - (.*)")
+
+# 메시지 앞 공백을 떼고 match (한 번의 정규식으로 이벤트 종류 판별)
+EVENT_PATTERN = re.compile(
+    r"🚀 네이버 뉴스 크롤러 시작"
+    r"|🌐 접속 URL: (?P<url>\S+)"
+    r"|💾 캐시 사용: (?P<cached_url>\S+)"
+    r"|✅ (?P<cards>\d+)개의 뉴스 카드 발견"
+    r"|❌ 더 이상 뉴스가 없습니다"
+    r"|📄 페이지 (?P<page_done>\d+) 완료"
+    r"|⏱️ +최소 대기: (?P<min_wait>[\d.]+)초"
+    r"|⏰ 윈도우 제한: (?P<window_wait>[\d.]+)초"
+    r"|🔄 중복 뉴스 발견"
+    r"|📰 전체 뉴스: (?P<total>\d+)건"
+    r"|🔄 중복 제거: (?P<duplicates>\d+)건"
+    r"|✅ 최종 저장: (?P<saved>\d+)건"
+    r"|❌ 제목 추출 실패"
+    r"|❌ 뉴스 \d+ 처리 실패"
+    r"|🚫 차단 감지"
+    r"|🔁 "
+    r"|⌛ 총 실행 시간"
+)
+
+
+def _event_name(match):
+    text = match.group(0)
+    for name in ("url", "cached_url", "cards", "page_done", "min_wait", "window_wait", "total", "duplicates", "saved"):
+        if match.group(name) is not None:
+            return name
+    if text.startswith("🚀"):
+        return "start"
+    if text.startswith("❌ 더 이상"):
+        return "empty_page"
+    if text.startswith("🔄 중복 뉴스"):
+        return "duplicate"
+    if text.startswith("❌"):
+        return "card_failure"
+    if text.startswith("🚫"):
+        return "blocked"
+    if text.startswith("⌛"):
+        return "end"
+    return "retry"
+
+
+class RunMetrics:
+    """로그 한 실행분의 누적 지표"""
+
+    def __init__(self, log_file, run_index):
+        self.log_file = log_file
+        self.run_index = run_index
+        self.first_ts = None
+        self.last_ts = None
+        self.pages = 0
+        self.cached_pages = 0
+        self.empty_pages = 0
+        self.cards = 0
+        self.page_latencies = []   # 접속 → 카드 발견 (로딩 + 렌더링 대기 + 탐지)
+        self.extract_seconds = 0.0  # 카드 발견 → 페이지 완료
+        self.wait_seconds = 0.0
+        self.min_waits = 0
+        self.window_waits = 0
+        self.duplicate_lines = 0
+        self.total_results = None
+        self.duplicates = None
+        self.saved = None
+        self.card_failures = 0
+        self.errors = 0
+        self.blocked = 0
+        self.retries = 0
+        self._page_started = None
+        self._cards_found_at = None
+
+    def feed(self, ts, level, event, match):
+        if self.first_ts is None:
+            self.first_ts = ts
+        self.last_ts = ts
+        if level == "ERROR":
+            self.errors += 1
+
+        if event == "url":
+            self.pages += 1
+            self._page_started = ts
+        elif event == "cached_url":
+            self.pages += 1
+            self.cached_pages += 1
+            self._page_started = ts
+        elif event == "cards":
+            self.cards += int(match.group("cards"))
+            if self._page_started is not None:
+                self.page_latencies.append(ts - self._page_started)
+            self._cards_found_at = ts
+        elif event == "empty_page":
+            self.empty_pages += 1
+        elif event == "page_done":
+            if self._cards_found_at is not None:
+                self.extract_seconds += ts - self._cards_found_at
+                self._cards_found_at = None
+        elif event == "min_wait":
+            self.min_waits += 1
+            self.wait_seconds += float(match.group("min_wait"))
+        elif event == "window_wait":
+            self.window_waits += 1
+            self.wait_seconds += float(match.group("window_wait"))
+        elif event == "duplicate":
+            self.duplicate_lines += 1
+        elif event == "total":
+            self.total_results = int(match.group("total"))
+        elif event == "duplicates":
+            self.duplicates = int(match.group("duplicates"))
+        elif event == "saved":
+            self.saved = int(match.group("saved"))
+        elif event == "card_failure":
+            self.card_failures += 1
+        elif event == "blocked":
+            self.blocked += 1
+        elif event == "retry":
+            self.retries += 1
+
+    def to_row(self):
+        duration = (self.last_ts - self.first_ts) if self.first_ts is not None else 0
+        total = self.total_results if self.total_results is not None else self.cards
+        duplicates = self.duplicates if self.duplicates is not None else self.duplicate_lines
+        latencies = sorted(self.page_latencies)
+        pages_with_cards = len(latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 2)
+
+        return {
+            "log_file": self.log_file,
+            "run": self.run_index,
+            "started_at": datetime.fromtimestamp(self.first_ts).strftime("%Y-%m-%d %H:%M:%S") if self.first_ts else "",
+            "duration_sec": round(duration, 1),
+            "pages": self.pages,
+            "cached_pages": self.cached_pages,
+            "empty_pages": self.empty_pages,
+            "cards": self.cards,
+            "cards_per_page": round(self.cards / pages_with_cards, 2) if pages_with_cards else 0,
+            "page_latency_mean": round(statistics.fmean(latencies), 2) if latencies else None,
+            "page_latency_p50": percentile(0.5),
+            "page_latency_p90": percentile(0.9),
+            "extract_sec_per_page": round(self.extract_seconds / pages_with_cards, 3) if pages_with_cards else None,
+            "wait_sec": round(self.wait_seconds, 1),
+            "wait_share": round(self.wait_seconds / duration, 3) if duration else 0,
+            "window_waits": self.window_waits,
+            "duplicate_rate": round(duplicates / total, 3) if total else 0,
+            "saved": self.saved,
+            "articles_per_min": round((self.saved or self.cards) / duration * 60, 1) if duration else 0,
+            "card_failures": self.card_failures,
+            "errors": self.errors,
+            "blocked": self.blocked,
+            "retries": self.retries,
+        }
+
+
+def _json_line_match(line):
+    """logging_util.JsonLineFormatter 한 줄을 LINE_PATTERN 매치 결과처럼 바꾸는 함수"""
+    try:
+        entry = json.loads(line)
+        return LINE_PATTERN.match(f"{entry['time']} - {entry['level']} - {entry['message']}")
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def analyze_log(filepath):
+    """로그 파일 하나를 줄 단위로 읽어 실행별 지표 리스트를 반환하는 함수
+
+    텍스트 로그(.log)와 JSON Lines 로그(.jsonl) 모두 지원
+    """
+    runs = []
+    current = None
+    day_epochs = {}  # 날짜 문자열 → 자정 epoch (줄마다 strptime 하지 않도록)
+    log_file = os.path.basename(filepath)
+    match_line = _json_line_match if filepath.endswith(".jsonl") else LINE_PATTERN.match
+
+    with open(filepath, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line_match = match_line(line)
+            if not line_match:
+                continue
+            day, hour, minute, second, millis, level, message = line_match.groups()
+
+            event_match = EVENT_PATTERN.match(message.lstrip())
+            if current is not None and event_match is None and level != "ERROR":
+                continue
+
+            if day not in day_epochs:
+                day_epochs[day] = datetime.strptime(day, "%Y-%m-%d").timestamp()
+            ts = day_epochs[day] + int(hour) * 3600 + int(minute) * 60 + int(second) + int(millis) / 1000
+
+            event = _event_name(event_match) if event_match else None
+            if current is None or event == "start":
+                current = RunMetrics(log_file, len(runs) + 1)
+                runs.append(current)
+            current.feed(ts, level, event, event_match)
+
+    return [run for run in runs if run.pages or run.total_results is not None]
+
+
+def print_table(rows, columns):
+    widths = {c: max(len(c), *(len(str(r.get(c, ""))) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str("" if row.get(c) is None else row.get(c)).ljust(widths[c]) for c in columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤링 로그에서 실행별 성능 지표 추출")
+    parser.add_argument("patterns", nargs="*", default=["logs/naver_crawl_*.log"])
+    parser.add_argument("--output", help="지표를 저장할 CSV 경로")
+    args = parser.parse_args()
+
+    rows = []
+    for pattern in args.patterns:
+        for filepath in sorted(glob.glob(pattern)):
+            rows.extend(run.to_row() for run in analyze_log(filepath))
+
+    if not rows:
+        print("❌ 분석할 로그가 없습니다")
+    else:
+        print_table(rows, ["log_file", "run", "duration_sec", "pages", "cards_per_page", "page_latency_p50",
+                           "page_latency_p90", "wait_share", "duplicate_rate", "articles_per_min",
+                           "card_failures", "errors"])
+        if args.output:
+            with open(args.output, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+                writer.writeheader()
+                writer.writerows(rows)
+            print(f"💾 지표 저장: {args.output}")
@@ -0,0 +1,134 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_listener = None  # 현재 동작 중인 QueueListener (setup_queue_logging을 다시 부르면 교체)
+
+
+class JsonLineFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 만드는 포맷터
+
+    time/level 값은 텍스트 로그와 같은 형식이라 log_metrics_util이 그대로 읽을 수 있다.
+    logger.info(..., extra={"fields": {...}}) 로 넘긴 값은 같은 줄에 함께 기록된다.
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """레벨별로 N건 중 1건만 통과시키는 필터
+
+    sample_every: {레벨: N} (예: {logging.DEBUG: 20}). 없는 레벨은 모두 통과.
+    큐에 넣기 전에 걸러서 버려지는 레코드는 포맷/기록 비용이 들지 않는다.
+    """
+
+    def __init__(self, sample_every=None):
+        super().__init__()
+        self.sample_every = {
+            level if isinstance(level, int) else logging.getLevelName(level.upper()): every
+            for level, every in (sample_every or {}).items() if every > 1
+        }
+        self.counts = dict.fromkeys(self.sample_every, 0)
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        every = self.sample_every.get(record.levelno)
+        if not every:
+            return True
+        with self.lock:
+            self.counts[record.levelno] += 1
+            return self.counts[record.levelno] % every == 1
+
+
+def parse_sample_every(values):
+    """'DEBUG=20' 형태의 문자열 리스트를 {레벨: N} 으로 바꾸는 함수"""
+    sample_every = {}
+    for value in values or []:
+        level, _, every = value.partition("=")
+        sample_every[level.strip().upper()] = int(every)
+    return sample_every
+
+
+def setup_queue_logging(logger_name='naver_crawler', log_filename=None, detail=False, json_lines=True,
+                        sample_every=None, console=True):
+    """QueueHandler/QueueListener 기반 비동기 로깅 설정 함수
+
+    크롤링 스레드는 레코드를 큐에 넣기만 하고, 콘솔/파일 기록은 리스너 스레드가 처리한다.
+    - detail=False(기본)면 INFO 이상만 기록 (카드별 상세 로그는 DEBUG)
+    - 텍스트 로그(log_filename)는 기존 형식 그대로, json_lines=True면 같은 이름의 .jsonl도 기록
+    - sample_every로 레벨별 샘플링 (예: 상세 로그를 켠 채 DEBUG는 20건 중 1건만)
+    """
+    global _listener
+
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(logging.DEBUG if detail else logging.INFO)
+
+    # 기존 핸들러/리스너 제거 (중복 방지, 이전 로그 파일은 닫음)
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    stop_queue_logging()
+
+    handlers = []
+    text_formatter = logging.Formatter(TEXT_FORMAT)
+    if log_filename:
+        directory = os.path.dirname(log_filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 파일 핸들러 (UTF-8 인코딩으로 한글 지원)
+        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        file_handler.setFormatter(text_formatter)
+        handlers.append(file_handler)
+
+        if json_lines:
+            json_handler = logging.FileHandler(os.path.splitext(log_filename)[0] + ".jsonl", encoding='utf-8')
+            json_handler.setFormatter(JsonLineFormatter())
+            handlers.append(json_handler)
+
+    if console:
+        # 콘솔에는 상세 로그를 켜도 INFO 이상만
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(text_formatter)
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_every))
+    logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return logger
+
+
+def stop_queue_logging():
+    """남은 레코드를 모두 기록하고 리스너를 멈춘 뒤 파일/콘솔 핸들러를 닫는 함수"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_queue_logging)
@@ -0,0 +1,249 @@
+import argparse
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+PRESSES = ["경향신문", "한국일보", "이데일리", "뉴스1", "연합뉴스", "머니투데이", "KBS", "전자신문"]
+OFFICE_IDS = ["032", "469", "018", "421", "001", "008", "056", "030"]
+TOPICS = ["저출생 대책", "육아휴직 확대", "출산 지원금", "워킹맘 고용", "돌봄 공백", "대체인력 지원"]
+
+NSO_PATTERN = re.compile(r"from(\d{8})to(\d{8})")
+
+# 카드 마크업 변형
+#   current: extract_factor_util의 정확한 셀렉터와 일치 (2024년 6월 구조)
+#   hashed: 카드 고유 클래스가 바뀐 구조 (포괄적 검색 경로 사용)
+MARKUP_VARIANTS = ("current", "hashed")
+
+
+def render_card(article, variant="current"):
+    """뉴스 카드 하나의 HTML을 만드는 함수"""
+    card_class = "_4zQ0QZWfn7bqZ_ul5OV" if variant == "current" else "_mockHashed9xQ2"
+    return f"""
+<div class="sds-comps-vertical-layout sds-comps-full-layout {card_class}">
+  <div class="sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-profile-info">
+    <span class="sds-comps-text sds-comps-text-ellipsis sds-comps-text-ellipsis-1 sds-comps-text-type-body2 sds-comps-text-weight-sm">{html.escape(article["source"])}</span>
+    <span class="sds-comps-text sds-comps-text-type-body2 sds-comps-text-weight-sm">{html.escape(article["published"])}</span>
+    <a href="{html.escape(article["naver_url"])}">네이버뉴스</a>
+  </div>
+  <div class="sds-comps-base-layout sds-comps-full-layout">
+    <div class="sds-comps-inline-layout">
+      <div class="sds-comps-image"><img src="{html.escape(article["image_url"])}"></div>
+    </div>
+    <a nocr="1" href="{html.escape(article["original_url"])}"><span class="sds-comps-text sds-comps-text-ellipsis sds-comps-text-ellipsis-1 sds-comps-text-type-headline1">{html.escape(article["title"])}</span></a>
+  </div>
+</div>"""
+
+
+def render_results_page(articles, variant="current"):
+    """검색 결과 페이지 HTML을 만드는 함수"""
+    cards = "".join(render_card(article, variant) for article in articles)
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>네이버 뉴스 검색 (mock)</title></head>
+<body><div id="main_pack"><div class="group_news">
+<div class="sds-comps-vertical-layout sds-comps-full-layout fender-news-item-list-tab">{cards}
+</div></div></div></body></html>"""
+
+
+def render_empty_page():
+    return """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body><div id="main_pack"><div class="api_noresult_wrap">검색결과가 없습니다.</div></div></body></html>"""
+
+
+def render_captcha_page():
+    return """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>보안 확인</title></head>
+<body><div id="captcha_wrap"><p>자동입력 방지를 위해 아래 문자를 입력해주세요.</p>
+<img id="captchaimg" src="/captcha.png"><input id="captcha" type="text"></div></body></html>"""
+
+
+def generate_articles(query, start_str, end_str, office_category, max_results):
+    """검색 조건별로 항상 같은 가상 기사 목록을 만드는 함수"""
+    seed = int(hashlib.sha1(f"{query}|{start_str}|{end_str}|{office_category}".encode()).hexdigest()[:8], 16)
+    rng = random.Random(seed)
+
+    start_date = datetime.strptime(start_str, "%Y%m%d")
+    end_date = datetime.strptime(end_str, "%Y%m%d")
+    days = (end_date - start_date).days + 1
+
+    articles = []
+    for idx in range(rng.randint(0, max_results)):
+        press_idx = rng.randrange(len(PRESSES))
+        published_date = start_date + timedelta(days=rng.randrange(days))
+        aid = f"{seed % 10 ** 6:06d}{idx:04d}"
+        articles.append({
+            "title": f"{query.strip(chr(34))} {rng.choice(TOPICS)} 관련 기사 {idx + 1}호",
+            "naver_url": f"https://n.news.naver.com/mnews/article/{OFFICE_IDS[press_idx]}/{aid}?sid=102",
+            "original_url": f"https://news.example.com/{OFFICE_IDS[press_idx]}/{aid}?utm_source=naver",
+            "source": PRESSES[press_idx],
+            "published": published_date.strftime("%Y.%m.%d."),
+            "image_url": f"https://search.pstatic.net/common/?src=mock%2F{aid}.jpg&type=f200_200&expire=2",
+        })
+    return articles
+
+
+class MockNaverState:
+    """모의 서버 설정과 요청 통계"""
+
+    def __init__(self, latency=0.0, jitter=0.0, max_results=120, markup="current",
+                 throttle_after=0, throttle_window=60, throttle_mode="429", record_dir=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.max_results = max_results
+        self.markup = markup
+        self.throttle_after = throttle_after  # 0이면 차단 없음
+        self.throttle_window = throttle_window
+        self.throttle_mode = throttle_mode  # 429 또는 captcha
+        self.record_dir = record_dir
+
+        self.lock = threading.Lock()
+        self.recent_requests = deque()
+        self.started_at = time.time()
+        self.total_requests = 0
+        self.throttled_requests = 0
+        self.result_pages = 0
+
+    def is_throttled(self):
+        """최근 요청 수가 한도를 넘었는지 확인하는 메서드"""
+        now = time.time()
+        with self.lock:
+            self.total_requests += 1
+            self.recent_requests.append(now)
+            while self.recent_requests and now - self.recent_requests[0] > self.throttle_window:
+                self.recent_requests.popleft()
+            throttled = bool(self.throttle_after) and len(self.recent_requests) > self.throttle_after
+            if throttled:
+                self.throttled_requests += 1
+            return throttled
+
+    def stats(self):
+        elapsed = time.time() - self.started_at
+        with self.lock:
+            return {
+                "total_requests": self.total_requests,
+                "throttled_requests": self.throttled_requests,
+                "result_pages": self.result_pages,
+                "elapsed_seconds": round(elapsed, 3),
+                "pages_per_second": round(self.result_pages / elapsed, 3) if elapsed else 0.0,
+            }
+
+
+def record_key(query, nso, start, office_category):
+    """녹화된 페이지 파일 이름 (검색 조건의 해시)"""
+    return hashlib.sha1(f"{query}|{nso}|{start}|{office_category}".encode()).hexdigest() + ".html"
+
+
+class MockNaverHandler(BaseHTTPRequestHandler):
+    """search.naver.com/search.naver 를 흉내 내는 요청 처리기"""
+
+    state = None  # MockNaverState (서버 생성 시 지정)
+
+    def log_message(self, format, *args):
+        pass  # 콘솔 출력 생략 (벤치마크 부하 감소)
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        state = self.state
+        parts = urlsplit(self.path)
+
+        if parts.path == "/stats":
+            self._send(200, json.dumps(state.stats()), "application/json")
+            return
+        if parts.path != "/search.naver":
+            self._send(404, "not found", "text/plain")
+            return
+
+        if state.latency or state.jitter:
+            time.sleep(max(0.0, state.latency + random.uniform(-state.jitter, state.jitter)))
+
+        if state.is_throttled():
+            if state.throttle_mode == "captcha":
+                self._send(200, render_captcha_page())
+            else:
+                self._send(429, "Too Many Requests", "text/plain")
+            return
+
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        query = params.get("query", "")
+        nso = params.get("nso", "")
+        start = int(params.get("start", "1"))
+        office_category = params.get("office_category", "")
+
+        # 녹화된 실제 페이지가 있으면 우선 사용
+        if state.record_dir:
+            recorded = os.path.join(state.record_dir, record_key(query, nso, start, office_category))
+            if os.path.exists(recorded):
+                with open(recorded, encoding="utf-8") as f:
+                    self._send(200, f.read())
+                with state.lock:
+                    state.result_pages += 1
+                return
+
+        match = NSO_PATTERN.search(nso)
+        if not match:
+            self._send(200, render_empty_page())
+            return
+
+        articles = generate_articles(query, match.group(1), match.group(2), office_category, state.max_results)
+        page_articles = articles[start - 1:start - 1 + 10]
+        if not page_articles:
+            self._send(200, render_empty_page())
+            return
+
+        with state.lock:
+            state.result_pages += 1
+        self._send(200, render_results_page(page_articles, state.markup))
+
+
+def create_server(host="127.0.0.1", port=8765, **state_options):
+    """모의 서버 생성 함수 (serve_forever는 호출하는 쪽에서 실행)"""
+    handler = type("BoundMockNaverHandler", (MockNaverHandler,), {"state": MockNaverState(**state_options)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 뉴스 검색 모의 서버 (오프라인 벤치마크용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 편차 (초)")
+    parser.add_argument("--max-results", type=int, default=120, help="검색 조건별 최대 결과 수 (페이지 깊이)")
+    parser.add_argument("--markup", choices=MARKUP_VARIANTS, default="current")
+    parser.add_argument("--throttle-after", type=int, default=0, help="윈도우당 허용 요청 수 (0: 제한 없음)")
+    parser.add_argument("--throttle-window", type=float, default=60)
+    parser.add_argument("--throttle-mode", choices=["429", "captcha"], default="429")
+    parser.add_argument("--record-dir", help="녹화된 검색 결과 HTML 디렉토리")
+    args = parser.parse_args()
+
+    server = create_server(
+        args.host, args.port,
+        latency=args.latency, jitter=args.jitter, max_results=args.max_results, markup=args.markup,
+        throttle_after=args.throttle_after, throttle_window=args.throttle_window,
+        throttle_mode=args.throttle_mode, record_dir=args.record_dir,
+    )
+    print(f"🧪 모의 네이버 서버 시작: http://{args.host}:{args.port}/search.naver")
+    print(f"   크롤러 연결: NAVER_SEARCH_URL=http://{args.host}:{args.port}/search.naver")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"📊 {json.dumps(server.RequestHandlerClass.state.stats(), ensure_ascii=False)}")
+        server.server_close()
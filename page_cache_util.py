@@ -0,0 +1,214 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+from url_canon_util import strip_tracking
+
+
+NSO_END_DATE_PATTERN = re.compile(r"to(\d{8})")
+
+DAY_SECONDS = 24 * 60 * 60
+
+
+def cache_key(url):
+    """쿼리 파라미터 순서 등을 정규화한 검색 URL의 해시"""
+    return hashlib.sha1(strip_tracking(url).encode("utf-8")).hexdigest()
+
+
+def window_end_date(url):
+    """검색 URL의 nso 날짜 구간 종료일 (없으면 None)"""
+    nso = parse_qs(urlsplit(url).query).get("nso", [""])[0]
+    match = NSO_END_DATE_PATTERN.search(nso)
+    return datetime.strptime(match.group(1), "%Y%m%d") if match else None
+
+
+class PageCache:
+    """검색 결과 페이지 HTML을 zlib 압축해 디스크에 저장하는 캐시
+
+    - 키: 정규화한 검색 URL
+    - TTL: 구간 종료일이 historical_after_days 보다 오래된 과거 구간은 길게, 최근 구간은 짧게
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+    - HTTP로 가져올 때는 ETag/Last-Modified로 조건부 재검증 (Selenium은 헤더를 알 수 없어 TTL만 사용)
+    """
+
+    def __init__(self, directory="cache/pages", max_bytes=512 * 1024 * 1024, recent_ttl=6 * 60 * 60,
+                 historical_ttl=180 * DAY_SECONDS, historical_after_days=7):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.recent_ttl = recent_ttl
+        self.historical_ttl = historical_ttl
+        self.historical_after_days = historical_after_days
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(directory, "index.sqlite"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages (last_access)")
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.html.z")
+
+    def ttl_for(self, url):
+        """URL의 날짜 구간에 맞는 TTL(초)"""
+        end_date = window_end_date(url)
+        if end_date and (datetime.now() - end_date).days > self.historical_after_days:
+            return self.historical_ttl
+        return self.recent_ttl
+
+    def _row(self, url):
+        return self.conn.execute(
+            "SELECT key, etag, last_modified, fetched_at FROM pages WHERE key = ?", (cache_key(url),)).fetchone()
+
+    def is_fresh(self, url):
+        """TTL 안의 캐시 항목이 있는지 확인하는 메서드 (파일은 읽지 않음)"""
+        with self.lock:
+            row = self._row(url)
+        return row is not None and time.time() - row[3] < self.ttl_for(url)
+
+    def get(self, url, allow_stale=False):
+        """캐시된 HTML을 반환하는 메서드 (없거나 만료면 None)"""
+        with self.lock:
+            row = self._row(url)
+            if row is None or (not allow_stale and time.time() - row[3] >= self.ttl_for(url)):
+                self.misses += 1
+                return None
+            key = row[0]
+            try:
+                with open(self._path(key), "rb") as f:
+                    page_source = zlib.decompress(f.read()).decode("utf-8")
+            except (OSError, zlib.error):
+                self.conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+                self.conn.commit()
+                self.misses += 1
+                return None
+
+            self.conn.execute("UPDATE pages SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+            self.hits += 1
+            return page_source
+
+    def validators(self, url):
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        with self.lock:
+            row = self._row(url)
+        headers = {}
+        if row and row[1]:
+            headers["If-None-Match"] = row[1]
+        if row and row[2]:
+            headers["If-Modified-Since"] = row[2]
+        return headers
+
+    def put(self, url, page_source, etag=None, last_modified=None):
+        """HTML을 압축해 저장하고 크기 한도를 넘으면 LRU로 정리하는 메서드"""
+        key = cache_key(url)
+        data = zlib.compress(page_source.encode("utf-8"), 6)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO pages (key, url, size, etag, last_modified, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET size = excluded.size, etag = excluded.etag, "
+                "last_modified = excluded.last_modified, fetched_at = excluded.fetched_at, "
+                "last_access = excluded.last_access",
+                (key, url, len(data), etag, last_modified, now, now),
+            )
+            self.conn.commit()
+            self._evict()
+
+    def revalidated(self, url):
+        """304 응답을 받은 항목의 TTL을 새로 시작하는 메서드"""
+        now = time.time()
+        with self.lock:
+            self.conn.execute("UPDATE pages SET fetched_at = ?, last_access = ? WHERE key = ?",
+                              (now, now, cache_key(url)))
+            self.conn.commit()
+
+    def _evict(self):
+        (total,) = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        removed = []
+        for key, size in self.conn.execute("SELECT key, size FROM pages ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            removed.append(key)
+            total -= size
+
+        self.conn.executemany("DELETE FROM pages WHERE key = ?", [(key,) for key in removed])
+        self.conn.commit()
+        for key in removed:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self.lock:
+            count, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages").fetchone()
+        return {"entries": count, "bytes": total, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        self.conn.close()
+
+
+def cached_http_get(session, url, cache, timeout=10, cacheable=None):
+    """requests 세션으로 검색 페이지를 가져오되 캐시와 조건부 재검증을 사용하는 함수
+
+    TTL 안의 항목은 그대로 쓰고, 없거나 만료됐으면 revalidating_http_get으로 요청한다.
+    반환값: (HTML, 출처) - 출처는 'cache' / 'revalidated' / 'network'
+    """
+    page_source = cache.get(url)
+    if page_source is not None:
+        return page_source, "cache"
+    return revalidating_http_get(session, url, cache, timeout, cacheable)
+
+
+def revalidating_http_get(session, url, cache, timeout=10, cacheable=None):
+    """만료된 캐시 항목의 ETag/Last-Modified로 조건부 요청을 보내는 함수 (304면 캐시 본문 재사용)
+
+    새로 받은 HTML은 cacheable(HTML)이 True일 때만 응답 헤더와 함께 저장한다 (결과가 있는 페이지만 캐시 -
+    캡차/빈 페이지를 저장하면 과거 구간은 TTL 동안 계속 차단 화면을 돌려줌).
+    cacheable이 없으면 저장하지 않으므로 호출한 쪽이 페이지를 판별한 뒤 cache.put 한다.
+    반환값: (HTML, 출처) - 출처는 'revalidated' / 'network'
+    """
+    response = session.get(url, headers=cache.validators(url), timeout=timeout)
+    if response.status_code == 304:
+        page_source = cache.get(url, allow_stale=True)
+        if page_source is not None:
+            cache.revalidated(url)
+            return page_source, "revalidated"
+        response = session.get(url, timeout=timeout)  # 본문이 사라졌으면 무조건 다시 요청
+
+    response.raise_for_status()
+    if cacheable is not None and cacheable(response.text):
+        cache.put(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return response.text, "network"
@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+
+
+# 페이지 분류 결과
+PAGE_RESULTS = "results"  # 뉴스 카드가 있음
+PAGE_EMPTY = "empty"      # 정상적인 '검색결과 없음' 페이지
+PAGE_BLOCKED = "blocked"  # 캡차/접근 제한 화면
+PAGE_ERROR = "error"      # 그 외 (로딩 실패, 알 수 없는 구조)
+
+BLOCK_MARKERS = (
+    "captcha", "자동입력 방지", "보안 확인", "비정상적인 검색", "비정상적인 접근",
+    "일시적으로 제한", "unusual traffic", "too many requests",
+)
+EMPTY_MARKERS = ("api_noresult", "검색결과가 없습니다", "검색 결과가 없습니다")
+
+
+class PageBlockedError(Exception):
+    """검색 결과 대신 캡차/차단 화면을 받았을 때 발생"""
+
+
+class PageLoadError(Exception):
+    """결과도, '검색결과 없음'도 아닌 페이지를 받았을 때 발생"""
+
+
+def classify_page(page_source, card_count):
+    """카드 수와 HTML로 페이지 종류(PAGE_*)를 판별하는 함수"""
+    if card_count:
+        return PAGE_RESULTS
+
+    lowered = (page_source or "").lower()
+    if any(marker in lowered for marker in BLOCK_MARKERS):
+        return PAGE_BLOCKED
+    if any(marker in lowered for marker in EMPTY_MARKERS):
+        return PAGE_EMPTY
+    return PAGE_ERROR
+
+
+class CircuitBreaker:
+    """차단이 감지되면 크롤링 전체를 잠시 멈추는 회로 차단기
+
+    연속으로 차단될 때마다 대기 시간을 base_cooldown부터 두 배씩 늘리고(최대 max_cooldown),
+    정상 페이지를 받으면 초기화한다. shared_queue(SQLiteWorkQueue)를 주면 일시 정지 시각을
+    큐에 기록해서 같은 큐를 쓰는 다른 워커들도 함께 멈춘다.
+    """
+
+    def __init__(self, base_cooldown=60, max_cooldown=3600, max_consecutive_blocks=8, logger=None,
+                 shared_queue=None, clock=time.time, sleep=time.sleep):
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.max_consecutive_blocks = max_consecutive_blocks
+        self.logger = logger or logging.getLogger('naver_crawler')
+        self.shared_queue = shared_queue
+        self.clock = clock
+        self.sleep = sleep
+
+        self.lock = threading.Lock()
+        self.consecutive_blocks = 0
+        self.open_until = 0
+        self.total_blocks = 0
+
+    def record_block(self, reason=""):
+        """차단 감지 시 호출: 회로를 열고 재시도 가능 여부를 반환하는 메서드
+
+        연속 차단이 max_consecutive_blocks를 넘으면 False (더 기다려도 소용없다고 판단)
+        """
+        with self.lock:
+            self.consecutive_blocks += 1
+            self.total_blocks += 1
+            cooldown = min(self.base_cooldown * 2 ** (self.consecutive_blocks - 1), self.max_cooldown)
+            self.open_until = max(self.open_until, self.clock() + cooldown)
+            open_until = self.open_until
+            consecutive = self.consecutive_blocks
+
+        self.logger.warning(f"🚫 차단 감지 ({reason}) - {cooldown:.0f}초 동안 전체 일시 정지 "
+                            f"(연속 {consecutive}회)")
+        if self.shared_queue is not None:
+            self.shared_queue.pause_until(open_until, reason)
+        return consecutive <= self.max_consecutive_blocks
+
+    def record_success(self):
+        with self.lock:
+            self.consecutive_blocks = 0
+
+    def remaining(self):
+        """회로가 닫힐 때까지 남은 시간(초)"""
+        open_until = self.open_until
+        if self.shared_queue is not None:
+            open_until = max(open_until, self.shared_queue.paused_until())
+        return max(0, open_until - self.clock())
+
+    def wait_if_open(self):
+        """회로가 열려 있으면 닫힐 때까지 기다리는 메서드"""
+        remaining = self.remaining()
+        while remaining > 0:
+            self.logger.info(f"⏸️ 회로 차단 중 - {remaining:.0f}초 대기")
+            self.sleep(remaining)
+            remaining = self.remaining()
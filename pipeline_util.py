@@ -0,0 +1,399 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import extract_factor_util as extract_util
+import published_util
+from crawl_util import create_driver, iter_date_windows, build_search_url, extract_news_cards, DEFAULT_OFFICE_CATEGORY
+from article_store_util import ArticleStore
+from url_canon_util import UrlCanonicalizer, add_canonical_urls
+from html_card_util import parse_page_html
+from retry_util import RetryPolicy
+from page_guard_util import classify_page, CircuitBreaker, PAGE_RESULTS, PAGE_BLOCKED, PAGE_ERROR
+from tab_pool_util import TabPool
+
+
+# 파싱 프로세스 안에서는 카드별 로그를 남기지 않음 (부모 로거는 프로세스 간 공유 불가)
+_PARSE_LOGGER = logging.getLogger("naver_crawler.parse")
+_PARSE_LOGGER.addHandler(logging.NullHandler())
+_PARSE_LOGGER.propagate = False
+
+_STOP = object()
+
+# 구간별로 파싱 결과를 보고 정하는 다음 동작
+_NEXT_PAGE = "next"
+_SAME_PAGE = "retry"
+_WINDOW_DONE = "done"
+
+
+def parse_page_source(url, page, page_source):
+    """페이지 HTML에서 (페이지 종류, 카드 수, Article 리스트)를 추출하는 함수 (파싱 프로세스에서 실행)"""
+    news_cards = extract_util.find_elements_intelligently(parse_page_html(page_source))
+    if not news_cards:
+        return classify_page(page_source, 0), 0, []
+    return PAGE_RESULTS, len(news_cards), extract_news_cards(news_cards, url, page, _PARSE_LOGGER)
+
+
+class FetchedPage:
+    """fetch 단계가 parse 단계로 넘기는 페이지 HTML
+
+    parsed는 parse 단계가 (페이지 종류, 카드 수)를 채우는 Future로, fetch 단계는
+    이 값을 보고 같은 구간의 다음 페이지를 요청할지(또는 차단 후 재요청할지) 정한다.
+    """
+
+    __slots__ = ("window_idx", "page", "url", "page_source", "from_cache", "parsed")
+
+    def __init__(self, window_idx, page, url, page_source, from_cache=False):
+        self.window_idx = window_idx
+        self.page = page
+        self.url = url
+        self.page_source = page_source
+        self.from_cache = from_cache
+        self.parsed = Future()
+
+
+class CrawlPipeline:
+    """fetch → parse → write 단계를 크기 제한 큐로 연결한 크롤링 파이프라인
+
+    - fetch: 스레드마다 크롬 드라이버 하나, 날짜 구간 단위로 페이지를 넘기며 HTML만 수집
+      (tabs_per_browser > 1 이면 드라이버마다 탭 여러 개로 여러 구간을 동시에 진행)
+    - parse: 프로세스 풀에서 html_card_util + extract_factor_util로 카드 추출
+    - write: 단일 스레드에서 URL 정규화(선택)와 발행일 변환 후 write_batch_size 건씩 기사 저장소에 반영하고 결과를 모음
+      (중간에 멈춰도 그때까지의 기사는 저장소에 남음 - run() 뒤 save_results는 CSV만 저장)
+
+    큐가 가득 차면 앞 단계가 기다리므로 느린 단계가 메모리를 무한정 쓰지 않는다.
+    """
+
+    def __init__(self, logger, rate_limiter, fetch_workers=2, parse_workers=None, queue_size=8,
+                 page_sleep=3, driver_factory=create_driver, store_path="results/articles.sqlite",
+                 canonicalize_urls=False, write_batch_size=200, thumbnail_downloader=None, page_cache=None, circuit_breaker=None, retry_policy=None,
+                 dead_letters=None, tabs_per_browser=1, tab_load_timeout=30):
+        self.logger = logger
+        self.rate_limiter = rate_limiter
+        self.fetch_workers = fetch_workers
+        self.tabs_per_browser = tabs_per_browser
+        self.tab_load_timeout = tab_load_timeout
+        self.parse_workers = parse_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.page_sleep = page_sleep
+        self.driver_factory = driver_factory
+        self.store_path = store_path
+        self.canonicalize_urls = canonicalize_urls
+        self.write_batch_size = write_batch_size
+        self.thumbnail_downloader = thumbnail_downloader
+        self.page_cache = page_cache
+        # 한 fetcher가 차단을 감지하면 모든 fetcher가 함께 멈춤
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(logger=logger)
+        self.retry_policy = retry_policy or RetryPolicy(logger=logger)
+        self.dead_letters = dead_letters
+
+        self.window_queue = queue.Queue()
+        self.page_queue = queue.Queue(maxsize=queue_size)
+        self.record_queue = queue.Queue(maxsize=queue_size)
+        self.page_results = {}  # (window_idx, page) -> [Article]
+        # 마지막 페이지까지 수집한 구간 (시작, 끝) - 결과를 저장한 뒤 수집 범위 인덱스에 기록
+        self.completed_windows = []
+        self.stats = {"pages": 0, "records": 0, "fetch_errors": 0, "parse_errors": 0, "blocked": 0,
+                      "store_errors": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    # --- fetch ---
+
+    def _start_driver(self):
+        """fetch 워커의 드라이버를 만드는 메서드 (실패하면 기록하고 None 반환 - 다른 워커는 계속 진행)"""
+        try:
+            return self.driver_factory()
+        except Exception as e:
+            self.logger.error(f"❌ 드라이버 생성 실패 ({threading.current_thread().name}): {e}")
+            self._count("fetch_errors")
+            return None
+
+    def _fetch_html(self, driver, window_idx, page, url):
+        self.circuit_breaker.wait_if_open()
+        self.rate_limiter.wait_if_needed()
+        driver.get(url)
+        time.sleep(self.page_sleep)
+        return FetchedPage(window_idx, page, url, driver.page_source)
+
+    def _give_up(self, keyword, office_category, start_str, end_str, page, url, error):
+        self.logger.error(f"❌ 페이지 요청 실패: {url} ({error})")
+        self._count("fetch_errors")
+        if self.dead_letters is not None:
+            self.dead_letters.add("search_page", {
+                "keyword": keyword,
+                "office_category": office_category,
+                "start_date": start_str,
+                "end_date": end_str,
+                "page": page,
+            }, error, self.retry_policy.max_attempts)
+
+    def _after_parse(self, fetched, start_str, end_str):
+        """파싱 결과(카드 수)로 같은 구간의 다음 동작(_NEXT_PAGE / _SAME_PAGE / _WINDOW_DONE)을 정하는 메서드"""
+        page_kind, card_count = fetched.parsed.result()
+        if page_kind == PAGE_BLOCKED:
+            self._count("blocked")
+            if not self.circuit_breaker.record_block(fetched.url):
+                self.logger.error(f"❌ 차단이 계속됨 - {start_str}~{end_str} 구간 중단")
+                return _WINDOW_DONE
+            return _SAME_PAGE  # 대기 후 같은 페이지 재요청
+        if page_kind == PAGE_ERROR:
+            self.logger.error(f"❌ 알 수 없는 페이지: {fetched.url} - 구간 {start_str}~{end_str}의 나머지 페이지 건너뜀")
+            return _WINDOW_DONE
+
+        self.circuit_breaker.record_success()
+        if card_count < 8:
+            self.logger.info(f"✅ {start_str} to {end_str} 뉴스 수집 완료")
+            self.completed_windows.append((start_str, end_str))
+            return _WINDOW_DONE
+        return _NEXT_PAGE
+
+    def _fetch_worker(self, keyword, office_category):
+        if self.tabs_per_browser > 1:
+            return self._tab_fetch_worker(keyword, office_category)
+
+        driver = self._start_driver()
+        if driver is None:
+            return
+        try:
+            while True:
+                try:
+                    window_idx, start_str, end_str = self.window_queue.get_nowait()
+                except queue.Empty:
+                    return
+                self.logger.info(f"📄 {start_str}부터 {end_str}까지의 뉴스 수집 시작")
+
+                page = 1
+                while True:
+                    url = build_search_url(keyword, start_str, end_str, page, office_category)
+                    cached_source = self.page_cache.get(url) if self.page_cache else None
+                    try:
+                        if cached_source is not None:
+                            fetched = FetchedPage(window_idx, page, url, cached_source, from_cache=True)
+                        else:
+                            fetched = self.retry_policy.call(self._fetch_html, driver, window_idx, page, url,
+                                                             description=f"{start_str}~{end_str} 페이지 {page}")
+                    except Exception as e:
+                        self._give_up(keyword, office_category, start_str, end_str, page, url, e)
+                        break
+
+                    self.page_queue.put(fetched)  # 파싱이 밀리면 여기서 대기
+
+                    # 파싱 결과(카드 수)를 받아야 다음 페이지 여부를 알 수 있음
+                    action = self._after_parse(fetched, start_str, end_str)
+                    if action == _WINDOW_DONE:
+                        break
+                    if action == _NEXT_PAGE:
+                        page += 1
+        finally:
+            driver.quit()
+
+    def _tab_fetch_worker(self, keyword, office_category, poll_interval=0.2):
+        """브라우저 하나의 탭 K개로 구간 K개를 동시에 진행하는 fetch 워커
+
+        구간 안에서는 앞 페이지의 카드 수를 알아야 다음 페이지로 가므로, 탭마다 서로 다른 구간을 맡는다.
+        한 탭이 렌더링을 기다리거나 파싱 결과를 기다리는 동안 다른 탭이 로딩된다.
+        """
+        driver = self._start_driver()
+        if driver is None:
+            return
+        try:
+            tab_pool = TabPool(driver, self.tabs_per_browser, render_wait=self.page_sleep,
+                               load_timeout=self.tab_load_timeout)
+        except Exception as e:
+            self.logger.error(f"❌ 탭 열기 실패: {e}")
+            self._count("fetch_errors")
+            driver.quit()
+            return
+        windows = {}  # window_idx -> 진행 상태
+
+        def record_failure(state, error):
+            # 재시도 간격은 RetryPolicy.call과 같게 - 다른 탭은 그동안 계속 진행
+            state["attempts"] += 1
+            state["error"] = error
+            if state["attempts"] < self.retry_policy.max_attempts:
+                delay = self.retry_policy.delay(state["attempts"] - 1)
+                state["retry_at"] = time.time() + delay
+                self.logger.warning(f"🔁 {state['start']}~{state['end']} 페이지 {state['page']} 실패 ({error}) - "
+                                    f"{delay:.1f}초 후 재시도 ({state['attempts']}/{self.retry_policy.max_attempts})")
+
+        try:
+            while True:
+                # 1) 탭 수만큼 구간 배정
+                while len(windows) < self.tabs_per_browser:
+                    try:
+                        window_idx, start_str, end_str = self.window_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self.logger.info(f"📄 {start_str}부터 {end_str}까지의 뉴스 수집 시작")
+                    windows[window_idx] = {"start": start_str, "end": end_str, "page": 1, "attempts": 0,
+                                           "retry_at": 0, "loading": False, "parsing": None}
+                if not windows:
+                    return
+
+                # 2) 요청할 페이지가 있는 구간은 빈 탭에서 이동 시작 (캐시에 있으면 바로 파싱으로)
+                progressed = False
+                for window_idx, state in windows.items():
+                    if state["loading"] or state["parsing"] or state["retry_at"] > time.time():
+                        continue
+                    url = build_search_url(keyword, state["start"], state["end"], state["page"], office_category)
+                    cached_source = self.page_cache.get(url) if self.page_cache else None
+                    if cached_source is not None:
+                        state["parsing"] = FetchedPage(window_idx, state["page"], url, cached_source, from_cache=True)
+                        self.page_queue.put(state["parsing"])
+                    elif tab_pool.idle_count():
+                        self.circuit_breaker.wait_if_open()
+                        self.rate_limiter.wait_if_needed()
+                        try:
+                            tab_pool.navigate(window_idx, url)
+                            state["loading"] = True
+                        except Exception as e:
+                            record_failure(state, e)
+                    else:
+                        continue
+                    progressed = True
+
+                # 3) 다 불러온 탭의 HTML을 파싱 단계로
+                for window_idx, url, page_source, error in tab_pool.poll():
+                    state = windows[window_idx]
+                    state["loading"] = False
+                    progressed = True
+                    if error is None:
+                        state["parsing"] = FetchedPage(window_idx, state["page"], url, page_source)
+                        self.page_queue.put(state["parsing"])
+                    else:
+                        record_failure(state, error)
+
+                # 4) 파싱이 끝난 구간은 다음 페이지 / 같은 페이지 재요청 / 종료 결정
+                for window_idx, state in list(windows.items()):
+                    if state["attempts"] >= self.retry_policy.max_attempts:
+                        url = build_search_url(keyword, state["start"], state["end"], state["page"], office_category)
+                        self._give_up(keyword, office_category, state["start"], state["end"], state["page"], url,
+                                      state["error"])
+                        del windows[window_idx]
+                        continue
+                    fetched = state["parsing"]
+                    if fetched is None or not fetched.parsed.done():
+                        continue
+                    state["parsing"] = None
+                    progressed = True
+                    action = self._after_parse(fetched, state["start"], state["end"])
+                    if action == _WINDOW_DONE:
+                        del windows[window_idx]
+                    elif action == _NEXT_PAGE:
+                        state["page"] += 1
+                        state["attempts"] = 0
+
+                if not progressed:
+                    # 로딩 중인 탭이 없으면 파싱 결과가 나올 때까지, 있으면 잠깐 기다렸다가 다시 확인
+                    pending = [state["parsing"].parsed for state in windows.values() if state["parsing"]]
+                    if pending and not tab_pool.busy():
+                        wait(pending, timeout=poll_interval * 5, return_when=FIRST_COMPLETED)
+                    else:
+                        time.sleep(poll_interval)
+        finally:
+            tab_pool.close()
+            driver.quit()
+
+    # --- parse ---
+
+    def _parse_worker(self, pool):
+        while True:
+            fetched = self.page_queue.get()
+            if fetched is _STOP:
+                return
+            try:
+                page_kind, card_count, records = pool.submit(
+                    parse_page_source, fetched.url, fetched.page, fetched.page_source).result()
+            except Exception as e:
+                self.logger.error(f"❌ 페이지 파싱 실패: {fetched.url} ({e})")
+                self._count("parse_errors")
+                page_kind, card_count, records = PAGE_ERROR, 0, []
+
+            # 결과가 있는 페이지만 캐시 (빈 페이지는 차단 화면일 수 있음)
+            if self.page_cache and card_count and not fetched.from_cache:
+                self.page_cache.put(fetched.url, fetched.page_source)
+
+            fetched.parsed.set_result((page_kind, card_count))
+            self._count("pages")
+            self.logger.info(f"📄 구간 {fetched.window_idx + 1} 페이지 {fetched.page}: 카드 {card_count}개")
+            if records:
+                self.record_queue.put((fetched.window_idx, fetched.page, records))
+
+    # --- write ---
+
+    def _flush_store(self, store, pending):
+        if not store or not pending:
+            return
+        try:
+            store.write_results(pending)
+        except Exception as e:
+            self.logger.error(f"❌ 기사 저장소 반영 중 오류 발생: {e}")
+            self._count("store_errors")
+
+    def _write_worker(self):
+        store = ArticleStore(self.store_path) if self.store_path else None
+        canonicalizer = UrlCanonicalizer(logger=self.logger) if self.canonicalize_urls else None
+        pending = []
+        try:
+            while True:
+                item = self.record_queue.get()
+                if item is _STOP:
+                    self._flush_store(store, pending)
+                    return
+                window_idx, page, records = item
+
+                # 저장소에도 CSV와 같은 canonical_url/published_at이 들어가도록 반영 전에 변환
+                if canonicalizer:
+                    add_canonical_urls(records, canonicalizer)
+                published_util.add_published_at(records)
+                if self.thumbnail_downloader:
+                    for record in records:
+                        self.thumbnail_downloader.submit(record["image_url"])
+
+                pending.extend(records)
+                if len(pending) >= self.write_batch_size:
+                    self._flush_store(store, pending)
+                    pending = []
+
+                self.page_results[(window_idx, page)] = records
+                self._count("records", len(records))
+        finally:
+            if canonicalizer:
+                canonicalizer.close()
+            if store:
+                store.close()
+
+    def run(self, keyword, start_date_str, end_date_str, office_category=DEFAULT_OFFICE_CATEGORY, window_days=7):
+        """전체 구간을 수집해 (구간, 페이지) 순서로 정렬된 결과 리스트를 반환하는 메서드"""
+        for window_idx, (start_str, end_str) in enumerate(iter_date_windows(start_date_str, end_date_str, window_days)):
+            self.window_queue.put((window_idx, start_str, end_str))
+
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            writer = threading.Thread(target=self._write_worker, name="pipeline-writer", daemon=True)
+            parsers = [threading.Thread(target=self._parse_worker, args=(pool,), name=f"pipeline-parser-{i}", daemon=True)
+                       for i in range(self.parse_workers)]
+            fetchers = [threading.Thread(target=self._fetch_worker, args=(keyword, office_category),
+                                         name=f"pipeline-fetcher-{i}", daemon=True)
+                        for i in range(self.fetch_workers)]
+            for thread in [writer] + parsers + fetchers:
+                thread.start()
+
+            for thread in fetchers:
+                thread.join()
+            for _ in parsers:
+                self.page_queue.put(_STOP)
+            for thread in parsers:
+                thread.join()
+            self.record_queue.put(_STOP)
+            writer.join()
+
+        self.logger.info(f"📊 파이프라인 완료: 페이지 {self.stats['pages']}개, 기사 {self.stats['records']}건, "
+                         f"요청 실패 {self.stats['fetch_errors']}회, 파싱 실패 {self.stats['parse_errors']}회, "
+                         f"차단 {self.stats['blocked']}회, 저장소 오류 {self.stats['store_errors']}회")
+        return [record for key in sorted(self.page_results) for record in self.page_results[key]]
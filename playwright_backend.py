@@ -0,0 +1,277 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+import extract_factor_util as extract_util
+from crawl_util import (
+    setup_logging, iter_date_windows, build_search_url, save_results, format_duration,
+    DEFAULT_OFFICE_CATEGORY, OFFICE_CATEGORY_NAMES,
+)
+from html_card_util import parse_page_html
+from pipeline_util import parse_page_source
+from page_guard_util import CircuitBreaker, PageBlockedError, PageLoadError, PAGE_BLOCKED, PAGE_ERROR
+from retry_util import RetryPolicy, DeadLetterQueue
+from rate_limiter_util import ImprovedRateLimiter
+from url_canon_util import DEFAULT_HEADERS
+
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+except ImportError:  # playwright가 없으면 이 백엔드만 쓸 수 없음 (pip install playwright && playwright install chromium)
+    async_playwright = None
+    PlaywrightTimeoutError = None
+
+
+# 카드 필드는 텍스트/링크만 쓰므로 무거운 리소스는 받지 않음
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# 스크립트가 뉴스 카드 컨테이너를 그릴 때까지 기다릴 셀렉터 (extract_factor_util과 같은 패턴)
+CARD_CONTAINER_SELECTOR = ", ".join(extract_util.CONTAINER_PATTERNS)
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class PlaywrightBrowser:
+    """Chromium 프로세스 하나에서 격리된 브라우저 컨텍스트를 여러 개 여는 비동기 브라우저
+
+    컨텍스트는 쿠키/캐시가 분리된 가벼운 세션이라 크롬 프로세스를 늘리지 않고 동시에 여러 페이지를 열 수 있다.
+    """
+
+    def __init__(self, headless=True, block_resources=True, timeout=30, render_timeout=10):
+        if async_playwright is None:
+            raise RuntimeError("playwright가 설치되어 있지 않습니다 (pip install playwright && playwright install chromium)")
+        self.headless = headless
+        self.block_resources = block_resources
+        self.timeout = timeout
+        self.render_timeout = render_timeout
+        self._playwright = None
+        self._browser = None
+        self._contexts = []
+
+    async def start(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return self
+
+    async def new_page(self):
+        """새 컨텍스트 하나에 페이지를 열어 반환하는 메서드"""
+        context = await self._browser.new_context(
+            user_agent=DEFAULT_HEADERS["User-Agent"], locale="ko-KR", viewport={"width": 1200, "height": 900})
+        if self.block_resources:
+            await context.route("**/*", _block_heavy_resources)
+        self._contexts.append(context)
+        return await context.new_page()
+
+    async def fetch(self, page, url):
+        """url로 이동해 뉴스 카드 컨테이너가 렌더링된 뒤의 HTML(page.content())을 반환하는 메서드
+
+        차단 화면이나 '검색결과 없음' 페이지에는 컨테이너가 없으므로 render_timeout이 지나면
+        그때까지의 HTML을 넘기고 판별은 파싱 단계(classify_page)에 맡긴다.
+        """
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout * 1000)
+        if response is not None and response.status >= 400:
+            raise PageLoadError(f"HTTP {response.status}: {url}")
+        try:
+            await page.wait_for_selector(CARD_CONTAINER_SELECTOR, state="attached",
+                                         timeout=self.render_timeout * 1000)
+        except PlaywrightTimeoutError:
+            pass
+        return await page.content()
+
+    async def close(self):
+        for context in self._contexts:
+            await context.close()
+        self._contexts = []
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+
+class PlaywrightDriver:
+    """PlaywrightBrowser 페이지 하나를 Selenium 드라이버처럼 쓰는 동기 어댑터
+
+    crawl_search_page / iter_news에 넘길 수 있도록 get / page_source / find_element(s) / quit만 제공하고,
+    카드 탐색은 page.content()를 html_card_util로 파싱한 결과에서 한다 (extract_factor_util 함수 그대로 사용).
+    """
+
+    # fetch가 카드 컨테이너 렌더링까지 기다리므로 추가 대기 없음
+    page_load_wait = 0
+
+    def __init__(self, headless=True, block_resources=True, timeout=30, render_timeout=10):
+        self.browser = PlaywrightBrowser(headless, block_resources, timeout, render_timeout)
+        self.loop = asyncio.new_event_loop()
+        self.loop.run_until_complete(self.browser.start())
+        self.page = self.loop.run_until_complete(self.browser.new_page())
+        self.page_source = ""
+        self.current_url = None
+        self._root = parse_page_html("")
+
+    def get(self, url):
+        self.page_source = self.loop.run_until_complete(self.browser.fetch(self.page, url))
+        self.current_url = url
+        self._root = parse_page_html(self.page_source)
+
+    def find_element(self, by, value):
+        return self._root.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self._root.find_elements(by, value)
+
+    def quit(self):
+        self.loop.run_until_complete(self.browser.close())
+        self.loop.close()
+
+
+async def crawl_async(keyword, start_date_str, end_date_str, logger, office_category=DEFAULT_OFFICE_CATEGORY,
+                      window_days=7, contexts=8, rate_limiter=None, circuit_breaker=None, retry_policy=None,
+                      dead_letters=None, completed_windows=None, browser=None):
+    """날짜 구간들을 컨텍스트 여러 개로 동시에 수집해 (구간, 페이지) 순서의 결과 리스트를 반환하는 함수
+
+    컨텍스트마다 구간 하나를 맡아 페이지를 차례로 넘긴다 (다음 페이지 여부는 앞 페이지 카드 수로 판단).
+    속도 제한기/회로 차단기/재시도/데드레터는 다른 수집 경로와 같은 규칙을 따른다.
+    마지막 페이지까지 수집한 구간은 completed_windows에 (시작, 끝)으로 추가한다 (iter_news와 같음).
+    rate_limiter를 주지 않으면 컨텍스트 수와 무관하게 기본 한도(1분에 10회)를 모든 컨텍스트가 나눠 쓴다.
+    """
+    rate_limiter = rate_limiter or ImprovedRateLimiter(max_requests=10, time_window=60, logger=logger)
+    circuit_breaker = circuit_breaker or CircuitBreaker(logger=logger)
+    retry_policy = retry_policy or RetryPolicy(logger=logger)
+    own_browser = browser is None
+    if own_browser:
+        browser = await PlaywrightBrowser().start()
+
+    windows = asyncio.Queue()
+    for window in enumerate(iter_date_windows(start_date_str, end_date_str, window_days)):
+        windows.put_nowait(window)
+    page_results = {}  # (window_idx, page) -> [Article]
+
+    async def fetch_and_parse(page, url, page_no):
+        html = await browser.fetch(page, url)
+        # 파싱은 CPU 작업이므로 다른 컨텍스트의 네트워크 대기를 막지 않도록 스레드에서
+        page_kind, card_count, records = await asyncio.to_thread(parse_page_source, url, page_no, html)
+        if page_kind == PAGE_BLOCKED:
+            raise PageBlockedError(f"차단 화면 (페이지 {page_no}): {url}")
+        if page_kind == PAGE_ERROR:
+            raise PageLoadError(f"알 수 없는 페이지 (페이지 {page_no}): {url}")
+        return card_count, records
+
+    async def fetch_page(page, url, page_no, description):
+        """페이지 하나를 받아 파싱하는 함수 - 알 수 없는 페이지(PAGE_ERROR)도 재시도, 차단은 바로 올림"""
+        for attempt in range(1, retry_policy.max_attempts + 1):
+            while circuit_breaker.remaining() > 0:
+                await asyncio.sleep(circuit_breaker.remaining())
+            # 속도 제한기는 스레드용(블로킹)이므로 이벤트 루프 밖에서 대기
+            await asyncio.to_thread(rate_limiter.wait_if_needed)
+            try:
+                return await fetch_and_parse(page, url, page_no)
+            except PageBlockedError:
+                raise
+            except Exception as e:
+                if attempt >= retry_policy.max_attempts:
+                    logger.error(f"❌ 재시도 {retry_policy.max_attempts}회 모두 실패: {description} ({e})")
+                    raise
+                delay = retry_policy.delay(attempt - 1)
+                logger.warning(f"🔁 {description} 실패 ({e}) - {delay:.1f}초 후 재시도 "
+                               f"({attempt}/{retry_policy.max_attempts})")
+                await asyncio.sleep(delay)
+
+    def give_up(start_str, end_str, page_no, error, attempts):
+        if dead_letters is not None:
+            dead_letters.add("search_page", {
+                "keyword": keyword,
+                "office_category": office_category,
+                "start_date": start_str,
+                "end_date": end_str,
+                "page": page_no,
+            }, error, attempts)
+        logger.error(f"❌ {error} - 구간 {start_str}~{end_str}의 나머지 페이지 건너뜀")
+
+    async def worker():
+        page = await browser.new_page()
+        while True:
+            try:
+                window_idx, (start_str, end_str) = windows.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            logger.info(f"📄 {start_str}부터 {end_str}까지의 뉴스 수집 시작")
+
+            page_no = 1
+            while True:
+                url = build_search_url(keyword, start_str, end_str, page_no, office_category)
+                logger.info(f"🌐 접속 URL: {url}")
+                try:
+                    card_count, records = await fetch_page(page, url, page_no,
+                                                           f"{start_str}~{end_str} 페이지 {page_no}")
+                except PageBlockedError as e:
+                    if circuit_breaker.record_block(url):
+                        continue  # 대기 후 같은 페이지 재요청
+                    logger.error(f"❌ 차단이 계속됨 - {start_str}~{end_str} 구간 중단")
+                    give_up(start_str, end_str, page_no, e, 1)
+                    break
+                except Exception as e:
+                    give_up(start_str, end_str, page_no, e, retry_policy.max_attempts)
+                    break
+
+                circuit_breaker.record_success()
+                logger.info(f"✅ {card_count}개의 뉴스 카드 발견!")
+                page_results[(window_idx, page_no)] = records
+                if card_count < 8:
+                    logger.info(f"✅ {start_str} to {end_str} 뉴스 수집 완료")
+                    if completed_windows is not None:
+                        completed_windows.append((start_str, end_str))
+                    break
+                page_no += 1
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(contexts)))
+    finally:
+        if own_browser:
+            await browser.close()
+
+    return [record for key in sorted(page_results) for record in page_results[key]]
+
+
+def crawl_with_playwright(keyword, start_date_str, end_date_str, logger, **kwargs):
+    """crawl_async의 동기 진입점"""
+    return asyncio.run(crawl_async(keyword, start_date_str, end_date_str, logger, **kwargs))
+
+
+if __name__ == "__main__":
+    from coverage_util import CoverageIndex
+
+    parser = argparse.ArgumentParser(description="Playwright(비동기, 컨텍스트 여러 개)로 네이버 뉴스 수집")
+    parser.add_argument("keyword", help='검색 키워드 (예: \'"육아휴직"\')')
+    parser.add_argument("--start", required=True)
+    parser.add_argument("--end", required=True)
+    parser.add_argument("--office-category", default=DEFAULT_OFFICE_CATEGORY)
+    parser.add_argument("--window-days", type=int, default=7)
+    parser.add_argument("--contexts", type=int, default=8, help="동시에 여는 브라우저 컨텍스트 수")
+    parser.add_argument("--max-requests", type=int, default=10, help="분당 최대 요청 수")
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    start_time = time.time()
+    completed_windows = []
+    results = crawl_with_playwright(
+        args.keyword, args.start, args.end, logger, office_category=args.office_category,
+        window_days=args.window_days, contexts=args.contexts,
+        rate_limiter=ImprovedRateLimiter(max_requests=args.max_requests, time_window=60, logger=logger),
+        dead_letters=DeadLetterQueue(), completed_windows=completed_windows,
+    )
+
+    now = datetime.now()
+    category_name = OFFICE_CATEGORY_NAMES.get(args.office_category, args.office_category)
+    # 결과가 저장된 구간만 수집 범위 인덱스에 기록
+    if save_results(f"naver_news_{args.keyword}_{now.strftime('%y%m%d')}_{now.strftime('%H%M')}"
+                    f"_({args.start}to{args.end})_{category_name}.csv", results, logger):
+        coverage_index = CoverageIndex()
+        try:
+            coverage_index.mark_windows(args.keyword, args.office_category, completed_windows)
+        finally:
+            coverage_index.close()
+    logger.info(f"⌛ 총 실행 시간: {format_duration(time.time() - start_time)}")
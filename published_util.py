@@ -0,0 +1,87 @@
+import pandas as pd
+
+
+# 네이버 검색 결과의 발행일/스크랩 시각은 모두 한국 시간 기준
+LOCAL_TZ = "Asia/Seoul"
+
+# 절대 날짜: 2024.06.15. / 2024.6.5
+ABSOLUTE_PATTERN = r"(?P<year>\d{4})\.\s*(?P<month>\d{1,2})\.\s*(?P<day>\d{1,2})"
+
+# 상대 시간: 30초 전 / 5분 전 / 3시간 전 / 1일 전 / 2주 전
+RELATIVE_PATTERN = r"(?P<amount>\d+)\s*(?P<unit>초|분|시간|일|주)\s*전"
+
+RELATIVE_UNIT_SECONDS = {
+    "초": 1,
+    "분": 60,
+    "시간": 60 * 60,
+    "일": 24 * 60 * 60,
+    "주": 7 * 24 * 60 * 60,
+}
+
+PUBLISHED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def normalize_published(published, scraped_at, tz=LOCAL_TZ):
+    """발행일 문자열들을 UTC 타임스탬프 Series로 일괄 변환하는 함수
+
+    - "2024.06.15." 같은 절대 날짜는 해당 날짜 00:00(한국 시간)으로 변환
+    - "3시간 전", "1일 전", "어제" 같은 상대 시간은 scraped_at 기준으로 계산
+    - 해석할 수 없는 값은 NaT
+
+    행 단위 파이썬 루프 없이 pandas 문자열/시간 연산으로만 처리한다.
+    """
+    published = pd.Series(published, dtype="string").fillna("").str.strip()
+    scraped = pd.to_datetime(pd.Series(scraped_at, index=published.index, dtype="string"),
+                             format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    scraped = scraped.dt.tz_localize(tz)
+
+    # 1. 절대 날짜
+    parts = published.str.extract(ABSOLUTE_PATTERN)
+    absolute = pd.to_datetime(
+        parts.apply(pd.to_numeric, errors="coerce").astype("float64"),
+        errors="coerce",
+    ).dt.tz_localize(tz)
+
+    # 2. 상대 시간 (N단위 전)
+    relative_parts = published.str.extract(RELATIVE_PATTERN)
+    seconds = (pd.to_numeric(relative_parts["amount"], errors="coerce").astype("float64")
+               * relative_parts["unit"].map(RELATIVE_UNIT_SECONDS).astype("float64"))
+    relative = scraped - pd.to_timedelta(seconds, unit="s")
+
+    # 3. "어제"는 스크랩 시각 기준 하루 전
+    yesterday = scraped - pd.Timedelta(days=1)
+    relative = relative.where(relative.notna() | ~published.str.contains("어제"), yesterday)
+
+    normalized = absolute.where(absolute.notna(), relative)
+    return normalized.dt.tz_convert("UTC")
+
+
+def add_published_at(results, column="published_at"):
+    """결과 딕셔너리 리스트에 UTC 발행 시각 컬럼을 채우는 함수 (저장 시점에 호출)"""
+    if not results:
+        return results
+
+    published_at = normalize_published(
+        [r.get("published", "") for r in results],
+        [r.get("scraped_at", "") for r in results],
+    )
+    formatted = published_at.dt.strftime(PUBLISHED_AT_FORMAT).fillna("")
+
+    for result, value in zip(results, formatted.tolist()):
+        result[column] = value
+
+    return results
+
+
+def read_results(filepath):
+    """저장된 결과 CSV를 published_at 타입이 지정된 DataFrame으로 읽는 함수
+
+    published_at 컬럼이 없는 예전 CSV는 읽는 시점에 일괄 변환한다.
+    """
+    df = pd.read_csv(filepath, encoding="utf-8-sig", dtype="string")
+    if "published_at" in df.columns:
+        df["published_at"] = pd.to_datetime(df["published_at"], format=PUBLISHED_AT_FORMAT,
+                                            utc=True, errors="coerce")
+    else:
+        df["published_at"] = normalize_published(df["published"], df["scraped_at"])
+    return df
@@ -0,0 +1,75 @@
+import logging
+import threading
+import time
+
+
+class ImprovedRateLimiter:
+    """개선된 요청 속도 제한 클래스"""
+
+    def __init__(self, max_requests=10, time_window=60, min_delay=2, logger=None,
+                 clock=time.time, sleep=time.sleep):
+        self.max_requests = max_requests  # 시간 윈도우당 최대 요청 수
+        self.time_window = time_window  # 시간 윈도우 (초)
+        self.min_delay = min_delay  # 요청 간 최소 대기 시간 (초)
+        self.requests = []  # 요청 시간을 저장하는 리스트
+        self.last_request_time = 0  # 마지막 요청 시간
+        self.logger = logger or logging.getLogger('naver_crawler')
+        self.lock = threading.Lock()  # 여러 스레드가 같은 예산을 공유할 때 사용
+        self.clock = clock  # 벤치마크에서는 가상 시계로 교체
+        self.sleep = sleep
+
+        # 통계
+        self.total_requests = 0
+        self.total_wait_time = 0
+
+    def wait_if_needed(self, request_type="일반"):
+        """필요시 대기하는 메서드 (스레드 안전)"""
+        with self.lock:
+            self._wait_if_needed(request_type)
+
+    def _wait_if_needed(self, request_type):
+        current_time = self.clock()
+        self.total_requests += 1
+
+        # 1. 최소 대기 시간 체크 (연속 요청 방지)
+        time_since_last = current_time - self.last_request_time
+        if time_since_last < self.min_delay:
+            min_wait = self.min_delay - time_since_last
+            self.logger.info(f"⏱️  최소 대기: {min_wait:.1f}초 ({request_type} 요청)")
+            self.sleep(min_wait)
+            current_time = self.clock()
+            self.total_wait_time += min_wait
+
+        # 2. 시간 윈도우를 벗어난 오래된 요청들 제거
+        self.requests = [req_time for req_time in self.requests
+                         if current_time - req_time < self.time_window]
+
+        # 3. 최대 요청 수 체크
+        if len(self.requests) >= self.max_requests:
+            oldest_request = min(self.requests)
+            window_wait = self.time_window - (current_time - oldest_request)
+            if window_wait > 0:
+                self.logger.info(f"⏰ 윈도우 제한: {window_wait:.1f}초 대기 중... "
+                                 f"({self.time_window}초에 {self.max_requests}회 제한)")
+                self.sleep(window_wait + 0.5)  # 여유 시간 추가
+                current_time = self.clock()
+                self.total_wait_time += window_wait + 0.5
+
+        # 4. 현재 요청 시간 기록
+        self.requests.append(current_time)
+        self.last_request_time = current_time
+
+        # 5. 진행 상황 로깅
+        if self.total_requests % 10 == 0:
+            avg_wait = self.total_wait_time / self.total_requests
+            self.logger.info(f"📊 요청 통계: {self.total_requests}회 완료, "
+                             f"평균 대기: {avg_wait:.1f}초")
+
+    def get_stats(self):
+        """통계 반환"""
+        return {
+            'total_requests': self.total_requests,
+            'total_wait_time': self.total_wait_time,
+            'avg_wait_time': self.total_wait_time / max(self.total_requests, 1),
+            'current_window_requests': len(self.requests)
+        }
@@ -0,0 +1,155 @@
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime
+
+
+class RetryPolicy:
+    """지터가 들어간 지수 백오프로 함수 호출을 재시도하는 정책
+
+    n번째 재시도 전 대기: 0 ~ min(max_delay, base_delay * 2**n) 사이 임의 값 (full jitter)
+    give_up_on 예외는 재시도하지 않고 바로 올린다 (예: 차단은 회로 차단기가 처리).
+    """
+
+    def __init__(self, max_attempts=4, base_delay=2, max_delay=120, retry_on=(Exception,), give_up_on=(),
+                 logger=None, sleep=time.sleep, rng=random):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.give_up_on = give_up_on
+        self.logger = logger or logging.getLogger('naver_crawler')
+        self.sleep = sleep
+        self.rng = rng
+
+    def delay(self, retry_number):
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry_number))
+
+    def call(self, func, *args, description="", **kwargs):
+        """func를 최대 max_attempts번 호출하는 메서드 (모두 실패하면 마지막 예외 발생)"""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return func(*args, **kwargs)
+            except self.give_up_on:
+                raise
+            except self.retry_on as e:
+                if attempt >= self.max_attempts:
+                    self.logger.error(f"❌ 재시도 {self.max_attempts}회 모두 실패: {description} ({e})")
+                    raise
+                delay = self.delay(attempt - 1)
+                self.logger.warning(f"🔁 {description} 실패 ({e}) - {delay:.1f}초 후 재시도 "
+                                    f"({attempt}/{self.max_attempts})")
+                self.sleep(delay)
+
+
+class DeadLetterQueue:
+    """재시도해도 실패한 작업 단위를 JSON Lines 파일에 남기는 큐
+
+    한 줄에 {"kind", "unit", "error", "attempts", "failed_at"} 하나.
+    replay로 나중에 다시 처리하고, 성공한 항목은 파일에서 지운다.
+    """
+
+    def __init__(self, path="queue/dead_letters.jsonl"):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+
+    def add(self, kind, unit, error, attempts=None):
+        entry = {
+            "kind": kind,
+            "unit": unit,
+            "error": str(error)[:500],
+            "attempts": attempts,
+            "failed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def replay(self, handlers, logger=None):
+        """kind별 처리 함수로 항목들을 다시 처리하는 메서드 (성공 건수 반환)
+
+        handlers: {kind: handler(unit)} - 예외 없이 끝나면 성공으로 보고 파일에서 제거
+        처리 함수가 없는 kind나 다시 실패한 항목은 그대로 남는다.
+        """
+        logger = logger or logging.getLogger('naver_crawler')
+        with self.lock:
+            entries = self.load()
+        remaining = []
+        replayed = 0
+
+        for entry in entries:
+            handler = handlers.get(entry["kind"])
+            if handler is None:
+                remaining.append(entry)
+                continue
+            try:
+                handler(entry["unit"])
+                replayed += 1
+                logger.info(f"✅ 재처리 성공: {entry['kind']} {entry['unit']}")
+            except Exception as e:
+                logger.error(f"❌ 재처리 실패: {entry['kind']} {entry['unit']} ({e})")
+                entry["error"] = str(e)[:500]
+                entry["failed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                remaining.append(entry)
+
+        with self.lock:
+            # replay 도중 추가된 항목은 보존
+            added = self.load()[len(entries):]
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in remaining + added:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.path)
+        return replayed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="데드 레터 큐 조회/재처리")
+    parser.add_argument("action", choices=["list", "replay"])
+    parser.add_argument("--path", default="queue/dead_letters.jsonl")
+    args = parser.parse_args()
+
+    dead_letters = DeadLetterQueue(args.path)
+    if args.action == "list":
+        for entry in dead_letters.load():
+            print(f"{entry['failed_at']} [{entry['kind']}] {entry['unit']} - {entry['error']}")
+    else:
+        from crawl_util import setup_logging, iter_news, save_results, create_driver
+        from rate_limiter_util import ImprovedRateLimiter
+
+        logger = setup_logging()
+        rate_limiter = ImprovedRateLimiter(max_requests=10, time_window=60, logger=logger)
+        driver = create_driver()
+
+        def replay_search_page(unit):
+            # 실패한 페이지부터 그 구간 끝까지 다시 수집 (구간 하나로 처리, 이번 실패는 다시 기록하지 않음)
+            results = list(iter_news(unit["keyword"], unit["start_date"], unit["end_date"], logger,
+                                     unit["office_category"], window_days=10000, driver=driver,
+                                     rate_limiter=rate_limiter, start_page=unit["page"],
+                                     raise_on_failure=True))
+            # 저장까지 끝나야 성공 - 저장 실패 시 예외로 항목을 큐에 남김
+            now = datetime.now()
+            output_filename = (f"naver_news_{unit['keyword']}_{now.strftime('%y%m%d')}_{now.strftime('%H%M%S')}"
+                               f"_({unit['start_date']}to{unit['end_date']})_p{unit['page']}_replay.csv")
+            if not save_results(output_filename, results, logger):
+                raise RuntimeError(f"결과 저장 실패: {output_filename}")
+
+        try:
+            count = dead_letters.replay({"search_page": replay_search_page}, logger)
+        finally:
+            driver.quit()
+
+        logger.info(f"📊 재처리 성공 {count}건")
@@ -0,0 +1,167 @@
+import argparse
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+
+# published_util.LOCAL_TZ와 같음 (pandas를 import하지 않도록 따로 둠)
+LOCAL_TZ = ZoneInfo("Asia/Seoul")
+PUBLISHED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# trigram 토크나이저는 3글자 이상이어야 MATCH가 가능 (한국어는 형태소 분석 없이도 부분 일치)
+MIN_MATCH_LENGTH = 3
+
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_bodies (
+    article_id INTEGER PRIMARY KEY REFERENCES articles (id),
+    body TEXT NOT NULL,
+    fetched_at TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS article_fts USING fts5(title, body, tokenize='trigram');
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO article_fts (rowid, title, body)
+    VALUES (new.id, new.title, (SELECT body FROM article_bodies WHERE article_id = new.id));
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title ON articles
+WHEN new.title IS NOT old.title BEGIN
+    DELETE FROM article_fts WHERE rowid = old.id;
+    INSERT INTO article_fts (rowid, title, body)
+    VALUES (new.id, new.title, (SELECT body FROM article_bodies WHERE article_id = new.id));
+END;
+CREATE TRIGGER IF NOT EXISTS article_bodies_fts_insert AFTER INSERT ON article_bodies BEGIN
+    DELETE FROM article_fts WHERE rowid = new.article_id;
+    INSERT INTO article_fts (rowid, title, body) SELECT id, title, new.body FROM articles WHERE id = new.article_id;
+END;
+CREATE TRIGGER IF NOT EXISTS article_bodies_fts_update AFTER UPDATE OF body ON article_bodies BEGIN
+    DELETE FROM article_fts WHERE rowid = new.article_id;
+    INSERT INTO article_fts (rowid, title, body) SELECT id, title, new.body FROM articles WHERE id = new.article_id;
+END;
+"""
+
+
+def ensure_search_index(conn):
+    """기사 저장소에 전문 검색 인덱스(FTS5 trigram)를 만드는 함수
+
+    인덱스는 articles / article_bodies 트리거로 갱신되므로 write_results가 저장할 때마다
+    따로 호출하지 않아도 증분 반영된다. 처음 만들 때만 기존 기사들을 한 번에 채운다.
+    """
+    created = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'article_fts'").fetchone() is None
+    conn.executescript(SEARCH_SCHEMA)
+    if created:
+        rebuild_search_index(conn)
+
+
+def rebuild_search_index(conn):
+    """인덱스를 기사 테이블에서 다시 채우는 함수 (인덱스 행 수 반환)"""
+    with conn:
+        conn.execute("DELETE FROM article_fts")
+        conn.execute(
+            "INSERT INTO article_fts (rowid, title, body) "
+            "SELECT a.id, a.title, b.body FROM articles a LEFT JOIN article_bodies b ON b.article_id = a.id")
+        conn.execute("INSERT INTO article_fts (article_fts) VALUES ('optimize')")
+    return conn.execute("SELECT COUNT(*) FROM article_fts").fetchone()[0]
+
+
+def _day_start_utc(date_str, days=0):
+    """한국 날짜(YYYYMMDD)의 00시를 published_at 형식(UTC) 문자열로 바꾸는 함수"""
+    local = datetime.strptime(date_str, "%Y%m%d").replace(tzinfo=LOCAL_TZ) + timedelta(days=days)
+    return local.astimezone(ZoneInfo("UTC")).strftime(PUBLISHED_AT_FORMAT)
+
+
+def _match_phrase(term):
+    return '"' + term.replace('"', '""') + '"'
+
+
+def search_articles(conn, query, start_date=None, end_date=None, source=None, keyword=None, limit=50,
+                    order="date"):
+    """제목/본문 전문 검색 함수 - 기사 딕셔너리 리스트 반환
+
+    - query: 공백으로 나눈 단어를 모두 포함하는 기사 (3글자 이상은 FTS MATCH, 짧은 단어는 LIKE)
+    - start_date / end_date: 발행일 구간 (YYYYMMDD, 한국 날짜 기준, 양끝 포함)
+    - source: 언론사 이름, keyword: 수집 키워드 (따옴표 유무 무관)
+    - order: "date"(최신순) 또는 "rank"(관련도순, MATCH 단어가 있을 때만)
+    """
+    terms = query.split()
+    if not terms:
+        raise ValueError("검색어가 비어 있습니다")
+    match_terms = [term for term in terms if len(term) >= MIN_MATCH_LENGTH]
+    like_terms = [term for term in terms if len(term) < MIN_MATCH_LENGTH]
+
+    conditions = []
+    params = []
+    if match_terms:
+        tables = "article_fts f JOIN articles a ON a.id = f.rowid"
+        title_column, body_column = "f.title", "f.body"
+        conditions.append("article_fts MATCH ?")
+        params.append(" AND ".join(_match_phrase(term) for term in match_terms))
+    else:
+        # 짧은 단어만 있으면 발행일 인덱스 순서로 기사를 훑다가 limit건에서 멈춤
+        tables = "articles a LEFT JOIN article_bodies b ON b.article_id = a.id"
+        title_column, body_column = "a.title", "b.body"
+    for term in like_terms:
+        # 짧은 검색어는 trigram으로 찾을 수 없으므로 LIKE로 대신
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        conditions.append(f"({title_column} LIKE ? ESCAPE '\\' OR {body_column} LIKE ? ESCAPE '\\')")
+        params.extend([pattern, pattern])
+    if start_date:
+        conditions.append("a.published_at >= ?")
+        params.append(_day_start_utc(start_date))
+    if end_date:
+        conditions.append("a.published_at < ?")
+        params.append(_day_start_utc(end_date, days=1))
+    if source:
+        conditions.append("s.name = ?")
+        params.append(source)
+    if keyword:
+        bare = keyword.strip('"')
+        conditions.append("EXISTS (SELECT 1 FROM article_hits h WHERE h.article_id = a.id AND h.keyword IN (?, ?))")
+        params.extend([bare, f'"{bare}"'])
+
+    order_by = "f.rank" if order == "rank" and match_terms else "a.published_at DESC"
+    params.append(limit)
+    rows = conn.execute(
+        "SELECT a.id, a.title, s.name, a.published, a.published_at, a.naver_url, a.original_url "
+        f"FROM {tables} LEFT JOIN sources s ON s.id = a.source_id "
+        f"WHERE {' AND '.join(conditions)} ORDER BY {order_by} LIMIT ?",
+        params,
+    ).fetchall()
+    columns = ["id", "title", "source", "published", "published_at", "naver_url", "original_url"]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사 저장소 전문 검색 (FTS5 trigram)")
+    parser.add_argument("query", nargs="?", help="검색어 (공백으로 구분한 단어를 모두 포함)")
+    parser.add_argument("--store", default="results/articles.sqlite")
+    parser.add_argument("--start", help="발행일 시작 (YYYYMMDD)")
+    parser.add_argument("--end", help="발행일 끝 (YYYYMMDD)")
+    parser.add_argument("--source", help="언론사")
+    parser.add_argument("--keyword", help="수집 키워드")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--order", choices=["date", "rank"], default="date")
+    parser.add_argument("--rebuild", action="store_true", help="인덱스를 기사 테이블에서 다시 만들기")
+    args = parser.parse_args()
+
+    from article_store_util import ArticleStore
+
+    store = ArticleStore(args.store)
+    try:
+        if args.rebuild:
+            start_time = time.time()
+            count = rebuild_search_index(store.conn)
+            print(f"✅ 인덱스 재구성: {count}건 ({time.time() - start_time:.1f}초)")
+        if args.query:
+            start_time = time.time()
+            rows = search_articles(store.conn, args.query, args.start, args.end, args.source, args.keyword,
+                                   args.limit, args.order)
+            elapsed = (time.time() - start_time) * 1000
+            for row in rows:
+                print(f"{row['published_at'] or row['published']} | {row['source']} | {row['title']} | {row['naver_url'] or row['original_url']}")
+            print(f"🔍 {len(rows)}건 ({elapsed:.1f}ms)")
+    except (ValueError, sqlite3.OperationalError) as e:
+        print(f"❌ 검색 실패: {e}")
+    finally:
+        store.close()
@@ -0,0 +1,75 @@
+import time
+
+
+# 이동 전 문서에 표시를 남겨 두고, 새 문서(표시 없음)가 다 로드됐는지 확인
+NAVIGATE_SCRIPT = "window.__tabPoolStale = true; window.location.href = arguments[0];"
+READY_SCRIPT = "return !window.__tabPoolStale && document.readyState === 'complete';"
+
+
+class TabPool:
+    """브라우저 하나에 탭 여러 개를 열어 두고 페이지를 동시에 불러오는 풀
+
+    driver.get은 로딩이 끝날 때까지 막히므로 window.location으로 이동만 시켜 두고,
+    poll()로 준비된 탭을 돌며 page_source를 거둔다. 렌더링 대기(render_wait) 동안
+    다른 탭들이 로딩되므로 브라우저 프로세스를 늘리지 않고 네트워크 지연을 겹칠 수 있다.
+    (crawl_expansion_page의 window.open / switch_to.window 방식과 같음)
+    """
+
+    def __init__(self, driver, tabs=4, render_wait=3, load_timeout=30, clock=time.time):
+        self.driver = driver
+        self.render_wait = render_wait
+        self.load_timeout = load_timeout
+        self.clock = clock
+
+        for _ in range(tabs - 1):
+            driver.execute_script("window.open('about:blank', '_blank');")
+        self.handles = list(driver.window_handles)[:tabs]
+        self.tasks = {}  # 탭 핸들 -> (키, URL, 이동 시각)
+
+    def idle_count(self):
+        return len(self.handles) - len(self.tasks)
+
+    def busy(self):
+        return bool(self.tasks)
+
+    def navigate(self, key, url):
+        """빈 탭 하나에서 url로 이동을 시작하는 메서드 (로딩을 기다리지 않음)"""
+        handle = next(h for h in self.handles if h not in self.tasks)
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(NAVIGATE_SCRIPT, url)
+        self.tasks[handle] = (key, url, self.clock())
+        return handle
+
+    def poll(self):
+        """준비된 탭들을 거두는 메서드 - [(키, URL, page_source, 오류)] 반환
+
+        로딩이 끝나고 render_wait가 지났거나, load_timeout이 지난 탭을 거둔다.
+        시간 초과면 그때까지의 page_source를 넘기고 판별(차단/오류)은 파싱 단계에 맡긴다.
+        """
+        harvested = []
+        now = self.clock()
+        for handle, (key, url, started_at) in list(self.tasks.items()):
+            elapsed = now - started_at
+            if elapsed < self.render_wait:
+                continue
+            try:
+                self.driver.switch_to.window(handle)
+                if not self.driver.execute_script(READY_SCRIPT) and elapsed < self.load_timeout:
+                    continue
+                harvested.append((key, url, self.driver.page_source, None))
+            except Exception as e:
+                harvested.append((key, url, None, e))
+            del self.tasks[handle]
+        return harvested
+
+    def close(self):
+        """첫 탭만 남기고 닫는 메서드"""
+        for handle in self.handles[1:]:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+        if self.handles:
+            self.driver.switch_to.window(self.handles[0])
+        self.tasks.clear()
@@ -0,0 +1,171 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter_util import ImprovedRateLimiter
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 지각 해시 없이 콘텐츠 해시만 사용
+    Image = None
+
+
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://search.naver.com/",
+}
+
+
+def dhash(content, hash_size=8):
+    """이미지의 difference hash(지각 해시)를 16진수 문자열로 반환하는 함수"""
+    if Image is None:
+        return ""
+
+    with Image.open(io.BytesIO(content)) as img:
+        img = img.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+        pixels = list(img.getdata())
+
+    bits = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            bits = (bits << 1) | (1 if left > right else 0)
+
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+class ThumbnailDownloader:
+    """크롤링과 별도 스레드에서 썸네일을 내려받아 콘텐츠 해시 경로에 저장하는 클래스
+
+    - 같은 내용의 이미지는 sha256 경로에 한 번만 저장
+    - 크기/인코딩만 다른 같은 이미지는 지각 해시(dHash)로 기존 파일을 재사용
+    - 검색 요청과 별개의 속도 제한 예산 사용
+    """
+
+    def __init__(self, output_directory="thumbnails/", max_workers=4,
+                 max_requests=60, time_window=60, min_delay=0.2, timeout=10, logger=None):
+        self.output_directory = output_directory
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger('naver_crawler')
+
+        # 썸네일 호스트 연결을 재사용하는 세션
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.rate_limiter = ImprovedRateLimiter(max_requests=max_requests, time_window=time_window,
+                                                min_delay=min_delay, logger=self.logger)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnail")
+
+        self.futures = {}  # image_url -> Future[(path, phash)]
+        self.lock = threading.Lock()
+
+        # 지각 해시 -> 저장 경로 (실행 간 유지)
+        self.phash_index_path = os.path.join(output_directory, "phash_index.json")
+        self.phash_index = {}
+        if os.path.exists(self.phash_index_path):
+            with open(self.phash_index_path, encoding="utf-8") as f:
+                self.phash_index = json.load(f)
+
+        # 통계
+        self.downloaded_count = 0
+        self.dedup_count = 0
+        self.failed_count = 0
+        self.failed_urls = set()
+
+    def submit(self, image_url):
+        """썸네일 다운로드를 예약하는 메서드 (즉시 반환)"""
+        if not image_url or image_url in self.futures:
+            return
+        self.futures[image_url] = self.executor.submit(self._download, image_url)
+
+    def _download(self, image_url):
+        self.rate_limiter.wait_if_needed("썸네일")
+
+        response = self.session.get(image_url, timeout=self.timeout)
+        response.raise_for_status()
+        content = response.content
+
+        digest = hashlib.sha256(content).hexdigest()
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+        extension = CONTENT_TYPE_EXTENSIONS.get(content_type, ".img")
+        path = os.path.join(self.output_directory, digest[:2], digest + extension)
+
+        try:
+            phash = dhash(content)
+        except Exception:
+            phash = ""  # 이미지로 열 수 없는 응답
+
+        with self.lock:
+            # 다른 바이트지만 같은 그림이면 기존 파일 재사용
+            if phash and phash in self.phash_index:
+                self.dedup_count += 1
+                return self.phash_index[phash], phash
+
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+                self.downloaded_count += 1
+            else:
+                self.dedup_count += 1
+
+            if phash:
+                self.phash_index[phash] = path
+
+        return path, phash
+
+    def result_for(self, image_url):
+        """썸네일 저장 경로와 지각 해시를 반환하는 메서드 (완료될 때까지 대기)"""
+        future = self.futures.get(image_url)
+        if future is None:
+            return "", ""
+        try:
+            return future.result()
+        except Exception as e:
+            # 같은 이미지가 여러 결과에 있어도 실패는 URL당 한 번만 집계
+            if image_url not in self.failed_urls:
+                self.failed_urls.add(image_url)
+                self.failed_count += 1
+                self.logger.warning(f"    ⚠️ 썸네일 다운로드 실패: {image_url[:80]}... ({e})")
+            return "", ""
+
+    def fill_results(self, results):
+        """결과 딕셔너리에 image_path, image_phash 컬럼을 채우는 메서드"""
+        for result in results:
+            path, phash = self.result_for(result.get("image_url"))
+            result["image_path"] = path
+            result["image_phash"] = phash
+        return results
+
+    def close(self):
+        """남은 다운로드를 마치고 지각 해시 인덱스를 저장하는 메서드"""
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+        os.makedirs(self.output_directory, exist_ok=True)
+        with self.lock:
+            with open(self.phash_index_path, "w", encoding="utf-8") as f:
+                json.dump(self.phash_index, f)
+
+        self.logger.info(f"🖼️ 썸네일: 신규 저장 {self.downloaded_count}건, "
+                         f"중복 재사용 {self.dedup_count}건, 실패 {self.failed_count}건")
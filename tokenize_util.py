@@ -0,0 +1,226 @@
+import argparse
+import glob
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    from kiwipiepy import Kiwi
+except ImportError:  # kiwipiepy가 없으면 순수 파이썬 분석기만 사용
+    Kiwi = None
+
+
+TOKEN_PATTERN = re.compile(r"[가-힣A-Za-z0-9]+")
+
+# 어절 끝 조사 (긴 것부터 확인). 남는 어간이 2글자 이상일 때만 떼어 낸다.
+# '이/가/도/나'처럼 명사 끝 글자와 자주 겹치는 조사는 제외 (어린이 → 어린, 전문가 → 전문 방지)
+JOSA_SUFFIXES = sorted([
+    "에서는", "으로는", "에게서", "까지는", "에서도", "께서", "에서", "에게", "으로", "로서", "로써",
+    "부터", "까지", "처럼", "보다", "이나", "하고", "이다", "은", "는", "을", "를", "의", "에", "와", "과", "로",
+], key=len, reverse=True)
+
+TOKEN_SCHEMA = pa.schema([
+    ("article_key", pa.string()),
+    ("field", pa.string()),          # title / body
+    ("tokens", pa.list_(pa.string())),
+    ("tokenized_at", pa.string()),
+])
+
+
+class RegexAnalyzer:
+    """의존성 없는 기본 분석기: 한글/영문/숫자 어절을 나누고 끝 조사만 떼어 냄"""
+
+    name = "regex-v1"
+
+    def analyze(self, text):
+        tokens = []
+        for word in TOKEN_PATTERN.findall(text or ""):
+            if word.isdigit():
+                continue
+            for suffix in JOSA_SUFFIXES:
+                if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                    word = word[:-len(suffix)]
+                    break
+            if len(word) >= 2:
+                tokens.append(word.lower())
+        return tokens
+
+    def analyze_batch(self, texts):
+        return [self.analyze(text) for text in texts]
+
+
+class KiwiAnalyzer:
+    """kiwipiepy 형태소 분석기: 명사/동사/형용사 어간과 외국어만 남김"""
+
+    name = "kiwi-v1"
+    KEEP_TAGS = {"NNG", "NNP", "VV", "VA", "XR", "SL", "SH"}
+
+    def __init__(self):
+        if Kiwi is None:
+            raise RuntimeError("kiwipiepy가 설치되어 있지 않습니다 (pip install kiwipiepy)")
+        self.kiwi = Kiwi()
+
+    def analyze(self, text):
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(self, texts):
+        # Kiwi는 리스트를 받으면 내부적으로 한 번에 처리
+        return [[token.form.lower() for token in tokens if token.tag in self.KEEP_TAGS]
+                for tokens in self.kiwi.tokenize([text or "" for text in texts])]
+
+
+ANALYZERS = {
+    "regex": RegexAnalyzer,
+    "kiwi": KiwiAnalyzer,
+}
+
+
+def analyzer_class(name):
+    if name not in ANALYZERS:
+        raise ValueError(f"알 수 없는 분석기: {name} (사용 가능: {', '.join(sorted(ANALYZERS))})")
+    return ANALYZERS[name]
+
+
+def get_analyzer(name):
+    return analyzer_class(name)()
+
+
+# --- 프로세스 풀 워커 (분석기는 프로세스마다 한 번만 생성) ---
+
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_name):
+    global _worker_analyzer
+    _worker_analyzer = get_analyzer(analyzer_name)
+
+
+def _analyze_batch(texts):
+    return _worker_analyzer.analyze_batch(texts)
+
+
+class TokenCache:
+    """기사 키별 토큰 배열을 Parquet 파일들(part-*.parquet)에 쌓아 두는 캐시
+
+    분석기마다 디렉토리가 따로 있고(cache/tokens/<분석기 이름>), 실행마다 새로 분석한 것만
+    part 파일 하나로 추가한다. 이미 분석한 (기사 키, 필드)는 article_key/field 컬럼만 읽어 확인한다.
+    """
+
+    def __init__(self, directory="cache/tokens", analyzer_name=RegexAnalyzer.name):
+        self.directory = os.path.join(directory, analyzer_name)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def part_files(self):
+        return sorted(glob.glob(os.path.join(self.directory, "part-*.parquet")))
+
+    def known_keys(self):
+        """이미 토큰이 있는 (기사 키, 필드) 집합"""
+        known = set()
+        for path in self.part_files():
+            table = pq.read_table(path, columns=["article_key", "field"])
+            known.update(zip(table.column("article_key").to_pylist(), table.column("field").to_pylist()))
+        return known
+
+    def append(self, keys, fields, token_lists):
+        """새 토큰들을 part 파일 하나로 저장하는 메서드 (파일 경로 반환)"""
+        tokenized_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        table = pa.table({
+            "article_key": keys,
+            "field": fields,
+            "tokens": token_lists,
+            "tokenized_at": [tokenized_at] * len(keys),
+        }, schema=TOKEN_SCHEMA)
+        path = os.path.join(self.directory, f"part-{datetime.now().strftime('%Y%m%d%H%M%S%f')}.parquet")
+        pq.write_table(table, path, compression="zstd")
+        return path
+
+    def load(self, field=None):
+        """캐시된 토큰 전체를 DataFrame(article_key, field, tokens, tokenized_at)으로 읽는 메서드"""
+        if not self.part_files():
+            return pa.table({}, schema=TOKEN_SCHEMA).to_pandas()
+        filters = [("field", "=", field)] if field else None
+        return pq.read_table(self.directory, filters=filters, schema=TOKEN_SCHEMA).to_pandas()
+
+    def compact(self):
+        """part 파일들을 하나로 합치는 메서드 (같은 키는 마지막 것만 남김)"""
+        parts = self.part_files()
+        if len(parts) < 2:
+            return len(parts)
+        frame = self.load().drop_duplicates(["article_key", "field"], keep="last")
+        table = pa.Table.from_pandas(frame, schema=TOKEN_SCHEMA, preserve_index=False)
+        path = os.path.join(self.directory, f"part-{datetime.now().strftime('%Y%m%d%H%M%S%f')}.parquet")
+        pq.write_table(table, path + ".tmp", compression="zstd")
+        os.replace(path + ".tmp", path)
+        for old in parts:
+            os.remove(old)
+        return 1
+
+
+def tokenize_texts(texts, analyzer_name="regex", workers=None, batch_size=2000):
+    """텍스트들을 batch_size 묶음으로 나눠 프로세스 풀에서 분석하는 함수 (입력 순서대로 반환)"""
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    if len(batches) <= 1 or workers == 0:
+        analyzer = get_analyzer(analyzer_name)
+        return [tokens for batch in batches for tokens in analyzer.analyze_batch(batch)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(analyzer_name,)) as pool:
+        return [tokens for batch_tokens in pool.map(_analyze_batch, batches) for tokens in batch_tokens]
+
+
+def tokenize_new_articles(store_path="results/articles.sqlite", cache_directory="cache/tokens", analyzer_name="regex",
+                          workers=None, batch_size=2000, logger=None):
+    """기사 저장소의 제목/본문 중 캐시에 없는 것만 분석해 캐시에 추가하는 함수 (새로 분석한 수 반환)"""
+    from article_store_util import ArticleStore
+
+    cache = TokenCache(cache_directory, analyzer_class(analyzer_name).name)
+    known = cache.known_keys()
+
+    keys, fields, texts = [], [], []
+    store = ArticleStore(store_path)
+    try:
+        rows = store.conn.execute(
+            "SELECT a.article_key, a.title, b.body FROM articles a "
+            "LEFT JOIN article_bodies b ON b.article_id = a.id ORDER BY a.id")
+        for article_key, title, body in rows:
+            for field, text in (("title", title), ("body", body)):
+                if text and (article_key, field) not in known:
+                    keys.append(article_key)
+                    fields.append(field)
+                    texts.append(text)
+    finally:
+        store.close()
+
+    if not texts:
+        if logger:
+            logger.info(f"✅ 새로 분석할 기사 없음 (캐시 {len(known)}건)")
+        return 0
+
+    start_time = time.time()
+    token_lists = tokenize_texts(texts, analyzer_name, workers, batch_size)
+    path = cache.append(keys, fields, token_lists)
+    if logger:
+        logger.info(f"✅ 토큰화 {len(texts)}건 ({time.time() - start_time:.1f}초) → {path}")
+    return len(texts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사 제목/본문 토큰화 (새 기사만, Parquet 캐시)")
+    parser.add_argument("--store", default="results/articles.sqlite")
+    parser.add_argument("--cache", default="cache/tokens")
+    parser.add_argument("--analyzer", choices=sorted(ANALYZERS), default="regex")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (0이면 현재 프로세스에서)")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--compact", action="store_true", help="part 파일들을 하나로 합치기")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    count = tokenize_new_articles(args.store, args.cache, args.analyzer, args.workers, args.batch_size)
+    print(f"✅ 새로 토큰화 {count}건 ({time.time() - start_time:.1f}초)")
+    if args.compact:
+        cache = TokenCache(args.cache, analyzer_class(args.analyzer).name)
+        print(f"🗜️ part 파일 정리: {cache.compact()}개")
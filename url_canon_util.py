@@ -0,0 +1,170 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# 기사 식별과 무관한 추적용 파라미터
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "igshid", "mc_cid", "mc_eid", "_ga",
+    "ref", "ref_src", "cmpid", "did", "nv_ref", "ntype", "sns",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+
+
+def strip_tracking(url):
+    """추적 파라미터/프래그먼트를 제거하고 URL 표기를 정규화하는 함수"""
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if key.lower() not in TRACKING_PARAMS
+             and not key.lower().startswith(TRACKING_PREFIXES)]
+    query.sort()
+
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+class UrlCanonCache:
+    """URL → 정규 URL 매핑을 저장하는 SQLite 캐시 (실행 간 유지)"""
+
+    def __init__(self, path="cache/url_canon.sqlite", ttl_days=30):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS url_canon (
+                url TEXT PRIMARY KEY,
+                canonical_url TEXT NOT NULL,
+                resolved_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get_many(self, urls):
+        """TTL이 지나지 않은 캐시 항목들을 반환하는 메서드"""
+        cached = {}
+        min_resolved_at = time.time() - self.ttl_seconds
+        urls = list(urls)
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT url, canonical_url FROM url_canon "
+                f"WHERE url IN ({placeholders}) AND resolved_at >= ?",
+                chunk + [min_resolved_at],
+            )
+            cached.update(rows)
+        return cached
+
+    def put_many(self, mapping):
+        """정규화 결과를 한 트랜잭션으로 저장하는 메서드"""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO url_canon (url, canonical_url, resolved_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET canonical_url = excluded.canonical_url, "
+                "resolved_at = excluded.resolved_at",
+                [(url, canonical, now) for url, canonical in mapping.items()],
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+class UrlCanonicalizer:
+    """원본 기사 URL의 리다이렉트를 따라가 정규 URL로 바꾸는 클래스"""
+
+    def __init__(self, cache_path="cache/url_canon.sqlite", ttl_days=30, max_workers=8,
+                 per_host_connections=2, timeout=10, logger=None):
+        self.cache = UrlCanonCache(cache_path, ttl_days=ttl_days)
+        self.max_workers = max_workers
+        self.per_host_connections = per_host_connections
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger('naver_crawler')
+
+        # 호스트별 커넥션 풀 (언론사별 동시 연결 수 제한)
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=per_host_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.host_semaphores = {}
+        self.lock = threading.Lock()
+
+    def _host_semaphore(self, url):
+        host = urlsplit(url).hostname or ""
+        with self.lock:
+            if host not in self.host_semaphores:
+                self.host_semaphores[host] = threading.BoundedSemaphore(self.per_host_connections)
+            return self.host_semaphores[host]
+
+    def resolve(self, url):
+        """리다이렉트를 따라가 최종 URL을 정규화해서 반환하는 메서드"""
+        with self._host_semaphore(url):
+            # HEAD를 지원하지 않는 언론사가 많아 실패 시 GET으로 재시도
+            response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+            if response.status_code >= 400:
+                response = self.session.get(url, allow_redirects=True, timeout=self.timeout, stream=True)
+                response.close()
+            response.raise_for_status()
+        return strip_tracking(response.url)
+
+    def _resolve_or_none(self, url):
+        try:
+            return self.resolve(url)
+        except Exception as e:
+            self.logger.warning(f"    ⚠️ URL 정규화 실패: {url[:80]}... ({e})")
+            return None
+
+    def canonicalize_many(self, urls):
+        """여러 URL을 한 번에 정규화하는 메서드 (캐시에 없는 것만 요청)"""
+        stripped = {url: strip_tracking(url) for url in set(urls) if url}
+        cached = self.cache.get_many(set(stripped.values()))
+
+        to_resolve = sorted(set(stripped.values()) - set(cached))
+        resolved = {}
+        if to_resolve:
+            self.logger.info(f"🔗 원본 URL 정규화: 캐시 {len(cached)}건, 신규 요청 {len(to_resolve)}건")
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="url-canon") as executor:
+                for url, canonical in zip(to_resolve, executor.map(self._resolve_or_none, to_resolve)):
+                    if canonical:
+                        resolved[url] = canonical
+            # 실패한 URL은 캐시하지 않고 다음 실행에서 다시 시도
+            self.cache.put_many(resolved)
+
+        lookup = {**cached, **resolved}
+        return {url: lookup.get(key, key) for url, key in stripped.items()}
+
+    def close(self):
+        self.session.close()
+        self.cache.close()
+
+
+def add_canonical_urls(results, canonicalizer, source_column="original_url", column="canonical_url"):
+    """결과 딕셔너리 리스트에 canonical_url 컬럼을 채우는 함수"""
+    mapping = canonicalizer.canonicalize_many(r.get(source_column, "") for r in results)
+    for result in results:
+        result[column] = mapping.get(result.get(source_column, ""), "")
+    return results
@@ -0,0 +1,228 @@
+import json
+import os
+import sqlite3
+import time
+
+
+class SQLiteWorkQueue:
+    """여러 워커가 공유하는 크롤링 작업 큐 (SQLite 기반)
+
+    작업 단위: (keyword, office_category, start_date, end_date, page)
+    - lease: 작업을 가져가면서 visibility timeout 동안 다른 워커에게 숨김
+    - complete: 결과 저장 + 후속 페이지 등록을 한 트랜잭션으로 처리
+    - 임대 시간이 지난 작업(죽은 워커)은 다음 lease 때 자동으로 회수
+
+    여러 노드에서 쓸 때는 파일 잠금을 지원하는 공유 스토리지에 DB를 둔다. WAL은 한 호스트의 공유 메모리에
+    의존해 네트워크 파일시스템에서는 DB가 깨질 수 있으므로 기본은 롤백 저널(DELETE)을 쓰고,
+    모든 워커가 같은 호스트에서 돌 때만 single_host=True로 WAL을 켠다.
+    """
+
+    def __init__(self, path="queue/crawl_queue.sqlite", max_attempts=5, single_host=False):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_attempts = max_attempts
+        # lease가 회수하다가 재시도 한도를 넘겨 failed로 바꾼 작업 (pop_expired_failures로 가져감)
+        self.expired_failures = []
+
+        # 트랜잭션을 직접 제어 (BEGIN IMMEDIATE로 쓰기 잠금 선점)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(f"PRAGMA journal_mode={'WAL' if single_host else 'DELETE'}")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS work_units (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                keyword TEXT NOT NULL,
+                office_category TEXT NOT NULL,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                result_count INTEGER,
+                last_error TEXT,
+                updated_at REAL NOT NULL,
+                UNIQUE (keyword, office_category, start_date, end_date, page)
+            );
+            CREATE INDEX IF NOT EXISTS idx_work_units_status ON work_units (status, lease_expires_at);
+            CREATE TABLE IF NOT EXISTS unit_results (
+                unit_id INTEGER NOT NULL REFERENCES work_units (id),
+                result_json TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_unit_results_unit ON unit_results (unit_id);
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                name TEXT PRIMARY KEY,
+                value REAL NOT NULL,
+                note TEXT
+            );
+        """)
+        # 재시도 백오프용 컬럼 (예전 큐 파일에는 없으므로 추가)
+        try:
+            self.conn.execute("ALTER TABLE work_units ADD COLUMN available_at REAL")
+        except sqlite3.OperationalError:
+            pass
+
+    def _enqueue(self, units, now):
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO work_units "
+            "(keyword, office_category, start_date, end_date, page, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(u["keyword"], u["office_category"], u["start_date"], u["end_date"], u["page"], now)
+             for u in units],
+        )
+
+    def enqueue(self, units):
+        """작업 단위들을 등록하는 메서드 (이미 있는 작업은 무시)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.conn.total_changes
+            self._enqueue(units, time.time())
+            added = self.conn.total_changes - before
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def lease(self, worker_id, visibility_timeout=300):
+        """대기 중인 작업 하나를 임대하는 메서드 (없으면 None)"""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 임대 시간이 지난 작업 회수 (재시도 한도를 넘었으면 failed)
+            reclaimed = self.conn.execute(
+                "UPDATE work_units SET "
+                "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, last_error = 'lease expired', updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires_at < ? "
+                "RETURNING id, keyword, office_category, start_date, end_date, page, attempts, status",
+                (self.max_attempts, now, now),
+            ).fetchall()
+            self.expired_failures.extend(dict(unit) for unit in reclaimed if unit["status"] == "failed")
+            row = self.conn.execute(
+                "SELECT * FROM work_units WHERE status = 'pending' AND COALESCE(available_at, 0) <= ? "
+                "ORDER BY id LIMIT 1", (now,)
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+
+            self.conn.execute(
+                "UPDATE work_units SET status = 'leased', lease_owner = ?, lease_expires_at = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker_id, now + visibility_timeout, now, row["id"]),
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return dict(row)
+
+    def pop_expired_failures(self):
+        """임대 만료로 failed가 된 작업들을 넘겨주고 비우는 메서드 (데드 레터 기록용)"""
+        units, self.expired_failures = self.expired_failures, []
+        return units
+
+    def complete(self, unit_id, worker_id, results, follow_up_units=()):
+        """작업 완료 처리: 결과 저장과 후속 작업 등록을 함께 커밋하는 메서드
+
+        임대 시간이 지나 다른 워커에게 넘어간 작업이면 아무것도 저장하지 않고 False 반환
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.conn.execute(
+                "UPDATE work_units SET status = 'done', lease_owner = NULL, result_count = ?, "
+                "updated_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (len(results), now, unit_id, worker_id),
+            )
+            if cursor.rowcount == 0:
+                self.conn.execute("ROLLBACK")
+                return False
+
+            self.conn.executemany(
+                "INSERT INTO unit_results (unit_id, result_json) VALUES (?, ?)",
+                [(unit_id, json.dumps(dict(r), ensure_ascii=False)) for r in results],
+            )
+            self._enqueue(follow_up_units, now)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def fail(self, unit_id, worker_id, error, retry_delay=0):
+        """작업 실패 처리: 재시도 한도 전이면 retry_delay초 뒤 다시 대기열로, 넘으면 failed
+
+        반환값: 변경된 상태('pending' / 'failed'), 임대를 잃은 작업이면 None
+        """
+        now = time.time()
+        row = self.conn.execute(
+            "UPDATE work_units SET "
+            "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_owner = NULL, last_error = ?, available_at = ?, updated_at = ? "
+            "WHERE id = ? AND status = 'leased' AND lease_owner = ? RETURNING status",
+            (self.max_attempts, str(error)[:500], now + retry_delay, now, unit_id, worker_id),
+        ).fetchone()
+        return row[0] if row else None
+
+    def release(self, unit_id, worker_id, reason=""):
+        """임대한 작업을 시도 횟수 차감 없이 대기열로 되돌리는 메서드 (차단 등 작업 탓이 아닌 경우)"""
+        self.conn.execute(
+            "UPDATE work_units SET status = 'pending', attempts = MAX(attempts - 1, 0), "
+            "lease_owner = NULL, last_error = ?, updated_at = ? "
+            "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (str(reason)[:500], time.time(), unit_id, worker_id),
+        )
+
+    def pause_until(self, until, reason=""):
+        """모든 워커의 일시 정지 시각을 기록하는 메서드 (더 늦은 시각만 반영)"""
+        self.conn.execute(
+            "INSERT INTO crawl_state (name, value, note) VALUES ('paused_until', ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = MAX(crawl_state.value, excluded.value), "
+            "note = excluded.note",
+            (until, str(reason)[:500]),
+        )
+
+    def paused_until(self):
+        row = self.conn.execute("SELECT value FROM crawl_state WHERE name = 'paused_until'").fetchone()
+        return row[0] if row else 0
+
+    def extend_lease(self, unit_id, worker_id, visibility_timeout=300):
+        """긴 작업 중 임대 시간을 연장하는 메서드"""
+        self.conn.execute(
+            "UPDATE work_units SET lease_expires_at = ? WHERE id = ? AND lease_owner = ?",
+            (time.time() + visibility_timeout, unit_id, worker_id),
+        )
+
+    def stats(self):
+        """상태별 작업 수를 반환하는 메서드"""
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM work_units GROUP BY status")
+        return {status: count for status, count in rows}
+
+    def iter_results(self, keyword=None, office_category=None, start_date=None, end_date=None):
+        """완료된 작업의 결과들을 순회하는 메서드 (start_date~end_date 안에 들어가는 구간의 작업만)"""
+        query = ("SELECT r.result_json FROM unit_results r JOIN work_units u ON u.id = r.unit_id "
+                 "WHERE u.status = 'done'")
+        params = []
+        if keyword is not None:
+            query += " AND u.keyword = ?"
+            params.append(keyword)
+        if office_category is not None:
+            query += " AND u.office_category = ?"
+            params.append(str(office_category))
+        if start_date is not None:
+            query += " AND u.start_date >= ?"
+            params.append(start_date)
+        if end_date is not None:
+            query += " AND u.end_date <= ?"
+            params.append(end_date)
+        query += " ORDER BY u.start_date, u.page, r.rowid"
+        for (result_json,) in self.conn.execute(query, params):
+            yield json.loads(result_json)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,29 @@
+"""wpmode - 데이터 분석을 위한 네이버 뉴스 크롤러
+
+    python -m wpmode crawl '"육아휴직"' --start 20240601 --end 20240630 --backend http
+
+백엔드(드라이버를 만드는 함수)는 이름 → "모듈:속성" 문자열로만 등록해 두고,
+선택된 백엔드의 모듈만 실제로 import 한다. selenium/webdriver_manager는
+selenium 백엔드를 고를 때에만 로드된다.
+"""
+import importlib
+
+BACKENDS = {
+    "selenium": "crawl_util:create_driver",
+    "http": "http_driver_util:HttpDriver",
+    "cdp": "cdp_capture_util:CdpCaptureDriver",
+    "playwright": "playwright_backend:PlaywrightDriver",
+}
+
+
+def register_backend(name, target):
+    """백엔드 등록 함수 (target: '모듈:드라이버 생성 함수')"""
+    BACKENDS[name] = target
+
+
+def load_backend(name):
+    """이름으로 드라이버 생성 함수를 불러오는 함수"""
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 백엔드: {name} (사용 가능: {', '.join(sorted(BACKENDS))})")
+    module_name, attr = BACKENDS[name].split(":")
+    return getattr(importlib.import_module(module_name), attr)
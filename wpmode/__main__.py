@@ -0,0 +1,234 @@
+"""python -m wpmode <명령> ...
+
+    crawl        날짜 구간 크롤링 (--backend selenium | http | cdp | playwright)
+    incremental  지난 실행 이후 새 기사만 수집 (--backend selenium | http | ...)
+    gaps         수집 범위 인덱스에서 누락/오래된 구간 계획 (작업 큐 등록 가능)
+    store        결과 CSV를 기사 저장소(SQLite)로 가져오기
+    metrics      logs/ 의 크롤링 로그에서 실행별 성능 지표 추출
+    search       기사 저장소 제목/본문 전문 검색
+    tokenize     저장소의 새 기사 제목/본문 토큰화 (Parquet 캐시)
+
+무거운 모듈은 각 명령 안에서만 import 하므로 gaps/store 같은 명령은 바로 시작된다.
+"""
+import argparse
+import sys
+import time
+
+from wpmode import BACKENDS, load_backend
+
+
+def run_crawl(args):
+    from datetime import datetime
+    from crawl_util import (
+        setup_logging, iter_news, save_results, format_duration, OFFICE_CATEGORY_NAMES,
+    )
+    from coverage_util import CoverageIndex
+    from rate_limiter_util import ImprovedRateLimiter
+    from retry_util import DeadLetterQueue
+    from logging_util import parse_sample_every
+
+    logger = setup_logging(detail=args.log_detail, sample_every=parse_sample_every(args.log_sample))
+    start_time = time.time()
+    create_driver = load_backend(args.backend)
+
+    page_cache = None
+    if args.page_cache:
+        from page_cache_util import PageCache
+        page_cache = PageCache()
+
+    # 캐시는 iter_news(crawl_search_page) 한 곳에서만 사용 (HTTP 백엔드는 만료된 페이지를 조건부 요청으로 재검증)
+    driver = create_driver()
+    rate_limiter = ImprovedRateLimiter(max_requests=args.max_requests, time_window=60, logger=logger)
+    coverage_index = CoverageIndex()
+    dead_letters = DeadLetterQueue()
+
+    try:
+        for keyword in args.keywords:
+            for office_category in args.office_category:
+                logger.info(f"🚀 {keyword} [{OFFICE_CATEGORY_NAMES.get(office_category, office_category)}] "
+                            f"{args.start} ~ {args.end} ({args.backend})")
+                completed_windows = []
+                results = list(iter_news(
+                    keyword, args.start, args.end, logger, office_category,
+                    window_days=args.window_days, driver=driver, rate_limiter=rate_limiter,
+                    page_cache=page_cache, dead_letters=dead_letters, completed_windows=completed_windows,
+                ))
+
+                now = datetime.now()
+                output_filename = (f"naver_news_{keyword}_{now.strftime('%y%m%d')}_{now.strftime('%H%M')}"
+                                   f"_({args.start}to{args.end})_{OFFICE_CATEGORY_NAMES.get(office_category, office_category)}.csv")
+                # 결과가 저장된 구간만 수집 범위 인덱스에 기록
+                if save_results(output_filename, results, logger, canonicalize_urls=args.canonicalize):
+                    coverage_index.mark_windows(keyword, office_category, completed_windows)
+    finally:
+        driver.quit()
+        coverage_index.close()
+        if page_cache:
+            page_cache.close()
+
+    logger.info(f"⌛ 총 실행 시간: {format_duration(time.time() - start_time)}")
+
+
+def run_incremental(args):
+    from crawl_util import setup_logging
+    from incremental_crawl import crawl_incremental
+
+    logger = setup_logging()
+    driver_factory = load_backend(args.backend)
+    for keyword in args.keywords:
+        for office_category in args.office_category:
+            crawl_incremental(keyword, logger, office_category, initial_days=args.initial_days,
+                              driver_factory=driver_factory)
+
+
+def run_gaps(args):
+    from coverage_util import CoverageIndex
+
+    index = CoverageIndex()
+    try:
+        units = []
+        for office_category in args.office_category:
+            units.extend(index.plan_units(args.keyword, office_category, args.start, args.end, args.window_days))
+    finally:
+        index.close()
+
+    for unit in units:
+        print(f"🧭 {unit['keyword']} [{unit['office_category']}] {unit['start_date']}~{unit['end_date']}")
+    print(f"📊 누락/오래된 구간 {len(units)}개")
+
+    if args.enqueue and units:
+        from work_queue_util import SQLiteWorkQueue
+        queue = SQLiteWorkQueue(args.enqueue)
+        print(f"📥 작업 {queue.enqueue(units)}건 등록 ({args.enqueue})")
+        queue.close()
+
+
+def run_store(args):
+    import glob
+    import os
+    from article_store_util import ArticleStore
+
+    store = ArticleStore(args.store)
+    total = 0
+    try:
+        for pattern in args.patterns:
+            for filepath in sorted(glob.glob(pattern)):
+                count = store.import_csv(filepath)
+                total += count
+                print(f"📥 {os.path.basename(filepath)}: {count}건")
+    finally:
+        store.close()
+    print(f"✅ 입력 {total}건 ({args.store})")
+
+
+def run_metrics(args):
+    import glob
+    from log_metrics_util import analyze_log, print_table
+
+    rows = []
+    for pattern in args.patterns:
+        for filepath in sorted(glob.glob(pattern)):
+            rows.extend(run.to_row() for run in analyze_log(filepath))
+    if not rows:
+        print("❌ 분석할 로그가 없습니다")
+        return
+    print_table(rows, ["log_file", "run", "duration_sec", "pages", "cards_per_page", "page_latency_p50",
+                       "page_latency_p90", "wait_share", "duplicate_rate", "articles_per_min",
+                       "card_failures", "errors"])
+
+
+def run_search(args):
+    from article_store_util import ArticleStore
+    from search_index_util import search_articles
+
+    store = ArticleStore(args.store)
+    try:
+        start_time = time.time()
+        rows = search_articles(store.conn, args.query, args.start, args.end, args.source, args.keyword, args.limit)
+        elapsed = (time.time() - start_time) * 1000
+    finally:
+        store.close()
+    for row in rows:
+        print(f"{row['published_at'] or row['published']} | {row['source']} | {row['title']} | {row['naver_url'] or row['original_url']}")
+    print(f"🔍 {len(rows)}건 ({elapsed:.1f}ms)")
+
+
+def run_tokenize(args):
+    from tokenize_util import tokenize_new_articles
+
+    start_time = time.time()
+    count = tokenize_new_articles(args.store, args.cache, args.analyzer, args.workers)
+    print(f"✅ 새로 토큰화 {count}건 ({time.time() - start_time:.1f}초)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m wpmode", description="네이버 뉴스 크롤러")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    crawl = subparsers.add_parser("crawl", help="날짜 구간 크롤링")
+    crawl.add_argument("keywords", nargs="+", help="검색 키워드 (따옴표 포함 가능)")
+    crawl.add_argument("--start", required=True)
+    crawl.add_argument("--end", required=True)
+    crawl.add_argument("--office-category", nargs="+", default=["3"])
+    crawl.add_argument("--window-days", type=int, default=7)
+    crawl.add_argument("--backend", choices=sorted(BACKENDS), default="selenium")
+    crawl.add_argument("--max-requests", type=int, default=10, help="분당 최대 요청 수")
+    crawl.add_argument("--page-cache", action="store_true", help="검색 결과 HTML 디스크 캐시 사용")
+    crawl.add_argument("--canonicalize", action="store_true", help="원본 URL 리다이렉트 정규화")
+    crawl.add_argument("--log-detail", action="store_true", help="카드별 상세 로그(DEBUG)까지 기록")
+    crawl.add_argument("--log-sample", nargs="+", metavar="LEVEL=N", help="레벨별로 N건 중 1건만 기록 (예: DEBUG=20)")
+    crawl.set_defaults(func=run_crawl)
+
+    incremental = subparsers.add_parser("incremental", help="지난 실행 이후 새 기사만 수집")
+    incremental.add_argument("keywords", nargs="+")
+    incremental.add_argument("--office-category", nargs="+", default=["3"])
+    incremental.add_argument("--initial-days", type=int, default=7)
+    incremental.add_argument("--backend", choices=sorted(BACKENDS), default="selenium")
+    incremental.set_defaults(func=run_incremental)
+
+    gaps = subparsers.add_parser("gaps", help="누락/오래된 구간 계획")
+    gaps.add_argument("keyword")
+    gaps.add_argument("--start", required=True)
+    gaps.add_argument("--end", required=True)
+    gaps.add_argument("--office-category", nargs="+", default=["3"])
+    gaps.add_argument("--window-days", type=int, default=7)
+    gaps.add_argument("--enqueue", metavar="QUEUE_PATH", help="계획한 작업을 이 작업 큐에 등록")
+    gaps.set_defaults(func=run_gaps)
+
+    store = subparsers.add_parser("store", help="결과 CSV를 기사 저장소로 가져오기")
+    store.add_argument("patterns", nargs="*", default=["results/*.csv"])
+    store.add_argument("--store", default="results/articles.sqlite")
+    store.set_defaults(func=run_store)
+
+    metrics = subparsers.add_parser("metrics", help="로그에서 실행별 성능 지표 추출")
+    metrics.add_argument("patterns", nargs="*", default=["logs/naver_crawl_*.log"])
+    metrics.set_defaults(func=run_metrics)
+
+    search = subparsers.add_parser("search", help="기사 저장소 전문 검색")
+    search.add_argument("query")
+    search.add_argument("--store", default="results/articles.sqlite")
+    search.add_argument("--start", help="발행일 시작 (YYYYMMDD)")
+    search.add_argument("--end", help="발행일 끝 (YYYYMMDD)")
+    search.add_argument("--source")
+    search.add_argument("--keyword")
+    search.add_argument("--limit", type=int, default=50)
+    search.set_defaults(func=run_search)
+
+    tokenize = subparsers.add_parser("tokenize", help="새 기사 제목/본문 토큰화")
+    tokenize.add_argument("--store", default="results/articles.sqlite")
+    tokenize.add_argument("--cache", default="cache/tokens")
+    tokenize.add_argument("--analyzer", choices=["regex", "kiwi"], default="regex")
+    tokenize.add_argument("--workers", type=int, default=None, help="프로세스 수 (0이면 현재 프로세스에서)")
+    tokenize.set_defaults(func=run_tokenize)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())